@@ -1,9 +1,36 @@
 """Typed Pydantic models for Airbyte connectors."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from airbyte_connector_models.connectors._internal.base_record import BaseRecordModel
 
+if TYPE_CHECKING:
+    from airbyte_connector_models.connectors._internal.registry import (
+        get_config_model,
+        get_record_model,
+        list_connectors,
+        list_streams,
+    )
+
 __version__ = "0.1.0"
 
 __all__ = [
     "BaseRecordModel",
+    "get_config_model",
+    "get_record_model",
+    "list_connectors",
+    "list_streams",
 ]
+
+_REGISTRY_FUNCTIONS = {"get_config_model", "get_record_model", "list_connectors", "list_streams"}
+
+
+def __getattr__(name: str) -> object:
+    """Load the connector model registry on first use (PEP 562)."""
+    if name in _REGISTRY_FUNCTIONS:
+        from airbyte_connector_models.connectors._internal import registry  # noqa: PLC0415
+
+        return getattr(registry, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
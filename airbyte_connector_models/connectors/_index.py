@@ -0,0 +1,96 @@
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+
+"""Static index of generated connector models.
+
+Generated by `python -m src.generate.main --index`; do not edit by hand.
+"""
+
+# Connector name -> (module, config model class)
+CONFIG_MODELS: dict[str, tuple[str, str]] = {
+    "source-airbyte": (
+        "airbyte_connector_models.connectors.airbyte.source.configuration",
+        "SourceAirbyteConfigSpec",
+    ),
+    "source-dockerhub": (
+        "airbyte_connector_models.connectors.dockerhub.source.configuration",
+        "SourceDockerhubConfigSpec",
+    ),
+    "destination-duckdb": (
+        "airbyte_connector_models.connectors.duckdb.destination.configuration",
+        "DestinationDuckdbConfigSpec",
+    ),
+    "source-faker": (
+        "airbyte_connector_models.connectors.faker.source.configuration",
+        "SourceFakerConfigSpec",
+    ),
+    "source-github": (
+        "airbyte_connector_models.connectors.github.source.configuration",
+        "SourceGithubConfigSpec",
+    ),
+    "destination-mysql": (
+        "airbyte_connector_models.connectors.mysql.destination.configuration",
+        "DestinationMysqlConfigSpec",
+    ),
+    "source-n8n": (
+        "airbyte_connector_models.connectors.n8n.source.configuration",
+        "SourceN8nConfigSpec",
+    ),
+    "source-pokeapi": (
+        "airbyte_connector_models.connectors.pokeapi.source.configuration",
+        "SourcePokeapiConfigSpec",
+    ),
+    "destination-postgres": (
+        "airbyte_connector_models.connectors.postgres.destination.configuration",
+        "DestinationPostgresConfigSpec",
+    ),
+    "source-postgres": (
+        "airbyte_connector_models.connectors.postgres.source.configuration",
+        "SourcePostgresConfigSpec",
+    ),
+    "source-xkcd": (
+        "airbyte_connector_models.connectors.xkcd.source.configuration",
+        "SourceXkcdConfigSpec",
+    ),
+}
+
+# Connector name -> stream name -> (module, record model class)
+RECORD_MODELS: dict[str, dict[str, tuple[str, str]]] = {
+    "source-airbyte": {
+        "Connections": (
+            "airbyte_connector_models.connectors.airbyte.source.records.connections",
+            "AirbyteConnectionsRecord",
+        ),
+        "Jobs": (
+            "airbyte_connector_models.connectors.airbyte.source.records.jobs",
+            "AirbyteJobsRecord",
+        ),
+        "Workspaces": (
+            "airbyte_connector_models.connectors.airbyte.source.records.workspaces",
+            "AirbyteWorkspacesRecord",
+        ),
+    },
+    "source-dockerhub": {
+        "docker_hub": (
+            "airbyte_connector_models.connectors.dockerhub.source.records.docker_hub",
+            "DockerhubDockerHubRecord",
+        ),
+    },
+    "source-n8n": {
+        "executions": (
+            "airbyte_connector_models.connectors.n8n.source.records.executions",
+            "N8nExecutionsRecord",
+        ),
+    },
+    "source-pokeapi": {
+        "pokemon": (
+            "airbyte_connector_models.connectors.pokeapi.source.records.pokemon",
+            "PokeapiPokemonRecord",
+        ),
+    },
+    "source-xkcd": {
+        "xkcd": (
+            "airbyte_connector_models.connectors.xkcd.source.records.xkcd",
+            "XkcdXkcdRecord",
+        ),
+    },
+}
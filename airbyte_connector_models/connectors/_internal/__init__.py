@@ -1,15 +1,79 @@
-"""Internal utilities for airbyte-connector-models."""
+"""Internal utilities for airbyte-connector-models.
+
+Every generated model imports this package, so only `BaseRecordModel` is imported
+eagerly. The other utilities are loaded on first access (PEP 562), which keeps heavy
+modules such as `asyncio` and `multiprocessing` out of a plain model import.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING
 
-from airbyte_connector_models.connectors._internal.base_config import BaseConfig
 from airbyte_connector_models.connectors._internal.base_record import BaseRecordModel
-from airbyte_connector_models.connectors._internal.normalizer import (
-    needs_normalization,
-    normalize_field_name,
-)
+
+if TYPE_CHECKING:
+    from airbyte_connector_models.connectors._internal.aio import async_validate_stream
+    from airbyte_connector_models.connectors._internal.base_config import BaseConfig
+    from airbyte_connector_models.connectors._internal.jsonl import iter_jsonl
+    from airbyte_connector_models.connectors._internal.normalizer import (
+        needs_normalization,
+        normalize_field_name,
+    )
+    from airbyte_connector_models.connectors._internal.parallel import validate_parallel
+    from airbyte_connector_models.connectors._internal.record_view import RecordView
+    from airbyte_connector_models.connectors._internal.schema_cache import (
+        load_schemas,
+        save_schemas,
+    )
+    from airbyte_connector_models.connectors._internal.schema_validator import compile_validator
+    from airbyte_connector_models.connectors._internal.stats import (
+        ModelStats,
+        collect_stats,
+        stats_snapshot,
+    )
+    from airbyte_connector_models.connectors._internal.warmup import warm_up
 
 __all__ = [
     "BaseConfig",
     "BaseRecordModel",
+    "ModelStats",
+    "RecordView",
+    "async_validate_stream",
+    "collect_stats",
+    "compile_validator",
+    "iter_jsonl",
+    "load_schemas",
     "needs_normalization",
     "normalize_field_name",
+    "save_schemas",
+    "stats_snapshot",
+    "validate_parallel",
+    "warm_up",
 ]
+
+# Submodule defining each lazily loaded name.
+_LAZY_NAMES = {
+    "BaseConfig": "base_config",
+    "ModelStats": "stats",
+    "RecordView": "record_view",
+    "async_validate_stream": "aio",
+    "collect_stats": "stats",
+    "compile_validator": "schema_validator",
+    "iter_jsonl": "jsonl",
+    "load_schemas": "schema_cache",
+    "needs_normalization": "normalizer",
+    "normalize_field_name": "normalizer",
+    "save_schemas": "schema_cache",
+    "stats_snapshot": "stats",
+    "validate_parallel": "parallel",
+    "warm_up": "warmup",
+}
+
+
+def __getattr__(name: str) -> object:
+    """Import the submodule defining a utility on first use (PEP 562)."""
+    if name in _LAZY_NAMES:
+        module = import_module(f"{__name__}.{_LAZY_NAMES[name]}")
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
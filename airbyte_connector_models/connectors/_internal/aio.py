@@ -0,0 +1,97 @@
+"""Batched record validation for asyncio-based extract loops."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator
+from concurrent.futures import Executor
+from contextlib import suppress
+from typing import Any
+
+from pydantic import ValidationError
+
+from airbyte_connector_models.connectors._internal.base_record import BaseRecordModel
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+def _validate_batch(model: type[BaseRecordModel], batch: list[Any]) -> list[BaseRecordModel]:
+    """Validate a batch of decoded records or raw JSON documents.
+
+    A batch of dicts is validated in one `validate_many` call. Raw JSON documents are
+    validated one by one, as are the records of a batch that failed, so that the
+    error raised is the one of the first invalid record.
+    """
+    if all(isinstance(record, dict) for record in batch):
+        with suppress(ValidationError):
+            return model.validate_many(batch)
+    return [
+        model.model_validate_json(record)
+        if isinstance(record, (str, bytes, bytearray))
+        else model.model_validate(record)
+        for record in batch
+    ]
+
+
+async def async_validate_stream(
+    records: AsyncIterable[Any],
+    model: type[BaseRecordModel],
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    executor: Executor | None = None,
+    max_pending: int = 2,
+) -> AsyncIterator[list[BaseRecordModel]]:
+    """Validate records from an async iterator in batches, off the event loop.
+
+    Records are accumulated into batches of `batch_size` and each batch is validated
+    in `executor` while the next one is collected. At most `max_pending` batches are
+    in flight; once the limit is reached, no further records are pulled from `records`
+    until the consumer takes the oldest batch, so a slow consumer throttles the source.
+
+    Validation holds the GIL, so the default thread pool keeps the event loop
+    responsive but does not add throughput; pass a `ProcessPoolExecutor` to validate
+    on other cores (the model must then be importable from its module).
+
+    Example:
+        async for batch in async_validate_stream(fetch_pages(), PokeapiPokemonRecord):
+            await sink.write(batch)
+
+    Args:
+        records: Async iterable of record dicts or raw JSON documents (str or bytes)
+        model: The record model class to validate against
+        batch_size: Number of records per validated batch
+        executor: Executor to validate in (defaults to the loop's default executor)
+        max_pending: Maximum number of batches being validated or awaiting the consumer
+
+    Yields:
+        Lists of validated records, in input order
+
+    Raises:
+        ValueError: If `batch_size` or `max_pending` is not positive
+        ValidationError: If a record fails validation
+    """
+    if batch_size <= 0:
+        raise ValueError(f"batch_size must be positive, got {batch_size}")
+    if max_pending <= 0:
+        raise ValueError(f"max_pending must be positive, got {max_pending}")
+
+    loop = asyncio.get_running_loop()
+    pending: deque[asyncio.Future[list[BaseRecordModel]]] = deque()
+    batch: list[Any] = []
+    try:
+        async for record in records:
+            batch.append(record)
+            if len(batch) < batch_size:
+                continue
+            pending.append(loop.run_in_executor(executor, _validate_batch, model, batch))
+            batch = []
+            if len(pending) >= max_pending:
+                yield await pending.popleft()
+        if batch:
+            pending.append(loop.run_in_executor(executor, _validate_batch, model, batch))
+        while pending:
+            yield await pending.popleft()
+    finally:
+        for future in pending:
+            future.cancel()
@@ -0,0 +1,683 @@
+"""Columnar (Apache Arrow) export and validation for generated record models.
+
+Requires the optional `pyarrow` dependency (`pip install airbyte-connector-models[arrow]`).
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import enum
+import types
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Iterator
+from functools import cache
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Annotated,
+    Any,
+    BinaryIO,
+    Literal,
+    NamedTuple,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic_core import to_json
+
+from airbyte_connector_models.connectors._internal.base_record import BaseRecordModel
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+
+def import_pyarrow() -> types.ModuleType:
+    """Import pyarrow, raising a helpful error if the optional dependency is missing.
+
+    Returns:
+        The `pyarrow` module
+
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    try:
+        import pyarrow as pa  # noqa: PLC0415
+    except ImportError as e:
+        raise ImportError(
+            "Arrow support requires pyarrow. "
+            "Install it with: pip install 'airbyte-connector-models[arrow]'"
+        ) from e
+    return pa
+
+
+class _Column(ABC):
+    """Conversion plan from a list of Python values to one Arrow array."""
+
+    arrow_type: pa.DataType
+
+    @abstractmethod
+    def build(self, values: list[Any]) -> pa.Array:
+        """Build an Arrow array from values, where None becomes null."""
+
+
+class _ScalarColumn(_Column):
+    """Column of values pyarrow converts natively (strings, numbers, timestamps, ...)."""
+
+    def __init__(self, arrow_type: pa.DataType) -> None:
+        self.arrow_type = arrow_type
+
+    def build(self, values: list[Any]) -> pa.Array:
+        pa = import_pyarrow()
+        return pa.array(values, type=self.arrow_type)
+
+
+class _JsonColumn(_Column):
+    """Column of values without a static Arrow type, stored as JSON text."""
+
+    def __init__(self) -> None:
+        self.arrow_type = import_pyarrow().string()
+
+    def build(self, values: list[Any]) -> pa.Array:
+        pa = import_pyarrow()
+        return pa.array(
+            [None if value is None else to_json(value).decode() for value in values],
+            type=self.arrow_type,
+        )
+
+
+class _ListColumn(_Column):
+    """Column of arrays, built from one flattened child array plus offsets."""
+
+    def __init__(self, item: _Column) -> None:
+        self.item = item
+        self.arrow_type = import_pyarrow().list_(item.arrow_type)
+
+    def build(self, values: list[Any]) -> pa.Array:
+        pa = import_pyarrow()
+        offsets = [0]
+        mask = []
+        flat: list[Any] = []
+        for value in values:
+            if value is None:
+                mask.append(True)
+            else:
+                mask.append(False)
+                flat.extend(value)
+            offsets.append(len(flat))
+        return pa.ListArray.from_arrays(
+            pa.array(offsets, type=pa.int32()),
+            self.item.build(flat),
+            type=self.arrow_type,
+            mask=pa.array(mask, type=pa.bool_()),
+        )
+
+
+class _StructColumn(_Column):
+    """Column of nested sub-models, built as one child array per declared field."""
+
+    def __init__(self, fields: dict[str, tuple[_Column, bool]]) -> None:
+        pa = import_pyarrow()
+        self.columns = {name: column for name, (column, _) in fields.items()}
+        self.fields = [
+            pa.field(name, column.arrow_type, nullable=nullable)
+            for name, (column, nullable) in fields.items()
+        ]
+        self.arrow_type = pa.struct(self.fields)
+
+    def build(self, values: list[Any]) -> pa.Array:
+        pa = import_pyarrow()
+        mask = [value is None for value in values]
+        children = [
+            column.build([None if value is None else getattr(value, name) for value in values])
+            for name, column in self.columns.items()
+        ]
+        return pa.StructArray.from_arrays(
+            children,
+            fields=self.fields,
+            mask=pa.array(mask, type=pa.bool_()),
+        )
+
+
+def _scalar_types() -> dict[Any, Callable[[], pa.DataType]]:
+    """Return the mapping of Python scalar types to Arrow type factories."""
+    pa = import_pyarrow()
+    return {
+        str: pa.string,
+        int: pa.int64,
+        float: pa.float64,
+        bool: pa.bool_,
+        bytes: pa.binary,
+        dt.datetime: lambda: pa.timestamp("us", tz="UTC"),
+        dt.date: pa.date32,
+        dt.time: lambda: pa.time64("us"),
+    }
+
+
+def _column_for(annotation: Any, seen: tuple[type, ...]) -> tuple[_Column, bool]:
+    """Plan the Arrow column for a field annotation.
+
+    Args:
+        annotation: A resolved field annotation
+        seen: Record models on the current path, used to stop at recursive schemas
+
+    Returns:
+        The column plan and whether the annotation admits None
+    """
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return _column_for(get_args(annotation)[0], seen)
+    if origin is Union or origin is types.UnionType:
+        return _union_column(get_args(annotation), seen)
+    if origin is list:
+        (item,) = get_args(annotation) or (Any,)
+        return _ListColumn(_column_for(item, seen)[0]), False
+    return _leaf_column(annotation, seen)
+
+
+def _union_column(members: tuple[Any, ...], seen: tuple[type, ...]) -> tuple[_Column, bool]:
+    """Plan the column for a union; only `X | None` keeps the type of `X`."""
+    non_null = [member for member in members if member is not type(None)]
+    nullable = len(non_null) != len(members)
+    if len(non_null) == 1:
+        column, member_nullable = _column_for(non_null[0], seen)
+        return column, nullable or member_nullable
+    return _JsonColumn(), True
+
+
+def _leaf_column(annotation: Any, seen: tuple[type, ...]) -> tuple[_Column, bool]:
+    """Plan the column for a record model or a scalar annotation."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseRecordModel):
+        if annotation in seen:
+            return _JsonColumn(), True
+        return _struct_for(annotation, (*seen, annotation)), False
+
+    if get_origin(annotation) is Literal or (
+        isinstance(annotation, type) and issubclass(annotation, enum.Enum)
+    ):
+        return _ScalarColumn(import_pyarrow().string()), False
+
+    arrow_type = _scalar_types().get(annotation)
+    if arrow_type is not None:
+        return _ScalarColumn(arrow_type()), False
+    return _JsonColumn(), True
+
+
+def _struct_for(model: type[BaseRecordModel], seen: tuple[type, ...]) -> _StructColumn:
+    """Plan a struct column with one child per declared field of a record model."""
+    if not model.__pydantic_complete__:
+        model.model_rebuild()
+
+    fields = {}
+    for name, field in model.model_fields.items():
+        column, nullable = _column_for(field.annotation, seen)
+        fields[name] = (column, nullable or not field.is_required())
+    return _StructColumn(fields)
+
+
+@cache
+def _record_plan(model: type[BaseRecordModel]) -> _StructColumn:
+    """Return the cached column plan for the top level of a record model."""
+    return _struct_for(model, (model,))
+
+
+def arrow_schema(
+    model: type[BaseRecordModel],
+    *,
+    extras_column: str | None = None,
+) -> pa.Schema:
+    """Derive the Arrow schema for a record model from its declared fields.
+
+    Nested sub-models become struct columns and arrays become list columns. Fields
+    that are not nullable and required in the JSON schema are non-nullable in Arrow.
+    Values without a static type (`Any`, multi-type unions, recursive models) are
+    stored as JSON text.
+
+    Args:
+        model: The record model class
+        extras_column: Name of an extra string column holding the JSON-encoded extra
+            properties of each record, or None to drop extra properties
+
+    Returns:
+        The Arrow schema of batches built for `model`
+    """
+    pa = import_pyarrow()
+    fields = list(_record_plan(model).fields)
+    if extras_column is not None:
+        fields.append(pa.field(extras_column, pa.string()))
+    return pa.schema(fields)
+
+
+class RecordBatchBuilder:
+    """Accumulates validated records of one model and builds Arrow record batches.
+
+    Records are converted column by column straight from their attributes, without
+    building an intermediate dictionary per row.
+
+    Example:
+        builder = RecordBatchBuilder(PokeapiPokemonRecord)
+        for record in records:
+            builder.append(record)
+            if len(builder) >= 10_000:
+                writer.write_batch(builder.flush())
+    """
+
+    def __init__(
+        self,
+        model: type[BaseRecordModel],
+        *,
+        extras_column: str | None = None,
+    ) -> None:
+        """Create a builder for a record model.
+
+        Args:
+            model: The record model class of the records that will be appended
+            extras_column: Name of an extra string column holding the JSON-encoded
+                extra properties of each record, or None to drop extra properties
+        """
+        self.model = model
+        self.extras_column = extras_column
+        self.schema = arrow_schema(model, extras_column=extras_column)
+        self._plan = _record_plan(model)
+        self._records: list[BaseRecordModel] = []
+
+    def __len__(self) -> int:
+        """Return the number of records appended since the last flush."""
+        return len(self._records)
+
+    def append(self, record: BaseRecordModel) -> None:
+        """Append one record to the pending batch.
+
+        Args:
+            record: A validated instance of the builder's model
+        """
+        self._records.append(record)
+
+    def extend(self, records: Iterable[BaseRecordModel]) -> None:
+        """Append several records to the pending batch.
+
+        Args:
+            records: Validated instances of the builder's model
+        """
+        self._records.extend(records)
+
+    def build(self) -> pa.RecordBatch:
+        """Build a record batch from the pending records, keeping them pending.
+
+        Returns:
+            An Arrow record batch with the builder's schema
+        """
+        pa = import_pyarrow()
+        records = self._records
+        columns = [
+            column.build([getattr(record, name) for record in records])
+            for name, column in self._plan.columns.items()
+        ]
+        if self.extras_column is not None:
+            columns.append(
+                pa.array(
+                    [
+                        to_json(extra).decode() if (extra := record.__pydantic_extra__) else None
+                        for record in records
+                    ],
+                    type=pa.string(),
+                )
+            )
+        return pa.RecordBatch.from_arrays(columns, schema=self.schema)
+
+    def flush(self) -> pa.RecordBatch:
+        """Build a record batch from the pending records and clear them.
+
+        Returns:
+            An Arrow record batch with the builder's schema
+        """
+        batch = self.build()
+        self._records = []
+        return batch
+
+
+def to_arrow(
+    records: Iterable[BaseRecordModel],
+    model: type[BaseRecordModel],
+    *,
+    extras_column: str | None = None,
+) -> pa.RecordBatch:
+    """Convert validated records of one model into an Arrow record batch.
+
+    Args:
+        records: Validated instances of `model`
+        model: The record model class
+        extras_column: Name of an extra string column holding the JSON-encoded extra
+            properties of each record, or None to drop extra properties
+
+    Returns:
+        An Arrow record batch with the schema from `arrow_schema`
+    """
+    builder = RecordBatchBuilder(model, extras_column=extras_column)
+    builder.extend(records)
+    return builder.build()
+
+
+class ColumnError(NamedTuple):
+    """Rows of a batch failing one check on one (possibly nested) column."""
+
+    path: str
+    """Dotted path of the column, e.g. `species.name` or `abilities[].ability`."""
+
+    error_type: str
+    """`missing` (required column absent), `null` (null in a non-nullable field) or
+    `type` (value of an incompatible Arrow type)."""
+
+    mask: pa.BooleanArray
+    """Row mask, true for every failing row."""
+
+    @property
+    def count(self) -> int:
+        """Number of failing rows."""
+        return self.mask.true_count
+
+
+class ArrowValidationResult:
+    """Outcome of validating Arrow data against a record model, column by column.
+
+    Row-level objects are only materialized for failing rows, via `failures()`.
+    """
+
+    def __init__(
+        self,
+        data: pa.Table | pa.RecordBatch,
+        errors: list[ColumnError],
+        offset: int = 0,
+    ) -> None:
+        """Create a validation result.
+
+        Args:
+            data: The validated table or record batch
+            errors: Failing rows per column and check
+            offset: Index of the first row of `data` within its source
+        """
+        pa = import_pyarrow()
+        pc = import_pyarrow_compute()
+        self.data = data
+        self.errors = errors
+        self.offset = offset
+        invalid = pa.repeat(False, data.num_rows)
+        for error in errors:
+            invalid = pc.or_(invalid, error.mask)
+        self.invalid_mask: pa.BooleanArray = invalid
+
+    @property
+    def num_rows(self) -> int:
+        """Number of validated rows."""
+        return self.data.num_rows
+
+    @property
+    def num_invalid(self) -> int:
+        """Number of rows failing at least one check."""
+        return self.invalid_mask.true_count
+
+    @property
+    def is_valid(self) -> bool:
+        """Whether every row passed validation."""
+        return not self.num_invalid
+
+    def error_counts(self) -> dict[tuple[str, str], int]:
+        """Count failing rows per column path and error type.
+
+        Returns:
+            Mapping of (path, error_type) to the number of failing rows
+        """
+        return {(error.path, error.error_type): error.count for error in self.errors}
+
+    def valid_rows(self) -> pa.Table | pa.RecordBatch:
+        """Return the rows that passed validation."""
+        return self.data.filter(import_pyarrow_compute().invert(self.invalid_mask))
+
+    def failures(self) -> Iterator[tuple[int, dict[str, Any]]]:
+        """Iterate over the failing rows.
+
+        Yields:
+            Tuples of (row index within the source, row as a dictionary)
+        """
+        pc = import_pyarrow_compute()
+        indices = pc.indices_nonzero(self.invalid_mask).to_pylist()
+        rows = self.data.filter(self.invalid_mask).to_pylist()
+        for index, row in zip(indices, rows, strict=True):
+            yield self.offset + index, row
+
+
+def import_pyarrow_compute() -> types.ModuleType:
+    """Import `pyarrow.compute`, raising a helpful error if pyarrow is missing.
+
+    Returns:
+        The `pyarrow.compute` module
+    """
+    import_pyarrow()
+    import pyarrow.compute as pc  # noqa: PLC0415
+
+    return pc
+
+
+def _type_matches(column: _Column, arrow_type: pa.DataType) -> bool:
+    """Check whether Arrow data of `arrow_type` can hold values of a planned column.
+
+    Integer and floating widths are not enforced, integers are accepted for floats
+    (JSON numbers) and all-null columns match any type.
+    """
+    pa = import_pyarrow()
+    is_ = pa.types
+    if isinstance(column, _JsonColumn) or is_.is_null(arrow_type):
+        return True
+    if isinstance(column, _StructColumn):
+        return is_.is_struct(arrow_type)
+    if isinstance(column, _ListColumn):
+        return (is_.is_list(arrow_type) or is_.is_large_list(arrow_type)) and _type_matches(
+            column.item, arrow_type.value_type
+        )
+
+    expected = column.arrow_type
+    checks: list[Callable[[pa.DataType], bool]] = [
+        check
+        for family, check in (
+            (is_.is_string, lambda t: is_.is_string(t) or is_.is_large_string(t)),
+            (is_.is_integer, is_.is_integer),
+            (is_.is_floating, lambda t: is_.is_floating(t) or is_.is_integer(t)),
+            (is_.is_boolean, is_.is_boolean),
+            (is_.is_timestamp, is_.is_timestamp),
+            (is_.is_date, is_.is_date),
+            (is_.is_time, is_.is_time),
+            (is_.is_binary, lambda t: is_.is_binary(t) or is_.is_large_binary(t)),
+        )
+        if family(expected)
+    ]
+    return arrow_type == expected or any(check(arrow_type) for check in checks)
+
+
+def _check_column(
+    column: _Column,
+    array: pa.Array,
+    *,
+    nullable: bool,
+    parent_valid: pa.BooleanArray,
+    path: str,
+    errors: list[ColumnError],
+) -> None:
+    """Append the failing rows of one column (and its nested children) to `errors`.
+
+    Args:
+        column: The planned column the array should match
+        array: The array to validate, aligned with the rows of the batch
+        nullable: Whether nulls are allowed where the parent value is present
+        parent_valid: Mask of rows where every enclosing struct is non-null
+        path: Dotted path of the column, for error reporting
+        errors: List the failing rows are appended to
+    """
+    pc = import_pyarrow_compute()
+    if not nullable and array.null_count:
+        mask = pc.and_(pc.is_null(array), parent_valid)
+        if mask.true_count:
+            errors.append(ColumnError(path, "null", mask))
+
+    if not _type_matches(column, array.type):
+        mask = pc.and_(pc.is_valid(array), parent_valid)
+        if mask.true_count:
+            errors.append(ColumnError(path, "type", mask))
+        return
+
+    if isinstance(column, _StructColumn) and not import_pyarrow().types.is_null(array.type):
+        _check_struct(column, array, parent_valid=parent_valid, path=path, errors=errors)
+    elif isinstance(column, _ListColumn) and isinstance(column.item, _StructColumn | _ListColumn):
+        _check_list_items(column, array, path=path, errors=errors)
+
+
+def _check_struct(
+    column: _StructColumn,
+    array: pa.Array,
+    *,
+    parent_valid: pa.BooleanArray,
+    path: str,
+    errors: list[ColumnError],
+) -> None:
+    """Check the children of a struct column where the struct itself is non-null."""
+    pc = import_pyarrow_compute()
+    present = {field.name for field in array.type}
+    valid = pc.and_(pc.is_valid(array), parent_valid)
+    for field in column.fields:
+        child_path = f"{path}.{field.name}" if path else field.name
+        if field.name in present:
+            _check_column(
+                column.columns[field.name],
+                pc.struct_field(array, field.name),
+                nullable=field.nullable,
+                parent_valid=valid,
+                path=child_path,
+                errors=errors,
+            )
+        elif not field.nullable and valid.true_count:
+            errors.append(ColumnError(child_path, "missing", valid))
+
+
+def _check_list_items(
+    column: _ListColumn,
+    array: pa.Array,
+    *,
+    path: str,
+    errors: list[ColumnError],
+) -> None:
+    """Check nested items of a list column, reporting failures on the owning rows."""
+    pa = import_pyarrow()
+    pc = import_pyarrow_compute()
+    items = pc.list_flatten(array)
+    item_errors: list[ColumnError] = []
+    _check_column(
+        column.item,
+        items,
+        nullable=True,
+        parent_valid=pa.repeat(True, len(items)),
+        path=f"{path}[]",
+        errors=item_errors,
+    )
+    if not item_errors:
+        return
+
+    parents = pc.list_parent_indices(array)
+    rows = pc.subtract(pc.cumulative_sum(pa.repeat(1, len(array))), 1)
+    for error in item_errors:
+        failing_rows = pc.filter(parents, error.mask)
+        mask = pc.is_in(rows, value_set=failing_rows)
+        errors.append(ColumnError(error.path, error.error_type, mask))
+
+
+def _validate_batch(batch: pa.RecordBatch, model: type[BaseRecordModel]) -> list[ColumnError]:
+    """Validate one record batch against a record model."""
+    pa = import_pyarrow()
+    plan = _record_plan(model)
+    names = set(batch.schema.names)
+    all_rows = pa.repeat(True, batch.num_rows)
+    errors: list[ColumnError] = []
+    for field in plan.fields:
+        if field.name in names:
+            _check_column(
+                plan.columns[field.name],
+                batch.column(field.name),
+                nullable=field.nullable,
+                parent_valid=all_rows,
+                path=field.name,
+                errors=errors,
+            )
+        elif not field.nullable and batch.num_rows:
+            errors.append(ColumnError(field.name, "missing", all_rows))
+    return errors
+
+
+def _merge_errors(
+    batches: list[tuple[pa.RecordBatch, list[ColumnError]]],
+) -> list[ColumnError]:
+    """Concatenate per-batch errors into errors spanning all batches."""
+    pa = import_pyarrow()
+    keys = list(dict.fromkeys((e.path, e.error_type) for _, errs in batches for e in errs))
+    merged = []
+    for path, error_type in keys:
+        masks = []
+        for batch, errs in batches:
+            mask = next(
+                (e.mask for e in errs if (e.path, e.error_type) == (path, error_type)),
+                None,
+            )
+            masks.append(pa.repeat(False, batch.num_rows) if mask is None else mask)
+        merged.append(ColumnError(path, error_type, pa.concat_arrays(masks)))
+    return merged
+
+
+def validate_arrow(
+    data: pa.Table | pa.RecordBatch,
+    model: type[BaseRecordModel],
+) -> ArrowValidationResult:
+    """Validate Arrow data against a record model without building per-row objects.
+
+    Each column is checked with vectorized Arrow compute kernels: required columns must
+    be present, non-nullable fields (from the schema's `required` list and non-null
+    types) must not contain nulls, and column types must be compatible with the field
+    annotations. Nested struct and list columns are checked recursively. Columns not
+    declared on the model are accepted as extra properties.
+
+    Args:
+        data: Arrow table or record batch, e.g. as produced by `to_arrow`
+        model: The record model class
+
+    Returns:
+        The validation result, with masks of failing rows per column
+    """
+    if isinstance(data, import_pyarrow().RecordBatch):
+        return ArrowValidationResult(data, _validate_batch(data, model))
+
+    batches = [(batch, _validate_batch(batch, model)) for batch in data.to_batches()]
+    return ArrowValidationResult(data, _merge_errors(batches))
+
+
+def validate_parquet(
+    source: str | Path | BinaryIO,
+    model: type[BaseRecordModel],
+    *,
+    batch_size: int = 65_536,
+) -> Iterator[ArrowValidationResult]:
+    """Validate a Parquet file against a record model, one record batch at a time.
+
+    Memory use is bounded by the batch size. Each result's `offset` gives the index
+    of its first row within the file, so failures can be located across batches.
+
+    Args:
+        source: Path or binary file-like object of the Parquet file
+        model: The record model class
+        batch_size: Maximum number of rows per validated batch
+
+    Yields:
+        One validation result per record batch, in file order
+    """
+    import_pyarrow()
+    import pyarrow.parquet as pq  # noqa: PLC0415
+
+    offset = 0
+    for batch in pq.ParquetFile(source).iter_batches(batch_size=batch_size):
+        yield ArrowValidationResult(batch, _validate_batch(batch, model), offset)
+        offset += batch.num_rows
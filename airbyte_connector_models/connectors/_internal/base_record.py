@@ -2,9 +2,37 @@
 
 from __future__ import annotations
 
-from typing import Any
+import types
+from collections.abc import Callable, ItemsView, Iterable, Iterator, KeysView, ValuesView
+from functools import cache
+from typing import TYPE_CHECKING, Any, Union, get_args, get_origin
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+from pydantic.fields import FieldInfo
+
+if TYPE_CHECKING:
+    from airbyte_connector_models.connectors._internal.report import ValidationReport
+
+
+@cache
+def _list_adapter(model: type[BaseRecordModel]) -> TypeAdapter[list[Any]]:
+    """Return the cached list adapter used for batch validation of a record model.
+
+    Args:
+        model: The record model class
+
+    Returns:
+        A TypeAdapter validating a list of `model` instances
+    """
+    return TypeAdapter(list[model])
+
+
+class _MissingAttributeError(AttributeError):
+    """AttributeError for a missing record attribute, formatted only when displayed."""
+
+    def __str__(self) -> str:
+        name, model = self.args
+        return f"'{model.__name__}' has no attribute '{name}'"
 
 
 class BaseRecordModel(BaseModel):
@@ -28,6 +56,13 @@ class BaseRecordModel(BaseModel):
         This allows accessing additional properties that aren't defined in the schema
         using attribute syntax: record.custom_field
 
+        Declared fields live in the instance `__dict__` and never reach this method,
+        so it only runs for extras and misses. The `__pydantic_extra__` slot is read
+        with a plain attribute load; the name guard stops recursion when the slot has
+        not been set yet (e.g. during unpickling). Misses are common (`hasattr`,
+        `getattr` with a default), so their error message is only formatted when the
+        error is displayed.
+
         Args:
             name: The attribute name to access
 
@@ -37,10 +72,11 @@ class BaseRecordModel(BaseModel):
         Raises:
             AttributeError: If the attribute doesn't exist in fields or extras
         """
-        extra = object.__getattribute__(self, "__pydantic_extra__")
-        if extra and name in extra:
-            return extra[name]
-        raise AttributeError(f"'{type(self).__name__}' has no attribute '{name}'")
+        if name != "__pydantic_extra__":
+            extra = self.__pydantic_extra__
+            if extra and name in extra:
+                return extra[name]
+        raise _MissingAttributeError(name, type(self))
 
     def __getitem__(self, key: str) -> Any:
         """Dict-like access to fields and extras.
@@ -98,39 +134,29 @@ class BaseRecordModel(BaseModel):
         extra = self.__pydantic_extra__
         return bool(extra and key in extra)
 
-    def keys(self) -> list[str]:
+    def keys(self) -> RecordKeysView:
         """Get all field and extra property names.
 
         Returns:
-            List of all field and extra property names
+            A live view over field names followed by extra property names
         """
-        base = list(type(self).model_fields.keys())
-        extra = list((self.__pydantic_extra__ or {}).keys())
-        return base + extra
+        return RecordKeysView(self)
 
-    def items(self) -> list[tuple[str, Any]]:
+    def items(self) -> RecordItemsView:
         """Get all field and extra property items as (key, value) tuples.
 
         Returns:
-            List of (key, value) tuples for all fields and extras
+            A live view over (key, value) tuples for all fields and extras
         """
-        result = [(k, getattr(self, k)) for k in type(self).model_fields]
-        extra = self.__pydantic_extra__
-        if extra:
-            result.extend(extra.items())
-        return result
+        return RecordItemsView(self)
 
-    def values(self) -> list[Any]:
+    def values(self) -> RecordValuesView:
         """Get all field and extra property values.
 
         Returns:
-            List of all field and extra property values
+            A live view over all field and extra property values
         """
-        result = [getattr(self, k) for k in type(self).model_fields]
-        extra = self.__pydantic_extra__
-        if extra:
-            result.extend(extra.values())
-        return result
+        return RecordValuesView(self)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert the model to a dictionary.
@@ -152,6 +178,84 @@ class BaseRecordModel(BaseModel):
         """
         return cls.model_validate(data)
 
+    @classmethod
+    def from_dict_lazy(cls, data: dict[str, Any]) -> BaseRecordModel:
+        """Create a model instance that validates nested sub-models on first access.
+
+        Fields without nested record models are validated immediately. Fields holding
+        nested objects or arrays of them are stored raw and validated (and cached) the
+        first time they are read, so consumers touching only a few top-level fields
+        skip the cost of validating the rest of the tree. Validation errors in a
+        nested field are raised when that field is accessed, and dumping a record
+        emits unaccessed nested fields exactly as they were given.
+
+        The returned object is an instance of a cached subclass of this model. It can
+        be pickled, but never compares equal to an eager instance (see `lazy_model`).
+
+        Args:
+            data: Dictionary containing model data
+
+        Returns:
+            New lazily-validated instance of the model
+        """
+        from airbyte_connector_models.connectors._internal.lazy import lazy_model  # noqa: PLC0415
+
+        return lazy_model(cls).model_validate(data)
+
+    @classmethod
+    def from_json_lazy(cls, json_str: str | bytes) -> BaseRecordModel:
+        """Create a lazily-validated model instance from a JSON string.
+
+        See `from_dict_lazy` for how nested sub-models are deferred.
+
+        Args:
+            json_str: JSON string or bytes containing model data
+
+        Returns:
+            New lazily-validated instance of the model
+        """
+        from airbyte_connector_models.connectors._internal.lazy import lazy_model  # noqa: PLC0415
+
+        return lazy_model(cls).model_validate_json(json_str)
+
+    @classmethod
+    def from_trusted(cls, data: dict[str, Any]) -> BaseRecordModel:
+        """Create a model instance from already-validated data without validating it.
+
+        Unlike a bare `model_construct`, nested objects and arrays are converted into
+        their generated sub-models recursively, based on the field annotations, so the
+        result has the same shape as `from_dict` would produce. Only use this for data
+        that has been validated before (e.g. records re-read from your own checkpoints);
+        invalid input is stored as-is rather than rejected.
+
+        Each model gets a generated constructor that reads its fields without per-field
+        dispatch. Flat records build up to about 1.4x faster than `model_validate`, but
+        every nested object still costs Python time: deeply nested records (e.g.
+        `PokeapiPokemonRecord`) build up to about 1.5x slower than pydantic-core
+        validates them. Use this to skip validation semantics; for raw throughput on
+        nested data prefer `validate_many` / `validate_many_json`.
+
+        Args:
+            data: Dictionary containing trusted model data
+
+        Returns:
+            New instance of the model
+        """
+        return _trusted_constructor(cls)(data)
+
+    @classmethod
+    def from_trusted_many(cls, records: Iterable[dict[str, Any]]) -> list[BaseRecordModel]:
+        """Create model instances from a batch of already-validated dictionaries.
+
+        Args:
+            records: Iterable of dictionaries containing trusted model data
+
+        Returns:
+            List of new instances of the model, in input order
+        """
+        construct = _trusted_constructor(cls)
+        return [construct(record) for record in records]
+
     def to_json(self) -> str:
         """Convert the model to a JSON string.
 
@@ -171,3 +275,441 @@ class BaseRecordModel(BaseModel):
             New instance of the model
         """
         return cls.model_validate_json(json_str)
+
+    @classmethod
+    def validate_many(cls, records: Iterable[dict[str, Any]]) -> list[BaseRecordModel]:
+        """Create model instances from a batch of dictionaries.
+
+        The whole batch is validated in a single pydantic-core call, which avoids the
+        per-record Python overhead of calling `from_dict` in a loop.
+
+        Args:
+            records: Iterable of dictionaries containing model data
+
+        Returns:
+            List of new instances of the model, in input order
+
+        Raises:
+            ValidationError: If any record fails validation. Error locations are
+                prefixed with the index of the offending record.
+        """
+        return _list_adapter(cls).validate_python(records)
+
+    @classmethod
+    def validate_many_json(cls, json_data: str | bytes) -> list[BaseRecordModel]:
+        """Create model instances from a JSON array of records.
+
+        Args:
+            json_data: JSON string or bytes containing an array of record objects
+
+        Returns:
+            List of new instances of the model, in input order
+
+        Raises:
+            ValidationError: If the payload is not a JSON array or any record fails
+                validation
+        """
+        return _list_adapter(cls).validate_json(json_data)
+
+    @classmethod
+    def validate_collect(cls, records: Iterable[dict[str, Any]]) -> ValidationReport:
+        """Validate a batch of records, collecting errors instead of raising.
+
+        Example:
+            report = PokeapiPokemonRecord.validate_collect(rows)
+            load(report.records)
+            print(report.counts_by_path())
+
+        Args:
+            records: Iterable of record dicts
+
+        Returns:
+            A `ValidationReport` holding the valid records and a columnar list of errors
+            (row index, field path, error type) for the invalid ones
+        """
+        from airbyte_connector_models.connectors._internal.report import (  # noqa: PLC0415
+            collect_errors,
+        )
+
+        return collect_errors(records, cls)
+
+    @classmethod
+    def to_arrow(
+        cls,
+        records: Iterable[BaseRecordModel],
+        *,
+        extras_column: str | None = None,
+    ) -> Any:
+        """Convert a batch of records of this model into an Arrow record batch.
+
+        Requires the optional `pyarrow` dependency. Nested sub-models become struct
+        columns; see `airbyte_connector_models.connectors._internal.arrow` for details.
+
+        Args:
+            records: Validated instances of the model
+            extras_column: Name of an extra string column holding the JSON-encoded
+                extra properties of each record, or None to drop extra properties
+
+        Returns:
+            A `pyarrow.RecordBatch`
+        """
+        from airbyte_connector_models.connectors._internal.arrow import to_arrow  # noqa: PLC0415
+
+        return to_arrow(records, cls, extras_column=extras_column)
+
+    @classmethod
+    def validate_arrow(cls, data: Any) -> Any:
+        """Validate an Arrow table or record batch against this model, column by column.
+
+        Requires the optional `pyarrow` dependency. No Python object is built per row;
+        see `airbyte_connector_models.connectors._internal.arrow.validate_arrow`.
+
+        Args:
+            data: A `pyarrow.Table` or `pyarrow.RecordBatch`
+
+        Returns:
+            An `ArrowValidationResult` with the failing rows per column
+        """
+        from airbyte_connector_models.connectors._internal.arrow import (  # noqa: PLC0415
+            validate_arrow,
+        )
+
+        return validate_arrow(data, cls)
+
+
+_IMMUTABLE_DEFAULT_TYPES = (type(None), bool, int, float, str, bytes)
+
+# Setters of the instance `__dict__` and of pydantic's slots, called directly by compiled
+# constructors; they skip the attribute lookup `object.__setattr__` does on every call.
+_INSTANCE_SETTERS = {
+    "_set_dict": BaseModel.__dict__["__dict__"].__set__,
+    "_set_fields_set": BaseModel.__dict__["__pydantic_fields_set__"].__set__,
+    "_set_extra": BaseModel.__dict__["__pydantic_extra__"].__set__,
+    "_set_private": BaseModel.__dict__["__pydantic_private__"].__set__,
+}
+
+
+def _trusted_converter(annotation: Any) -> Callable[[Any], Any] | None:
+    """Build a converter turning trusted raw data into the nested models of an annotation.
+
+    Args:
+        annotation: A resolved field annotation
+
+    Returns:
+        A function converting a raw value, or None if the annotation contains no nested
+        record models and raw values can be stored as-is
+    """
+    if isinstance(annotation, type) and issubclass(annotation, BaseRecordModel):
+        return _model_converter(annotation)
+
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if origin is list and args:
+        return _list_converter(_trusted_converter(args[0]))
+    if origin is dict and args:
+        return _dict_converter(_trusted_converter(args[1]))
+    if origin is Union or origin is types.UnionType:
+        return _union_converter([_trusted_converter(arg) for arg in args if arg is not type(None)])
+    return None
+
+
+def _model_converter(model: type[BaseRecordModel]) -> Callable[[Any], Any]:
+    """Build a converter constructing `model` from trusted dictionaries."""
+    construct: Callable[[dict[str, Any]], Any] | None = None
+
+    def convert_model(value: Any) -> Any:
+        # Resolved on first use so self-referencing models don't recurse while planning.
+        nonlocal construct
+        if type(value) is not dict:
+            return value
+        if construct is None:
+            construct = _trusted_constructor(model)
+        return construct(value)
+
+    return convert_model
+
+
+def _list_converter(
+    convert_item: Callable[[Any], Any] | None,
+) -> Callable[[Any], Any] | None:
+    """Build a converter applying `convert_item` to every non-null list item."""
+    if convert_item is None:
+        return None
+
+    def convert_list(value: Any) -> Any:
+        if type(value) is not list:
+            return value
+        return [None if item is None else convert_item(item) for item in value]
+
+    return convert_list
+
+
+def _dict_converter(
+    convert_value: Callable[[Any], Any] | None,
+) -> Callable[[Any], Any] | None:
+    """Build a converter applying `convert_value` to every non-null mapping value."""
+    if convert_value is None:
+        return None
+
+    def convert_dict(value: Any) -> Any:
+        if type(value) is not dict:
+            return value
+        return {k: None if v is None else convert_value(v) for k, v in value.items()}
+
+    return convert_dict
+
+
+def _union_converter(
+    members: list[Callable[[Any], Any] | None],
+) -> Callable[[Any], Any] | None:
+    """Build a converter for a union from the converters of its members."""
+    converters = [converter for converter in members if converter is not None]
+    if not converters:
+        return None
+    if len(converters) == 1:
+        return converters[0]
+
+    def convert_union(value: Any) -> Any:
+        # Without validation the first member that accepts the value's shape wins.
+        for converter in converters:
+            converted = converter(value)
+            if converted is not value:
+                return converted
+        return value
+
+    return convert_union
+
+
+def _is_plain_field(name: str, field: FieldInfo) -> bool:
+    """Check whether a field can be populated by the compiled trusted constructor.
+
+    Plain fields are looked up by their own name and are either required or have an
+    immutable default, so their default can be shared between instances without copying.
+    """
+    return (
+        field.alias in (None, name)
+        and field.validation_alias in (None, name)
+        and field.default_factory is None
+        and (field.is_required() or isinstance(field.default, _IMMUTABLE_DEFAULT_TYPES))
+    )
+
+
+def _unwrap_optional(annotation: Any) -> Any:
+    """Return `X` for an `X | None` annotation, and any other annotation unchanged."""
+    if get_origin(annotation) in (Union, types.UnionType):
+        members = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(members) == 1:
+            return members[0]
+    return annotation
+
+
+def _nested_model(annotation: Any) -> type[BaseRecordModel] | None:
+    """Return the record model of an optional `Model` annotation, if it is one."""
+    annotation = _unwrap_optional(annotation)
+    if isinstance(annotation, type) and issubclass(annotation, BaseRecordModel):
+        return annotation
+    return None
+
+
+def _deferred_constructor(
+    namespace: dict[str, Any], key: str, model: type[BaseRecordModel]
+) -> Callable[[dict[str, Any]], Any]:
+    """Return a stand-in that binds the constructor of `model` into `namespace` once used.
+
+    Sub-model constructors are resolved on first use so self-referencing models don't
+    recurse while compiling; afterwards the compiled code calls them directly.
+    """
+
+    def construct_first(data: dict[str, Any]) -> Any:
+        construct = namespace[key] = _trusted_constructor(model)
+        return construct(data)
+
+    return construct_first
+
+
+def _compile_constructor(model: type[BaseRecordModel]) -> Callable[[dict[str, Any]], Any]:
+    """Generate a straight-line constructor for a model whose fields are all plain.
+
+    Every field is read from the input once. Optional sub-models and lists of them are
+    converted inline by calling the sub-model's compiled constructor; other nested
+    annotations (dicts, unions of several models) go through `_trusted_converter`.
+    """
+    fields = model.model_fields
+    namespace: dict[str, Any] = {
+        **_INSTANCE_SETTERS,
+        "_new": object.__new__,
+        "_model": model,
+        "_field_names": frozenset(fields),
+        "_required": frozenset(name for name, field in fields.items() if field.is_required()),
+    }
+    body = ["    get = data.get"]
+    items = []
+    for index, (name, field) in enumerate(fields.items()):
+        var = f"v{index}"
+        if field.is_required() or field.default is None:
+            body.append(f"    {var} = get({name!r})")
+        else:
+            namespace[f"_d{index}"] = field.default
+            body.append(f"    {var} = get({name!r}, _d{index})")
+
+        annotation = field.annotation
+        nested = _nested_model(annotation)
+        container = _unwrap_optional(annotation)
+        item = _nested_model(get_args(container)[0]) if get_origin(container) is list else None
+        if nested is not None:
+            key = f"_c{index}"
+            namespace[key] = _deferred_constructor(namespace, key, nested)
+            body.append(f"    if type({var}) is dict: {var} = {key}({var})")
+        elif item is not None:
+            key = f"_c{index}"
+            namespace[key] = _deferred_constructor(namespace, key, item)
+            body.append(
+                f"    if type({var}) is list: "
+                f"{var} = [{key}(i) if type(i) is dict else i for i in {var}]"
+            )
+        elif (converter := _trusted_converter(annotation)) is not None:
+            namespace[f"_t{index}"] = converter
+            body.append(f"    if {var} is not None: {var} = _t{index}({var})")
+        items.append(f"{name!r}: {var}")
+
+    body += [
+        f"    values = {{{', '.join(items)}}}",
+        "    fields_set = set(data)",
+        "    if fields_set <= _field_names:",
+        "        extra = {}",
+        "    else:",
+        "        extra = {k: v for k, v in data.items() if k not in _field_names}",
+        "        fields_set &= _field_names",
+    ]
+    if namespace["_required"]:
+        # Like `model_construct`, leave out required fields that were not given.
+        body += [
+            "    if not _required <= fields_set:",
+            "        for name in _required - fields_set:",
+            "            del values[name]",
+        ]
+    body += [
+        "    instance = _new(_model)",
+        "    _set_dict(instance, values)",
+        "    _set_fields_set(instance, fields_set)",
+        "    _set_extra(instance, extra)",
+        "    _set_private(instance, None)",
+        "    return instance",
+    ]
+    source = "\n".join(["def construct(data):", *body, ""])
+    exec(compile(source, f"<trusted constructor of {model.__name__}>", "exec"), namespace)
+    return namespace["construct"]
+
+
+@cache
+def _trusted_constructor(model: type[BaseRecordModel]) -> Callable[[dict[str, Any]], Any]:
+    """Build the cached unchecked constructor used by `from_trusted` for a model.
+
+    Args:
+        model: The record model class
+
+    Returns:
+        A function creating an instance of `model` from a trusted dictionary
+    """
+    if not model.__pydantic_complete__:
+        model.model_rebuild()
+
+    fields = model.model_fields
+    if not model.__pydantic_post_init__ and all(
+        _is_plain_field(name, field) for name, field in fields.items()
+    ):
+        return _compile_constructor(model)
+
+    # Aliases, factories and post-init hooks are left to pydantic's own constructor.
+    lookup = {
+        key: converter
+        for name, field in fields.items()
+        if (converter := _trusted_converter(field.annotation)) is not None
+        for key in {name, field.alias, field.validation_alias}
+        if isinstance(key, str)
+    }
+
+    def construct_with_pydantic(data: dict[str, Any]) -> Any:
+        values = {
+            key: value if value is None or (convert := lookup.get(key)) is None else convert(value)
+            for key, value in data.items()
+        }
+        return model.model_construct(**values)
+
+    return construct_with_pydantic
+
+
+def _record_len(record: BaseRecordModel) -> int:
+    """Count the fields and extra properties of a record without copying them."""
+    extra = record.__pydantic_extra__
+    return len(type(record).model_fields) + (len(extra) if extra else 0)
+
+
+class RecordKeysView(KeysView[str]):
+    """Lazy, dict-style view over the field and extra property names of a record.
+
+    Like `dict.keys()`, the view reflects later changes to the record's extras and
+    supports `len()`, membership tests and set operations without building a list.
+    """
+
+    __slots__ = ()
+
+    _mapping: BaseRecordModel
+
+    def __len__(self) -> int:
+        """Return the number of fields and extra properties."""
+        return _record_len(self._mapping)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over field names, then extra property names."""
+        record = self._mapping
+        yield from type(record).model_fields
+        extra = record.__pydantic_extra__
+        if extra:
+            yield from extra
+
+
+class RecordItemsView(ItemsView[str, Any]):
+    """Lazy, dict-style view over the (key, value) pairs of a record."""
+
+    __slots__ = ()
+
+    _mapping: BaseRecordModel
+
+    def __len__(self) -> int:
+        """Return the number of fields and extra properties."""
+        return _record_len(self._mapping)
+
+    def __iter__(self) -> Iterator[tuple[str, Any]]:
+        """Iterate over field items, then extra property items."""
+        record = self._mapping
+        for key in type(record).model_fields:
+            yield key, getattr(record, key)
+        extra = record.__pydantic_extra__
+        if extra:
+            yield from extra.items()
+
+
+class RecordValuesView(ValuesView[Any]):
+    """Lazy, dict-style view over the field and extra property values of a record."""
+
+    __slots__ = ()
+
+    _mapping: BaseRecordModel
+
+    def __len__(self) -> int:
+        """Return the number of fields and extra properties."""
+        return _record_len(self._mapping)
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over field values, then extra property values."""
+        record = self._mapping
+        for key in type(record).model_fields:
+            yield getattr(record, key)
+        extra = record.__pydantic_extra__
+        if extra:
+            yield from extra.values()
+
+    def __contains__(self, value: object) -> bool:
+        """Check whether any field or extra property holds `value`."""
+        return any(v is value or v == value for v in self)
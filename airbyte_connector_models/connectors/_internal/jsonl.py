@@ -0,0 +1,60 @@
+"""Streaming readers for newline-delimited JSON record payloads."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import BinaryIO
+
+from airbyte_connector_models.connectors._internal.base_record import BaseRecordModel
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+
+def iter_jsonl(
+    stream: BinaryIO,
+    *,
+    model: type[BaseRecordModel],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[BaseRecordModel]:
+    """Iterate over validated records from a newline-delimited JSON stream.
+
+    The stream is read in fixed-size chunks and each line is validated directly from
+    its bytes with `model_validate_json`, so memory use is bounded by the chunk size
+    plus the longest single line rather than by the size of the file. Blank lines are
+    skipped.
+
+    Args:
+        stream: Binary file-like object containing one JSON record per line
+        model: The record model class to validate each line against
+        chunk_size: Number of bytes to read from the stream at a time
+
+    Yields:
+        Validated instances of `model`, in stream order
+
+    Raises:
+        ValueError: If `chunk_size` is not positive
+        ValidationError: If a line is not valid JSON or fails model validation
+    """
+    if chunk_size <= 0:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+
+    # Pieces of a line that spans several chunks; only new chunks are searched for the
+    # newline, and the pieces are joined once, so long lines cost linear time.
+    pending: list[bytes] = []
+    while chunk := stream.read(chunk_size):
+        start = 0
+        while (end := chunk.find(b"\n", start)) != -1:
+            line = chunk[start:end]
+            if pending:
+                pending.append(line)
+                line = b"".join(pending)
+                pending.clear()
+            start = end + 1
+            if line and not line.isspace():
+                yield model.model_validate_json(line)
+        if start < len(chunk):
+            pending.append(chunk[start:])
+
+    line = b"".join(pending)
+    if line and not line.isspace():
+        yield model.model_validate_json(line)
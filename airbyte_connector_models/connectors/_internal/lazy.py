@@ -0,0 +1,149 @@
+"""Lazy materialization of nested sub-models for generated record models."""
+
+from __future__ import annotations
+
+from functools import cache
+from typing import Annotated, Any, get_args
+
+from pydantic import AfterValidator, Field, PlainSerializer, TypeAdapter, create_model
+
+from airbyte_connector_models.connectors._internal.base_record import BaseRecordModel
+
+
+class _Pending:
+    """Raw field value that has not been validated against its annotation yet."""
+
+    __slots__ = ("raw",)
+
+    def __init__(self, raw: Any) -> None:
+        self.raw = raw
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Pending) and self.raw == other.raw
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return repr(self.raw)
+
+
+class _LazyField:
+    """Data descriptor validating a nested field on first access and caching the result.
+
+    Declared on the lazy subclass for every field whose annotation contains nested record
+    models. The shallow pass stores the raw value wrapped in `_Pending` in the instance
+    `__dict__`; reading the attribute validates it against the original annotation and
+    replaces it in place.
+    """
+
+    __slots__ = ("adapter", "name")
+
+    def __init__(self, name: str, adapter: TypeAdapter[Any]) -> None:
+        self.name = name
+        self.adapter = adapter
+
+    def __get__(self, instance: BaseRecordModel | None, owner: type | None = None) -> Any:
+        if instance is None:
+            return self
+        values = instance.__dict__
+        value = values[self.name]
+        if type(value) is not _Pending:
+            return value
+        validated = self.adapter.validate_python(value.raw)
+        values[self.name] = validated
+        return validated
+
+    def __set__(self, instance: BaseRecordModel, value: Any) -> None:
+        instance.__dict__[self.name] = value
+
+
+def _has_nested_models(annotation: Any) -> bool:
+    """Check whether an annotation contains a record model anywhere inside it."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseRecordModel):
+        return True
+    return any(_has_nested_models(arg) for arg in get_args(annotation))
+
+
+def _defer(value: Any) -> Any:
+    """Wrap a raw nested value so the lazy descriptor validates it on first access."""
+    return None if value is None else _Pending(value)
+
+
+def _serialize_deferred(value: Any) -> Any:
+    """Serialize a lazy field, emitting the raw value if it was never accessed."""
+    return value.raw if type(value) is _Pending else value
+
+
+def _restore(model: type[BaseRecordModel], state: dict[str, Any]) -> BaseRecordModel:
+    """Unpickle a lazy instance by looking up the lazy subclass of its model again."""
+    lazy = lazy_model(model)
+    instance = lazy.__new__(lazy)
+    instance.__setstate__(state)
+    return instance
+
+
+def _reduce(self: BaseRecordModel) -> tuple[Any, ...]:
+    """Pickle a lazy instance through its eager model, which is importable by name."""
+    return _restore, (type(self).__bases__[0], self.__getstate__())
+
+
+# Annotation used for lazy fields: accept anything, defer it, and dump it back unchanged.
+_Deferred = Annotated[
+    Any,
+    AfterValidator(_defer),
+    PlainSerializer(_serialize_deferred, when_used="always"),
+]
+
+
+@cache
+def lazy_model(model: type[BaseRecordModel]) -> type[BaseRecordModel]:
+    """Return the cached lazy subclass of a record model.
+
+    The subclass validates fields without nested record models eagerly, and keeps
+    fields with nested record models raw until they are first read. Instances are
+    instances of `model`, serialize to the same output, and can be passed anywhere the
+    eager model is accepted. Unaccessed nested fields stay raw when an instance is
+    pickled, e.g. to send it to a worker process.
+
+    Like any pydantic model, a lazy instance compares equal only to instances of the
+    same class: `lazy == eager` is False even for identical data. Compare
+    `model_dump()` outputs to compare lazy and eager records.
+
+    Args:
+        model: The record model class
+
+    Returns:
+        A subclass of `model` with deferred validation of nested fields
+    """
+    if not model.__pydantic_complete__:
+        model.model_rebuild()
+
+    nested = {
+        name: field
+        for name, field in model.model_fields.items()
+        if _has_nested_models(field.annotation)
+    }
+    if not nested:
+        return model
+
+    lazy = create_model(  # type: ignore[call-overload]
+        f"{model.__name__}Lazy",
+        __base__=model,
+        __module__=model.__module__,
+        **{
+            name: (
+                _Deferred,
+                Field(
+                    default=field.default,
+                    alias=field.alias,
+                    validation_alias=field.validation_alias,
+                ),
+            )
+            for name, field in nested.items()
+        },
+    )
+    for name, field in nested.items():
+        setattr(lazy, name, _LazyField(name, TypeAdapter(field.annotation)))
+    # The subclass is not defined in the model's module, so pickle finds no class there.
+    lazy.__reduce__ = _reduce  # type: ignore[method-assign]
+    return lazy
@@ -0,0 +1,134 @@
+"""Multi-process validation of raw JSON record lines."""
+
+from __future__ import annotations
+
+import importlib
+import multiprocessing
+import os
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Any, NamedTuple
+
+from pydantic import ValidationError
+
+from airbyte_connector_models.connectors._internal.base_record import BaseRecordModel
+
+DEFAULT_SHARD_SIZE = 2048
+
+# Model class resolved once per worker process by `_init_worker`.
+_worker_model: type[BaseRecordModel] | None = None
+
+
+class RecordError(NamedTuple):
+    """Validation failure of a single input line.
+
+    Attributes:
+        index: Zero-based position of the line in the input (blank lines included)
+        errors: The pydantic error details, without inputs or documentation URLs
+    """
+
+    index: int
+    errors: tuple[dict[str, Any], ...]
+
+
+def _init_worker(module: str, qualname: str) -> None:
+    """Import the model module once in a fresh worker process."""
+    global _worker_model  # noqa: PLW0603
+    target: Any = importlib.import_module(module)
+    for part in qualname.split("."):
+        target = getattr(target, part)
+    _worker_model = target
+
+
+def _validate_shard(
+    start: int, lines: list[bytes | str], errors_only: bool
+) -> list[BaseRecordModel | RecordError | None]:
+    """Validate one shard of lines in a worker process."""
+    model = _worker_model
+    assert model is not None
+    results: list[BaseRecordModel | RecordError | None] = []
+    for index, line in enumerate(lines, start):
+        if not line.strip():
+            continue
+        try:
+            record = model.model_validate_json(line)
+        except ValidationError as e:
+            errors = e.errors(include_url=False, include_input=False, include_context=False)
+            results.append(RecordError(index, tuple(errors)))
+        else:
+            results.append(None if errors_only else record)
+    return results
+
+
+def _read_lines(source: str | os.PathLike[str] | Iterable[bytes | str]) -> Iterator[bytes | str]:
+    """Iterate over the raw lines of a JSONL file path or an iterable of lines."""
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:  # noqa: PTH123
+            yield from f
+    else:
+        yield from source
+
+
+def validate_parallel(
+    source: str | os.PathLike[str] | Iterable[bytes | str],
+    model: type[BaseRecordModel],
+    *,
+    workers: int | None = None,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+    errors_only: bool = False,
+) -> Iterator[BaseRecordModel | RecordError]:
+    """Validate raw JSON record lines across a pool of worker processes.
+
+    Lines are sharded into groups of `shard_size` and validated with
+    `model_validate_json` in worker processes, each of which imports the model module
+    once. Workers are started with the `spawn` method so the pool is safe to create from
+    threaded programs; scripts calling this must guard their entry point with
+    `if __name__ == "__main__":`. At most two shards per worker are in flight at a
+    time, so the input is read lazily and results are yielded in input order as soon
+    as they are ready.
+
+    Example:
+        for result in validate_parallel("replay.jsonl", PokeapiPokemonRecord, workers=32):
+            if isinstance(result, RecordError):
+                ...
+
+    Args:
+        source: Path to a JSONL file, or an iterable of raw JSON lines
+        model: The record model class; it must be importable from its module
+        workers: Number of worker processes (defaults to the number of CPUs)
+        shard_size: Number of lines sent to a worker at a time
+        errors_only: Only yield `RecordError`s, skipping the transfer of valid records
+            back to the calling process
+
+    Yields:
+        A validated record or a `RecordError` for each non-blank line, in input order
+
+    Raises:
+        ValueError: If `workers` or `shard_size` is not positive
+    """
+    if workers is not None and workers <= 0:
+        raise ValueError(f"workers must be positive, got {workers}")
+    if shard_size <= 0:
+        raise ValueError(f"shard_size must be positive, got {shard_size}")
+
+    workers = workers or os.cpu_count() or 1
+    lines = _read_lines(source)
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(model.__module__, model.__qualname__),
+    ) as executor:
+        in_flight: deque[Future[list[BaseRecordModel | RecordError | None]]] = deque()
+        start = 0
+        while True:
+            while len(in_flight) < 2 * workers and (shard := list(islice(lines, shard_size))):
+                in_flight.append(executor.submit(_validate_shard, start, shard, errors_only))
+                start += len(shard)
+            if not in_flight:
+                break
+            for result in in_flight.popleft().result():
+                if result is not None:
+                    yield result
@@ -0,0 +1,82 @@
+"""Base class for generated read-only record views."""
+
+from __future__ import annotations
+
+from typing import Any, ClassVar
+
+
+def _plain(value: Any) -> Any:
+    """Convert views and tuples in a view value back into plain dicts and lists."""
+    if isinstance(value, RecordView):
+        return value.to_dict()
+    if isinstance(value, tuple):
+        return [_plain(item) for item in value]
+    return value
+
+
+class RecordView:
+    """Base class for the `__slots__`-backed, read-only views of generated record models.
+
+    Views are generated next to the pydantic record models (see `--record-views`) and
+    hold the declared fields of a record, keyed by their schema names, without any
+    pydantic machinery: no `__dict__`, no extras and no fields-set bookkeeping. Nested
+    objects become nested views and arrays become tuples, so views are immutable,
+    hashable (unless they contain free-form objects) and cheap to keep in memory by
+    the million, e.g. for deduplication or joins.
+
+    Views never validate. Build them with the generated `from_validated_dict` from
+    records that already passed validation, e.g. with `compile_validator` or
+    `model.model_dump(by_alias=True)`. Extra properties are dropped.
+    """
+
+    __slots__ = ()
+
+    # Schema names of the fields, in slot order
+    _aliases: ClassVar[tuple[str, ...]] = ()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Reject attribute assignment; views are read-only."""
+        raise AttributeError(f"'{type(self).__name__}' is read-only")
+
+    def __delattr__(self, name: str) -> None:
+        """Reject attribute deletion; views are read-only."""
+        raise AttributeError(f"'{type(self).__name__}' is read-only")
+
+    def _values(self) -> tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare views of the same class field by field."""
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._values() == other._values()  # type: ignore[attr-defined]
+
+    def __hash__(self) -> int:
+        """Hash the field values, so views can be deduplicated in sets and dicts."""
+        return hash((type(self), self._values()))
+
+    def __repr__(self) -> str:
+        """Show the field values like a dataclass."""
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+    def __getstate__(self) -> tuple[Any, ...]:
+        """Return the field values for pickling."""
+        return self._values()
+
+    def __setstate__(self, state: tuple[Any, ...]) -> None:
+        """Restore the field values when unpickling."""
+        for name, value in zip(self.__slots__, state, strict=True):
+            object.__setattr__(self, name, value)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the view to a plain dict keyed by schema names.
+
+        Returns:
+            The fields as a dict, with nested views and tuples converted back into
+            dicts and lists
+        """
+        return {
+            alias: _plain(getattr(self, name))
+            for alias, name in zip(self._aliases, self.__slots__, strict=True)
+        }
@@ -0,0 +1,96 @@
+"""Lookup of generated connector models by connector and stream name."""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+from airbyte_connector_models.connectors._index import CONFIG_MODELS, RECORD_MODELS
+from airbyte_connector_models.connectors._internal.base_config import BaseConfig
+from airbyte_connector_models.connectors._internal.base_record import BaseRecordModel
+
+
+def _load(location: tuple[str, str]) -> type[Any]:
+    """Import a model's module (only now) and return the model class."""
+    module, class_name = location
+    return getattr(importlib.import_module(module), class_name)
+
+
+def list_connectors() -> list[str]:
+    """List the connectors that have generated config or record models.
+
+    Returns:
+        Sorted connector names (e.g., "source-postgres")
+    """
+    return sorted(CONFIG_MODELS.keys() | RECORD_MODELS.keys())
+
+
+def list_streams(connector: str) -> list[str]:
+    """List the streams of a connector that have generated record models.
+
+    Args:
+        connector: The connector name (e.g., "source-pokeapi")
+
+    Returns:
+        The stream names, as declared by the connector
+    """
+    return list(RECORD_MODELS.get(connector, {}))
+
+
+def get_config_model(connector: str) -> type[BaseConfig]:
+    """Return the config model of a connector, importing only its module.
+
+    Args:
+        connector: The connector name (e.g., "source-postgres")
+
+    Returns:
+        The connector's config model class
+
+    Raises:
+        ValueError: If no config model was generated for the connector
+    """
+    location = CONFIG_MODELS.get(connector)
+    if location is None:
+        raise ValueError(f"No config model found for connector {connector!r}")
+    return _load(location)
+
+
+def resolve_stream(connector: str, stream: str) -> str | None:
+    """Return the name under which a connector stream is indexed.
+
+    Stream names are matched exactly first, then case-insensitively.
+
+    Args:
+        connector: The connector name (e.g., "source-pokeapi")
+        stream: The stream name (e.g., "pokemon")
+
+    Returns:
+        The stream name as declared by the connector, or None if the connector stream
+        has no generated record model
+    """
+    streams = RECORD_MODELS.get(connector, {})
+    if stream in streams:
+        return stream
+    folded = stream.casefold()
+    return next((name for name in streams if name.casefold() == folded), None)
+
+
+def get_record_model(connector: str, stream: str) -> type[BaseRecordModel]:
+    """Return the record model of a connector stream, importing only its module.
+
+    Stream names are matched exactly first, then case-insensitively.
+
+    Args:
+        connector: The connector name (e.g., "source-pokeapi")
+        stream: The stream name (e.g., "pokemon")
+
+    Returns:
+        The stream's record model class
+
+    Raises:
+        ValueError: If no record model was generated for the connector stream
+    """
+    name = resolve_stream(connector, stream)
+    if name is None:
+        raise ValueError(f"No record model found for stream {stream!r} of {connector!r}")
+    return _load(RECORD_MODELS[connector][name])
@@ -0,0 +1,140 @@
+"""Batch validation that collects record errors into a columnar report."""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterable
+from functools import cache
+from typing import Annotated, Any
+
+from pydantic import Field, TypeAdapter, ValidationError
+
+from airbyte_connector_models.connectors._internal.base_record import (
+    BaseRecordModel,
+    _list_adapter,
+)
+
+
+class ValidationReport:
+    """Valid records of a batch plus the errors of the invalid ones, stored by column.
+
+    Each error occupies one position across `row_index`, `field_path` and
+    `error_type`; a row with several invalid fields contributes several entries.
+
+    Attributes:
+        records: The validated records, in input order
+        valid_indices: Input position of each entry in `records`
+        row_index: Input position of the row each error belongs to
+        field_path: Dotted location of each error within its row ("" for the row itself)
+        error_type: Pydantic error type of each error (e.g. "int_parsing", "missing")
+    """
+
+    __slots__ = ("error_type", "field_path", "num_rows", "records", "row_index", "valid_indices")
+
+    def __init__(
+        self,
+        *,
+        num_rows: int,
+        records: list[BaseRecordModel],
+        valid_indices: list[int],
+        row_index: list[int],
+        field_path: list[str],
+        error_type: list[str],
+    ) -> None:
+        self.num_rows = num_rows
+        self.records = records
+        self.valid_indices = valid_indices
+        self.row_index = row_index
+        self.field_path = field_path
+        self.error_type = error_type
+
+    def __repr__(self) -> str:
+        return (
+            f"ValidationReport(num_rows={self.num_rows}, num_valid={len(self.records)}, "
+            f"num_errors={self.num_errors})"
+        )
+
+    @property
+    def is_valid(self) -> bool:
+        """Whether every row validated."""
+        return not self.row_index
+
+    @property
+    def num_errors(self) -> int:
+        """Total number of errors across all rows."""
+        return len(self.row_index)
+
+    @property
+    def invalid_indices(self) -> list[int]:
+        """Sorted input positions of the rows that failed validation."""
+        return sorted(set(self.row_index))
+
+    def counts_by_path(self) -> dict[str, int]:
+        """Count errors per field path, most frequent first."""
+        return dict(Counter(self.field_path).most_common())
+
+    def counts_by_type(self) -> dict[tuple[str, str], int]:
+        """Count errors per (field path, error type), most frequent first."""
+        return dict(Counter(zip(self.field_path, self.error_type, strict=True)).most_common())
+
+
+@cache
+def _collect_adapter(model: type[BaseRecordModel]) -> TypeAdapter[list[Any]]:
+    """Return the cached adapter that validates rows, passing failed rows through raw."""
+    return TypeAdapter(list[Annotated[model | Any, Field(union_mode="left_to_right")]])
+
+
+def collect_errors(
+    records: Iterable[dict[str, Any]], model: type[BaseRecordModel]
+) -> ValidationReport:
+    """Validate a batch of records, collecting failures instead of raising.
+
+    The batch is validated in a single call in which each row falls back to its raw
+    value when it does not match the model, so no exception is raised per bad row.
+    Only the rows that failed are then re-validated together, raising one
+    `ValidationError` that carries the details of all of them.
+
+    Args:
+        records: Iterable of record dicts
+        model: The record model class to validate against
+
+    Returns:
+        A `ValidationReport` with the valid records and the collected errors
+    """
+    rows = records if isinstance(records, list) else list(records)
+    results = _collect_adapter(model).validate_python(rows)
+
+    valid: list[BaseRecordModel] = []
+    valid_indices: list[int] = []
+    invalid_indices: list[int] = []
+    for index, result in enumerate(results):
+        if isinstance(result, model):
+            valid.append(result)
+            valid_indices.append(index)
+        else:
+            invalid_indices.append(index)
+
+    row_index: list[int] = []
+    field_path: list[str] = []
+    error_type: list[str] = []
+    if invalid_indices:
+        try:
+            _list_adapter(model).validate_python([rows[index] for index in invalid_indices])
+        except ValidationError as e:
+            errors = e.errors(include_url=False, include_input=False, include_context=False)
+        else:  # pragma: no cover - the fallback only triggers for rows that fail
+            errors = []
+        for error in errors:
+            position, *path = error["loc"]
+            row_index.append(invalid_indices[int(position)])
+            field_path.append(".".join(map(str, path)))
+            error_type.append(error["type"])
+
+    return ValidationReport(
+        num_rows=len(rows),
+        records=valid,
+        valid_indices=valid_indices,
+        row_index=row_index,
+        field_path=field_path,
+        error_type=error_type,
+    )
@@ -0,0 +1,182 @@
+"""On-disk cache of built pydantic core schemas for fast cold starts.
+
+Building the core schema of a large generated model is mostly Python work inside
+pydantic; compiling an already-built schema into a validator is cheap. This cache
+stores the core schemas of built models and, in a later process, installs validators
+and serializers compiled straight from the cached schemas on models that have not been
+built yet (models generated with `--defer-build`, or models whose forward references
+are resolved on first use).
+
+Restored models validate and serialize without building their schema. They still
+report `__pydantic_complete__ = False`, and anything needing the full schema (such as
+`model_json_schema()`) builds the model normally on first use.
+
+Entries are keyed by package version, pydantic and pydantic-core versions and a hash
+of the source modules of the model and its base classes (such as `base_record`), so
+regenerated models, changed base classes and upgraded dependencies never read stale
+entries. The JSON-schema `metadata` of core schemas is not cached, and models whose
+schemas reference local functions (e.g. URL fields) cannot be pickled and are simply
+built as usual. Only point the cache at a directory you trust: entries are pickles.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import inspect
+import os
+import pickle
+import tempfile
+from functools import cache
+from importlib import metadata
+from pathlib import Path
+from types import ModuleType
+
+import pydantic_core
+from pydantic import VERSION, BaseModel
+from pydantic_core import SchemaSerializer, SchemaValidator
+from pydantic_core.core_schema import CoreConfig
+
+CACHE_DIR_ENV = "AIRBYTE_CONNECTOR_MODELS_SCHEMA_CACHE"
+
+
+def default_cache_dir() -> Path:
+    """Return the cache directory from the environment, or the user cache directory."""
+    if configured := os.environ.get(CACHE_DIR_ENV):
+        return Path(configured)
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "airbyte-connector-models" / "schemas"
+
+
+@cache
+def _version_dir() -> str:
+    try:
+        version = metadata.version("airbyte-connector-models")
+    except metadata.PackageNotFoundError:
+        version = "unknown"
+    return f"{version}-pydantic-{VERSION}-pydantic-core-{pydantic_core.__version__}"
+
+
+@cache
+def _module_source(module_name: str) -> bytes:
+    source = inspect.getsourcefile(importlib.import_module(module_name))
+    return Path(source).read_bytes() if source else module_name.encode()
+
+
+def _model_hash(model: type[BaseModel]) -> str:
+    """Hash everything outside pydantic that shapes a model's core schema."""
+    digest = hashlib.sha256(f"{VERSION}-{pydantic_core.__version__}".encode())
+    modules = dict.fromkeys(
+        cls.__module__
+        for cls in model.__mro__
+        if issubclass(cls, BaseModel) and cls.__module__.partition(".")[0] != "pydantic"
+    )
+    for module_name in modules:
+        digest.update(module_name.encode())
+        digest.update(_module_source(module_name))
+    return digest.hexdigest()[:16]
+
+
+def _entry_path(cache_dir: Path, model: type[BaseModel]) -> Path:
+    name = f"{model.__module__}.{model.__qualname__}-{_model_hash(model)}.pickle"
+    return cache_dir / _version_dir() / name
+
+
+def _strip_metadata(schema: object) -> object:
+    """Drop the JSON-schema `metadata` entries, which validation never uses."""
+    if isinstance(schema, dict):
+        return {key: _strip_metadata(value) for key, value in schema.items() if key != "metadata"}
+    if isinstance(schema, list):
+        return [_strip_metadata(value) for value in schema]
+    return schema
+
+
+def _models(targets: tuple[type[BaseModel] | ModuleType | str, ...]) -> list[type[BaseModel]]:
+    """Return the models of the targets, each class once even if exported under aliases."""
+    models: dict[type[BaseModel], None] = {}
+    for target in targets:
+        module = importlib.import_module(target) if isinstance(target, str) else target
+        if isinstance(module, ModuleType):
+            models.update(
+                (obj, None)
+                for _, obj in inspect.getmembers(module, inspect.isclass)
+                if issubclass(obj, BaseModel) and obj.__module__ == module.__name__
+            )
+        else:
+            models[module] = None
+    return list(models)
+
+
+def _core_config(model: type[BaseModel]) -> CoreConfig:
+    from pydantic._internal._config import ConfigWrapper  # noqa: PLC0415
+
+    return ConfigWrapper(model.model_config, check=False).core_config(title=model.__name__)
+
+
+def save_schemas(
+    *targets: type[BaseModel] | ModuleType | str, cache_dir: Path | str | None = None
+) -> int:
+    """Build models if needed and write their core schemas to the cache.
+
+    Args:
+        targets: Model classes, modules, or dotted module names; for a module every
+            model defined in it is saved
+        cache_dir: Cache directory (defaults to `default_cache_dir()`)
+
+    Returns:
+        The number of models written; models whose schema cannot be pickled are skipped
+    """
+    directory = Path(cache_dir) if cache_dir is not None else default_cache_dir()
+    saved = 0
+    for model in _models(targets):
+        if not model.__pydantic_complete__:
+            model.model_rebuild()
+        try:
+            payload = pickle.dumps(
+                (_strip_metadata(model.__pydantic_core_schema__), _core_config(model))
+            )
+        except (pickle.PicklingError, AttributeError, TypeError):
+            continue
+        path = _entry_path(directory, model)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as temp_file:
+            temp_file.write(payload)
+        Path(temp_file.name).replace(path)
+        saved += 1
+    return saved
+
+
+def load_schemas(
+    *targets: type[BaseModel] | ModuleType | str, cache_dir: Path | str | None = None
+) -> int:
+    """Install validators and serializers from the cache on models not built yet.
+
+    Models that are already built, or have no usable cache entry, are left untouched
+    and build as usual on first use.
+
+    Args:
+        targets: Model classes, modules, or dotted module names
+        cache_dir: Cache directory (defaults to `default_cache_dir()`)
+
+    Returns:
+        The number of models restored from the cache
+    """
+    directory = Path(cache_dir) if cache_dir is not None else default_cache_dir()
+    restored = 0
+    for model in _models(targets):
+        if model.__pydantic_complete__:
+            continue
+        path = _entry_path(directory, model)
+        try:
+            schema, core_config = pickle.loads(path.read_bytes())
+            validator = SchemaValidator(schema, core_config)
+            serializer = SchemaSerializer(schema, core_config)
+        except FileNotFoundError:
+            continue
+        except Exception:  # a corrupt entry must never break the import path
+            path.unlink(missing_ok=True)
+            continue
+        model.__pydantic_validator__ = validator  # type: ignore[assignment]
+        model.__pydantic_serializer__ = serializer
+        restored += 1
+    return restored
@@ -0,0 +1,192 @@
+"""Compiled accept/reject validators built from stored stream JSON schemas.
+
+The generator writes each stream's JSON schema next to its record model
+(`connectors/<connector>/<type>/records/<stream>.json`). These validators check only
+JSON types, nullability and required properties, which is enough to gate records at
+ingestion without building model instances.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from functools import cache
+from importlib import resources
+from typing import Any
+
+from airbyte_connector_models.connectors._index import RECORD_MODELS
+from airbyte_connector_models.connectors._internal.registry import resolve_stream
+
+_MISSING = object()
+
+# Python-side checks for each JSON schema type, as expressions over a value named `v`.
+# `type(...) is` comparisons keep bool out of integer/number and are faster than isinstance.
+_TYPE_CHECKS = {
+    "null": "{v} is None",
+    "string": "type({v}) is str",
+    "integer": "type({v}) is int",
+    "number": "(type({v}) is int or type({v}) is float)",
+    "boolean": "type({v}) is bool",
+    "object": "type({v}) is dict",
+    "array": "type({v}) is list",
+}
+
+
+class _ValidatorCompiler:
+    """Translates a JSON schema into the source of specialized Python check functions."""
+
+    def __init__(self) -> None:
+        self.lines: list[str] = []
+        self.constants: dict[str, Any] = {"_MISSING": _MISSING}
+        self._count = 0
+
+    def _name(self, prefix: str) -> str:
+        self._count += 1
+        return f"_{prefix}_{self._count}"
+
+    def check(self, schema: object, var: str) -> str | None:
+        """Return a boolean expression checking `var` against `schema`.
+
+        Returns:
+            The expression, or None if the schema accepts every value
+        """
+        if not isinstance(schema, dict):
+            return None
+
+        for combinator in ("anyOf", "oneOf"):
+            if combinator in schema:
+                branches = [self.check(branch, var) for branch in schema[combinator]]
+                if any(branch is None for branch in branches) or not branches:
+                    return None
+                return "(" + " or ".join(branches) + ")"
+
+        types = schema.get("type")
+        if types is None:
+            if "properties" in schema or "required" in schema:
+                types = ["object"]
+            else:
+                return None
+        if isinstance(types, str):
+            types = [types]
+
+        checks = []
+        for json_type in types:
+            template = _TYPE_CHECKS.get(json_type)
+            if template is None:
+                return None
+            check = template.format(v=var)
+            structure = self._structure(json_type, schema)
+            if structure is not None:
+                check = f"({check} and {structure}({var}))"
+            checks.append(check)
+        return "(" + " or ".join(checks) + ")" if checks else None
+
+    def _structure(self, json_type: str, schema: dict[str, Any]) -> str | None:
+        """Emit a function checking the contents of an object or array, if needed."""
+        if json_type == "object":
+            return self._object(schema)
+        if json_type == "array":
+            return self._array(schema)
+        return None
+
+    def _object(self, schema: dict[str, Any]) -> str | None:
+        properties = schema.get("properties") or {}
+        required = [key for key in schema.get("required") or [] if isinstance(key, str)]
+        body = [f"    if {key!r} not in v: return False" for key in required]
+        for index, (key, subschema) in enumerate(properties.items()):
+            value = f"p{index}"
+            check = self.check(subschema, value)
+            if check is None:
+                continue
+            body.append(f"    {value} = v.get({key!r}, _MISSING)")
+            body.append(f"    if {value} is not _MISSING and not {check}: return False")
+        if not body:
+            return None
+        name = self._name("object")
+        self.lines.extend([f"def {name}(v):", *body, "    return True", ""])
+        return name
+
+    def _array(self, schema: dict[str, Any]) -> str | None:
+        check = self.check(schema.get("items"), "item")
+        if check is None:
+            return None
+        name = self._name("array")
+        self.lines.extend(
+            [
+                f"def {name}(v):",
+                "    for item in v:",
+                f"        if not {check}: return False",
+                "    return True",
+                "",
+            ]
+        )
+        return name
+
+
+def compile_schema(schema: dict[str, Any]) -> Callable[[Any], bool]:
+    """Compile a JSON schema into a specialized accept/reject function.
+
+    Only `type` (including nullable type lists), `properties`, `required`, `items`
+    and `anyOf`/`oneOf` are enforced; formats, patterns, bounds and `$ref`s are
+    accepted without checking.
+
+    Args:
+        schema: The JSON schema of a record
+
+    Returns:
+        A function returning True if a decoded JSON value conforms to the schema
+    """
+    compiler = _ValidatorCompiler()
+    check = compiler.check(schema, "v") or "True"
+    source = "\n".join([*compiler.lines, "def validate(v):", f"    return {check}", ""])
+    namespace = dict(compiler.constants)
+    exec(compile(source, "<compiled record validator>", "exec"), namespace)
+    return namespace["validate"]
+
+
+def load_record_schema(connector: str, stream: str) -> dict[str, Any]:
+    """Load the stored JSON schema of a connector stream.
+
+    The stream is resolved through the connector index, like `get_record_model`, and
+    its schema is read from the JSON file stored next to the record model.
+
+    Args:
+        connector: The connector name (e.g., "source-xkcd")
+        stream: The stream name (e.g., "xkcd"), matched exactly first, then
+            case-insensitively
+
+    Returns:
+        The stream's JSON schema
+
+    Raises:
+        ValueError: If no schema exists for the connector stream
+    """
+    name = resolve_stream(connector, stream)
+    if name is not None:
+        module, _ = RECORD_MODELS[connector][name]
+        schema_file = resources.files(module.rpartition(".")[0]).joinpath(f"{name}.json")
+        if schema_file.is_file():
+            return json.loads(schema_file.read_text())
+    raise ValueError(f"No record schema found for stream {stream!r} of {connector!r}")
+
+
+@cache
+def compile_validator(connector: str, stream: str) -> Callable[[Any], bool]:
+    """Build (and cache) the accept/reject validator of a connector stream.
+
+    Example:
+        is_valid = compile_validator("source-airbyte", "Jobs")
+        accepted = [record for record in records if is_valid(record)]
+
+    Args:
+        connector: The connector name (e.g., "source-xkcd")
+        stream: The stream name (e.g., "xkcd")
+
+    Returns:
+        A function returning True if a decoded JSON record conforms to the stream's
+        schema (types, nullability and required properties only)
+
+    Raises:
+        ValueError: If no schema exists for the connector stream
+    """
+    return compile_schema(load_record_schema(connector, stream))
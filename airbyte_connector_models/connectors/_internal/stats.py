@@ -0,0 +1,371 @@
+"""Opt-in per-model validation statistics for generated record and config models.
+
+Instrumentation is off by default and costs nothing until enabled: `enable_stats`
+installs timing wrappers on `BaseRecordModel` and `BaseConfig` for every validation
+entry point:
+
+- `model_validate` and `model_validate_json`, and therefore `from_dict`, `from_json`
+  and `iter_jsonl`
+- direct construction (`Model(**data)`)
+- the batch methods `validate_many`, `validate_many_json` and `validate_collect`,
+  which count one validation per row
+
+It also counts the rows built by `from_trusted` / `from_trusted_many` (which do not
+validate) and wraps the extra-property `__getattr__` of records. `disable_stats`
+removes the wrappers again. Statistics are attributed to the class that validation was
+invoked on; nested sub-models validated as part of a parent are not counted separately.
+Latency samples of a batch are its duration divided by its number of rows.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any, NamedTuple
+
+from pydantic import BaseModel, ValidationError
+
+from airbyte_connector_models.connectors._internal.base_config import BaseConfig
+from airbyte_connector_models.connectors._internal.base_record import BaseRecordModel
+
+# Number of most recent latency samples kept per class for percentile estimates.
+LATENCY_SAMPLES = 10_000
+
+_BASES = (BaseRecordModel, BaseConfig)
+_model_validate = BaseModel.model_validate.__func__  # type: ignore[attr-defined]
+_model_validate_json = BaseModel.model_validate_json.__func__  # type: ignore[attr-defined]
+_model_init = BaseModel.__init__
+_record_getattr = BaseRecordModel.__getattr__
+_validate_many = BaseRecordModel.validate_many.__func__  # type: ignore[attr-defined]
+_validate_many_json = BaseRecordModel.validate_many_json.__func__  # type: ignore[attr-defined]
+_validate_collect = BaseRecordModel.validate_collect.__func__  # type: ignore[attr-defined]
+_from_trusted = BaseRecordModel.from_trusted.__func__  # type: ignore[attr-defined]
+_from_trusted_many = BaseRecordModel.from_trusted_many.__func__  # type: ignore[attr-defined]
+
+_RECORD_METHODS = (
+    "validate_many",
+    "validate_many_json",
+    "validate_collect",
+    "from_trusted",
+    "from_trusted_many",
+)
+
+_lock = threading.Lock()
+_enabled = False
+
+
+class ModelStats(NamedTuple):
+    """Snapshot of the statistics collected for one model class.
+
+    Latencies are in seconds; percentiles are computed over the most recent
+    `LATENCY_SAMPLES` validations.
+    """
+
+    model: str
+    validations: int
+    failures: int
+    mean_latency: float
+    p50_latency: float
+    p95_latency: float
+    p99_latency: float
+    extras_hits: int
+    extras_misses: int
+    bytes_parsed: int
+    trusted_constructions: int
+
+    @property
+    def extras_hit_rate(self) -> float:
+        """Fraction of `__getattr__` lookups that resolved to an extra property."""
+        lookups = self.extras_hits + self.extras_misses
+        return self.extras_hits / lookups if lookups else 0.0
+
+
+class _Counters:
+    """Mutable per-class counters, updated under `_lock`."""
+
+    __slots__ = (
+        "bytes_parsed",
+        "extras_hits",
+        "extras_misses",
+        "failures",
+        "latencies",
+        "total_ns",
+        "trusted_constructions",
+        "validations",
+    )
+
+    def __init__(self) -> None:
+        self.validations = 0
+        self.failures = 0
+        self.total_ns = 0
+        self.latencies: deque[int] = deque(maxlen=LATENCY_SAMPLES)
+        self.extras_hits = 0
+        self.extras_misses = 0
+        self.bytes_parsed = 0
+        self.trusted_constructions = 0
+
+    def snapshot(self, model: type) -> ModelStats:
+        samples = sorted(self.latencies)
+
+        def percentile(q: float) -> float:
+            if not samples:
+                return 0.0
+            return samples[min(len(samples) - 1, int(q * len(samples)))] / 1e9
+
+        return ModelStats(
+            model=f"{model.__module__}.{model.__qualname__}",
+            validations=self.validations,
+            failures=self.failures,
+            mean_latency=self.total_ns / self.validations / 1e9 if self.validations else 0.0,
+            p50_latency=percentile(0.50),
+            p95_latency=percentile(0.95),
+            p99_latency=percentile(0.99),
+            extras_hits=self.extras_hits,
+            extras_misses=self.extras_misses,
+            bytes_parsed=self.bytes_parsed,
+            trusted_constructions=self.trusted_constructions,
+        )
+
+
+_counters: dict[type, _Counters] = {}
+
+
+def _counters_for(model: type) -> _Counters:
+    counters = _counters.get(model)
+    if counters is None:
+        counters = _counters.setdefault(model, _Counters())
+    return counters
+
+
+def _record_validation(
+    model: type, elapsed_ns: int, failures: int, size: int = 0, rows: int = 1
+) -> None:
+    with _lock:
+        counters = _counters_for(model)
+        counters.validations += rows
+        counters.failures += failures
+        counters.total_ns += elapsed_ns
+        counters.latencies.append(elapsed_ns // max(rows, 1))
+        counters.bytes_parsed += size
+
+
+def _json_size(json_data: str | bytes | bytearray) -> int:
+    return len(json_data.encode()) if isinstance(json_data, str) else len(json_data)
+
+
+def _failed_rows(error: ValidationError) -> int:
+    """Count the distinct rows of a batch that an error reports on."""
+    rows = {location[0] for location in (e["loc"] for e in error.errors()) if location}
+    return len(rows) or 1
+
+
+@classmethod  # type: ignore[misc]
+def _timed_model_validate(cls: type[BaseModel], obj: Any, **kwargs: Any) -> Any:
+    start = time.perf_counter_ns()
+    failed = True
+    try:
+        result = _model_validate(cls, obj, **kwargs)
+        failed = False
+        return result
+    finally:
+        _record_validation(cls, time.perf_counter_ns() - start, failed)
+
+
+@classmethod  # type: ignore[misc]
+def _timed_model_validate_json(
+    cls: type[BaseModel], json_data: str | bytes | bytearray, **kwargs: Any
+) -> Any:
+    start = time.perf_counter_ns()
+    failed = True
+    try:
+        result = _model_validate_json(cls, json_data, **kwargs)
+        failed = False
+        return result
+    finally:
+        _record_validation(cls, time.perf_counter_ns() - start, failed, _json_size(json_data))
+
+
+def _timed_init(self: BaseModel, /, **data: Any) -> None:
+    start = time.perf_counter_ns()
+    failed = True
+    try:
+        _model_init(self, **data)
+        failed = False
+    finally:
+        _record_validation(type(self), time.perf_counter_ns() - start, failed)
+
+
+# Keeps pydantic treating the wrapper as its own `__init__` in models created while
+# statistics are enabled, so `model_validate` does not route through it as well.
+_timed_init.__pydantic_base_init__ = True  # type: ignore[attr-defined]
+
+
+@classmethod  # type: ignore[misc]
+def _timed_validate_many(cls: type[BaseRecordModel], records: Any) -> Any:
+    rows = records if isinstance(records, list) else list(records)
+    start = time.perf_counter_ns()
+    failures = 0
+    try:
+        return _validate_many(cls, rows)
+    except ValidationError as e:
+        failures = _failed_rows(e)
+        raise
+    finally:
+        _record_validation(cls, time.perf_counter_ns() - start, failures, rows=len(rows))
+
+
+@classmethod  # type: ignore[misc]
+def _timed_validate_many_json(cls: type[BaseRecordModel], json_data: str | bytes) -> Any:
+    start = time.perf_counter_ns()
+    failures = rows = 0
+    try:
+        result = _validate_many_json(cls, json_data)
+    except ValidationError as e:
+        # The rows that did validate are unknown once the batch has failed.
+        failures = rows = _failed_rows(e)
+        raise
+    else:
+        rows = len(result)
+        return result
+    finally:
+        elapsed = time.perf_counter_ns() - start
+        _record_validation(cls, elapsed, failures, _json_size(json_data), rows)
+
+
+@classmethod  # type: ignore[misc]
+def _timed_validate_collect(cls: type[BaseRecordModel], records: Any) -> Any:
+    start = time.perf_counter_ns()
+    report = _validate_collect(cls, records)
+    _record_validation(
+        cls,
+        time.perf_counter_ns() - start,
+        len(report.invalid_indices),
+        rows=report.num_rows,
+    )
+    return report
+
+
+def _count_trusted(model: type, rows: int) -> None:
+    with _lock:
+        _counters_for(model).trusted_constructions += rows
+
+
+@classmethod  # type: ignore[misc]
+def _counting_from_trusted(cls: type[BaseRecordModel], data: dict[str, Any]) -> Any:
+    result = _from_trusted(cls, data)
+    _count_trusted(cls, 1)
+    return result
+
+
+@classmethod  # type: ignore[misc]
+def _counting_from_trusted_many(cls: type[BaseRecordModel], records: Any) -> Any:
+    result = _from_trusted_many(cls, records)
+    _count_trusted(cls, len(result))
+    return result
+
+
+def _counting_getattr(self: BaseRecordModel, name: str) -> Any:
+    try:
+        value = _record_getattr(self, name)
+    except AttributeError:
+        if name != "__pydantic_extra__":
+            with _lock:
+                _counters_for(type(self)).extras_misses += 1
+        raise
+    with _lock:
+        _counters_for(type(self)).extras_hits += 1
+    return value
+
+
+def stats_enabled() -> bool:
+    """Return whether statistics are currently being collected."""
+    return _enabled
+
+
+def enable_stats() -> None:
+    """Start collecting statistics for all record and config models."""
+    global _enabled  # noqa: PLW0603
+    for base in _BASES:
+        base.model_validate = _timed_model_validate  # type: ignore[method-assign]
+        base.model_validate_json = _timed_model_validate_json  # type: ignore[method-assign]
+        base.__init__ = _timed_init  # type: ignore[method-assign]
+    BaseRecordModel.validate_many = _timed_validate_many  # type: ignore[method-assign]
+    BaseRecordModel.validate_many_json = _timed_validate_many_json  # type: ignore[method-assign]
+    BaseRecordModel.validate_collect = _timed_validate_collect  # type: ignore[method-assign]
+    BaseRecordModel.from_trusted = _counting_from_trusted  # type: ignore[method-assign]
+    BaseRecordModel.from_trusted_many = _counting_from_trusted_many  # type: ignore[method-assign]
+    BaseRecordModel.__getattr__ = _counting_getattr  # type: ignore[method-assign]
+    _enabled = True
+
+
+def disable_stats() -> None:
+    """Stop collecting statistics; collected values are kept until `reset_stats`."""
+    global _enabled  # noqa: PLW0603
+    for base in _BASES:
+        for name in ("model_validate", "model_validate_json", "__init__"):
+            if name in base.__dict__:
+                delattr(base, name)
+    BaseRecordModel.validate_many = classmethod(_validate_many)  # type: ignore[method-assign]
+    BaseRecordModel.validate_many_json = classmethod(_validate_many_json)  # type: ignore[method-assign]
+    BaseRecordModel.validate_collect = classmethod(_validate_collect)  # type: ignore[method-assign]
+    BaseRecordModel.from_trusted = classmethod(_from_trusted)  # type: ignore[method-assign]
+    BaseRecordModel.from_trusted_many = classmethod(_from_trusted_many)  # type: ignore[method-assign]
+    BaseRecordModel.__getattr__ = _record_getattr  # type: ignore[method-assign]
+    _enabled = False
+
+
+def reset_stats() -> None:
+    """Discard all collected statistics."""
+    with _lock:
+        _counters.clear()
+
+
+def stats_snapshot(model: type | None = None) -> dict[type, ModelStats]:
+    """Return the statistics collected so far, per model class.
+
+    Args:
+        model: Only include this class (defaults to every class with statistics)
+
+    Returns:
+        A dict mapping model classes to a `ModelStats` snapshot, busiest first
+    """
+    with _lock:
+        snapshot = {
+            cls: counters.snapshot(cls)
+            for cls, counters in _counters.items()
+            if model is None or cls is model
+        }
+    return dict(sorted(snapshot.items(), key=lambda item: -item[1].validations))
+
+
+@contextmanager
+def collect_stats(*, reset: bool = True) -> Iterator[dict[type, ModelStats]]:
+    """Collect statistics for the duration of a `with` block.
+
+    The yielded dict is filled with a snapshot when the block exits.
+
+    Example:
+        with collect_stats() as stats:
+            run_sync()
+        slowest = max(stats.values(), key=lambda s: s.p99_latency)
+
+    Args:
+        reset: Discard previously collected statistics on entry
+
+    Yields:
+        A dict that receives the `stats_snapshot()` taken on exit
+    """
+    was_enabled = _enabled
+    if reset:
+        reset_stats()
+    enable_stats()
+    result: dict[type, ModelStats] = {}
+    try:
+        yield result
+    finally:
+        if not was_enabled:
+            disable_stats()
+        result.update(stats_snapshot())
@@ -0,0 +1,48 @@
+"""Ahead-of-time building of deferred pydantic schemas."""
+
+from __future__ import annotations
+
+import importlib
+import inspect
+from types import ModuleType
+
+from pydantic import BaseModel
+
+
+def _models_in(module: ModuleType) -> list[type[BaseModel]]:
+    """Return the pydantic models defined (not imported) in a module, once per class."""
+    models = {
+        obj: None
+        for _, obj in inspect.getmembers(module, inspect.isclass)
+        if issubclass(obj, BaseModel) and obj.__module__ == module.__name__
+    }
+    return list(models)
+
+
+def warm_up(*targets: type[BaseModel] | ModuleType | str) -> int:
+    """Build the schemas of deferred models now instead of on first use.
+
+    Models generated with deferred building (and models whose forward references were
+    unresolved at import) build their validator the first time they are used. Call this
+    at startup, or before forking workers, to move that cost out of the request path.
+
+    Example:
+        warm_up("airbyte_connector_models.connectors.pokeapi.source.configuration")
+        warm_up(PokeapiPokemonRecord)
+
+    Args:
+        targets: Model classes, modules, or dotted module names; for a module every
+            model defined in it is built
+
+    Returns:
+        The number of models that were built (already-built models are not counted)
+    """
+    built = 0
+    for target in targets:
+        module = importlib.import_module(target) if isinstance(target, str) else target
+        models = _models_in(module) if isinstance(module, ModuleType) else [module]
+        for model in models:
+            if not model.__pydantic_complete__:
+                model.model_rebuild()
+                built += 1
+    return built
@@ -19,89 +19,59 @@ class AirbyteWorkspacesRecord(BaseRecordModel):
 
 
 class AirbyteWorkspacesRecordNotifications(BaseRecordModel):
-    connectionUpdate: AirbyteWorkspacesRecordNotificationsConnectionUpdate | None = None
-    connectionUpdateActionRequired: (
-        AirbyteWorkspacesRecordNotificationsConnectionUpdateActionRequired | None
-    ) = None
-    failure: AirbyteWorkspacesRecordNotificationsFailure | None = None
-    success: AirbyteWorkspacesRecordNotificationsSuccess | None = None
-    syncDisabled: AirbyteWorkspacesRecordNotificationsSyncDisabled | None = None
-    syncDisabledWarning: AirbyteWorkspacesRecordNotificationsSyncDisabledWarning | None = None
+    connectionUpdate: AirbyteWorkspacesRecordNotificationsEmailWebhook | None = None
+    connectionUpdateActionRequired: AirbyteWorkspacesRecordNotificationsEmailWebhook | None = None
+    failure: AirbyteWorkspacesRecordNotificationsEmailWebhook | None = None
+    success: AirbyteWorkspacesRecordNotificationsEmailWebhook | None = None
+    syncDisabled: AirbyteWorkspacesRecordNotificationsEmailWebhook | None = None
+    syncDisabledWarning: AirbyteWorkspacesRecordNotificationsEmailWebhook | None = None
 
 
-class AirbyteWorkspacesRecordNotificationsConnectionUpdate(BaseRecordModel):
-    email: AirbyteWorkspacesRecordNotificationsConnectionUpdateEmail | None = None
-    webhook: AirbyteWorkspacesRecordNotificationsConnectionUpdateWebhook | None = None
+class AirbyteWorkspacesRecordNotificationsEmailWebhook(BaseRecordModel):
+    email: AirbyteWorkspacesRecordNotificationsEnabled | None = None
+    webhook: AirbyteWorkspacesRecordNotificationsEnabled | None = None
 
 
-class AirbyteWorkspacesRecordNotificationsConnectionUpdateActionRequired(BaseRecordModel):
-    email: AirbyteWorkspacesRecordNotificationsConnectionUpdateActionRequiredEmail | None = None
-    webhook: AirbyteWorkspacesRecordNotificationsConnectionUpdateActionRequiredWebhook | None = None
-
-
-class AirbyteWorkspacesRecordNotificationsConnectionUpdateActionRequiredEmail(BaseRecordModel):
-    enabled: bool | None = None
-
-
-class AirbyteWorkspacesRecordNotificationsConnectionUpdateActionRequiredWebhook(BaseRecordModel):
-    enabled: bool | None = None
-
-
-class AirbyteWorkspacesRecordNotificationsConnectionUpdateEmail(BaseRecordModel):
-    enabled: bool | None = None
-
-
-class AirbyteWorkspacesRecordNotificationsConnectionUpdateWebhook(BaseRecordModel):
+class AirbyteWorkspacesRecordNotificationsEnabled(BaseRecordModel):
     enabled: bool | None = None
 
 
-class AirbyteWorkspacesRecordNotificationsFailure(BaseRecordModel):
-    email: AirbyteWorkspacesRecordNotificationsFailureEmail | None = None
-    webhook: AirbyteWorkspacesRecordNotificationsFailureWebhook | None = None
-
-
-class AirbyteWorkspacesRecordNotificationsFailureEmail(BaseRecordModel):
-    enabled: bool | None = None
-
-
-class AirbyteWorkspacesRecordNotificationsFailureWebhook(BaseRecordModel):
-    enabled: bool | None = None
-
-
-class AirbyteWorkspacesRecordNotificationsSuccess(BaseRecordModel):
-    email: AirbyteWorkspacesRecordNotificationsSuccessEmail | None = None
-    webhook: AirbyteWorkspacesRecordNotificationsSuccessWebhook | None = None
-
-
-class AirbyteWorkspacesRecordNotificationsSuccessEmail(BaseRecordModel):
-    enabled: bool | None = None
-
-
-class AirbyteWorkspacesRecordNotificationsSuccessWebhook(BaseRecordModel):
-    enabled: bool | None = None
-
-
-class AirbyteWorkspacesRecordNotificationsSyncDisabled(BaseRecordModel):
-    email: AirbyteWorkspacesRecordNotificationsSyncDisabledEmail | None = None
-    webhook: AirbyteWorkspacesRecordNotificationsSyncDisabledWebhook | None = None
-
-
-class AirbyteWorkspacesRecordNotificationsSyncDisabledEmail(BaseRecordModel):
-    enabled: bool | None = None
-
-
-class AirbyteWorkspacesRecordNotificationsSyncDisabledWarning(BaseRecordModel):
-    email: AirbyteWorkspacesRecordNotificationsSyncDisabledWarningEmail | None = None
-    webhook: AirbyteWorkspacesRecordNotificationsSyncDisabledWarningWebhook | None = None
-
-
-class AirbyteWorkspacesRecordNotificationsSyncDisabledWarningEmail(BaseRecordModel):
-    enabled: bool | None = None
-
-
-class AirbyteWorkspacesRecordNotificationsSyncDisabledWarningWebhook(BaseRecordModel):
-    enabled: bool | None = None
-
-
-class AirbyteWorkspacesRecordNotificationsSyncDisabledWebhook(BaseRecordModel):
-    enabled: bool | None = None
+# Generated names of the shared classes, kept so existing imports keep working.
+AirbyteWorkspacesRecordNotificationsConnectionUpdate = (
+    AirbyteWorkspacesRecordNotificationsEmailWebhook
+)
+AirbyteWorkspacesRecordNotificationsConnectionUpdateActionRequired = (
+    AirbyteWorkspacesRecordNotificationsEmailWebhook
+)
+AirbyteWorkspacesRecordNotificationsConnectionUpdateActionRequiredEmail = (
+    AirbyteWorkspacesRecordNotificationsEnabled
+)
+AirbyteWorkspacesRecordNotificationsConnectionUpdateActionRequiredWebhook = (
+    AirbyteWorkspacesRecordNotificationsEnabled
+)
+AirbyteWorkspacesRecordNotificationsConnectionUpdateEmail = (
+    AirbyteWorkspacesRecordNotificationsEnabled
+)
+AirbyteWorkspacesRecordNotificationsConnectionUpdateWebhook = (
+    AirbyteWorkspacesRecordNotificationsEnabled
+)
+AirbyteWorkspacesRecordNotificationsFailure = AirbyteWorkspacesRecordNotificationsEmailWebhook
+AirbyteWorkspacesRecordNotificationsFailureEmail = AirbyteWorkspacesRecordNotificationsEnabled
+AirbyteWorkspacesRecordNotificationsFailureWebhook = AirbyteWorkspacesRecordNotificationsEnabled
+AirbyteWorkspacesRecordNotificationsSuccess = AirbyteWorkspacesRecordNotificationsEmailWebhook
+AirbyteWorkspacesRecordNotificationsSuccessEmail = AirbyteWorkspacesRecordNotificationsEnabled
+AirbyteWorkspacesRecordNotificationsSuccessWebhook = AirbyteWorkspacesRecordNotificationsEnabled
+AirbyteWorkspacesRecordNotificationsSyncDisabled = AirbyteWorkspacesRecordNotificationsEmailWebhook
+AirbyteWorkspacesRecordNotificationsSyncDisabledEmail = AirbyteWorkspacesRecordNotificationsEnabled
+AirbyteWorkspacesRecordNotificationsSyncDisabledWarning = (
+    AirbyteWorkspacesRecordNotificationsEmailWebhook
+)
+AirbyteWorkspacesRecordNotificationsSyncDisabledWarningEmail = (
+    AirbyteWorkspacesRecordNotificationsEnabled
+)
+AirbyteWorkspacesRecordNotificationsSyncDisabledWarningWebhook = (
+    AirbyteWorkspacesRecordNotificationsEnabled
+)
+AirbyteWorkspacesRecordNotificationsSyncDisabledWebhook = (
+    AirbyteWorkspacesRecordNotificationsEnabled
+)
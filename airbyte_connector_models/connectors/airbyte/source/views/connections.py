@@ -0,0 +1,214 @@
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+
+"""Read-only views of the record models in `connections`.
+
+Generated from the record models; do not edit by hand.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from airbyte_connector_models.connectors._internal.record_view import RecordView
+
+_new = object.__new__
+_set = object.__setattr__
+
+
+class AirbyteConnectionsRecordView(RecordView):
+    """Read-only view of `AirbyteConnectionsRecord`."""
+
+    __slots__ = (
+        "configurations",
+        "connectionId",
+        "createdAt",
+        "dataResidency",
+        "destinationId",
+        "name",
+        "namespaceDefinition",
+        "namespaceFormat",
+        "nonBreakingSchemaUpdatesBehavior",
+        "prefix",
+        "schedule",
+        "sourceId",
+        "status",
+        "tags",
+        "workspaceId",
+    )
+    _aliases = (
+        "configurations",
+        "connectionId",
+        "createdAt",
+        "dataResidency",
+        "destinationId",
+        "name",
+        "namespaceDefinition",
+        "namespaceFormat",
+        "nonBreakingSchemaUpdatesBehavior",
+        "prefix",
+        "schedule",
+        "sourceId",
+        "status",
+        "tags",
+        "workspaceId",
+    )
+
+    configurations: AirbyteConnectionsRecordConfigurationsView | None
+    connectionId: str
+    createdAt: float | None
+    dataResidency: str | None
+    destinationId: str | None
+    name: str | None
+    namespaceDefinition: str | None
+    namespaceFormat: str | None
+    nonBreakingSchemaUpdatesBehavior: str | None
+    prefix: str | None
+    schedule: AirbyteConnectionsRecordScheduleView | None
+    sourceId: str | None
+    status: str | None
+    tags: tuple[Any, ...] | None
+    workspaceId: str | None
+
+    @classmethod
+    def from_validated_dict(cls, data: dict[str, Any]) -> AirbyteConnectionsRecordView:
+        """Build a view from a record dict that has already passed validation."""
+        view = _new(cls)
+        get = data.get
+        value = get("configurations")
+        if value is not None:
+            value = AirbyteConnectionsRecordConfigurationsView.from_validated_dict(value)
+        _set(view, "configurations", value)
+        _set(view, "connectionId", get("connectionId"))
+        _set(view, "createdAt", get("createdAt"))
+        _set(view, "dataResidency", get("dataResidency"))
+        _set(view, "destinationId", get("destinationId"))
+        _set(view, "name", get("name"))
+        _set(view, "namespaceDefinition", get("namespaceDefinition"))
+        _set(view, "namespaceFormat", get("namespaceFormat"))
+        _set(view, "nonBreakingSchemaUpdatesBehavior", get("nonBreakingSchemaUpdatesBehavior"))
+        _set(view, "prefix", get("prefix"))
+        value = get("schedule")
+        if value is not None:
+            value = AirbyteConnectionsRecordScheduleView.from_validated_dict(value)
+        _set(view, "schedule", value)
+        _set(view, "sourceId", get("sourceId"))
+        _set(view, "status", get("status"))
+        value = get("tags")
+        if value is not None:
+            value = tuple(value)
+        _set(view, "tags", value)
+        _set(view, "workspaceId", get("workspaceId"))
+        return view
+
+
+class AirbyteConnectionsRecordConfigurationsView(RecordView):
+    """Read-only view of `AirbyteConnectionsRecordConfigurations`."""
+
+    __slots__ = ("streams",)
+    _aliases = ("streams",)
+
+    streams: tuple[AirbyteConnectionsRecordConfigurationsStreamView | None, ...] | None
+
+    @classmethod
+    def from_validated_dict(
+        cls, data: dict[str, Any]
+    ) -> AirbyteConnectionsRecordConfigurationsView:
+        """Build a view from a record dict that has already passed validation."""
+        view = _new(cls)
+        get = data.get
+        value = get("streams")
+        if value is not None:
+            value = tuple(
+                (
+                    None
+                    if item0 is None
+                    else AirbyteConnectionsRecordConfigurationsStreamView.from_validated_dict(item0)
+                )
+                for item0 in value
+            )
+        _set(view, "streams", value)
+        return view
+
+
+class AirbyteConnectionsRecordConfigurationsStreamView(RecordView):
+    """Read-only view of `AirbyteConnectionsRecordConfigurationsStream`."""
+
+    __slots__ = (
+        "cursorField",
+        "mappers",
+        "name",
+        "primaryKey",
+        "selectedFields",
+        "syncMode",
+    )
+    _aliases = (
+        "cursorField",
+        "mappers",
+        "name",
+        "primaryKey",
+        "selectedFields",
+        "syncMode",
+    )
+
+    cursorField: tuple[str | None, ...] | None
+    mappers: tuple[Any, ...] | None
+    name: str | None
+    primaryKey: tuple[tuple[str | None, ...], ...] | None
+    selectedFields: tuple[Any, ...] | None
+    syncMode: str | None
+
+    @classmethod
+    def from_validated_dict(
+        cls, data: dict[str, Any]
+    ) -> AirbyteConnectionsRecordConfigurationsStreamView:
+        """Build a view from a record dict that has already passed validation."""
+        view = _new(cls)
+        get = data.get
+        value = get("cursorField")
+        if value is not None:
+            value = tuple(value)
+        _set(view, "cursorField", value)
+        value = get("mappers")
+        if value is not None:
+            value = tuple(value)
+        _set(view, "mappers", value)
+        _set(view, "name", get("name"))
+        value = get("primaryKey")
+        if value is not None:
+            value = tuple(None if item0 is None else tuple(item0) for item0 in value)
+        _set(view, "primaryKey", value)
+        value = get("selectedFields")
+        if value is not None:
+            value = tuple(value)
+        _set(view, "selectedFields", value)
+        _set(view, "syncMode", get("syncMode"))
+        return view
+
+
+class AirbyteConnectionsRecordScheduleView(RecordView):
+    """Read-only view of `AirbyteConnectionsRecordSchedule`."""
+
+    __slots__ = (
+        "basicTiming",
+        "cronExpression",
+        "scheduleType",
+    )
+    _aliases = (
+        "basicTiming",
+        "cronExpression",
+        "scheduleType",
+    )
+
+    basicTiming: str | None
+    cronExpression: str | None
+    scheduleType: str | None
+
+    @classmethod
+    def from_validated_dict(cls, data: dict[str, Any]) -> AirbyteConnectionsRecordScheduleView:
+        """Build a view from a record dict that has already passed validation."""
+        view = _new(cls)
+        get = data.get
+        _set(view, "basicTiming", get("basicTiming"))
+        _set(view, "cronExpression", get("cronExpression"))
+        _set(view, "scheduleType", get("scheduleType"))
+        return view
@@ -0,0 +1,68 @@
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+
+"""Read-only views of the record models in `jobs`.
+
+Generated from the record models; do not edit by hand.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from airbyte_connector_models.connectors._internal.record_view import RecordView
+
+_new = object.__new__
+_set = object.__setattr__
+
+
+class AirbyteJobsRecordView(RecordView):
+    """Read-only view of `AirbyteJobsRecord`."""
+
+    __slots__ = (
+        "bytesSynced",
+        "connectionId",
+        "duration",
+        "jobId",
+        "jobType",
+        "lastUpdatedAt",
+        "rowsSynced",
+        "startTime",
+        "status",
+    )
+    _aliases = (
+        "bytesSynced",
+        "connectionId",
+        "duration",
+        "jobId",
+        "jobType",
+        "lastUpdatedAt",
+        "rowsSynced",
+        "startTime",
+        "status",
+    )
+
+    bytesSynced: float | None
+    connectionId: str | None
+    duration: str | None
+    jobId: float
+    jobType: str | None
+    lastUpdatedAt: str
+    rowsSynced: float | None
+    startTime: str | None
+    status: str | None
+
+    @classmethod
+    def from_validated_dict(cls, data: dict[str, Any]) -> AirbyteJobsRecordView:
+        """Build a view from a record dict that has already passed validation."""
+        view = _new(cls)
+        get = data.get
+        _set(view, "bytesSynced", get("bytesSynced"))
+        _set(view, "connectionId", get("connectionId"))
+        _set(view, "duration", get("duration"))
+        _set(view, "jobId", get("jobId"))
+        _set(view, "jobType", get("jobType"))
+        _set(view, "lastUpdatedAt", get("lastUpdatedAt"))
+        _set(view, "rowsSynced", get("rowsSynced"))
+        _set(view, "startTime", get("startTime"))
+        _set(view, "status", get("status"))
+        return view
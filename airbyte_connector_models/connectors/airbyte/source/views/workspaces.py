@@ -0,0 +1,218 @@
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+
+"""Read-only views of the record models in `workspaces`.
+
+Generated from the record models; do not edit by hand.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from airbyte_connector_models.connectors._internal.record_view import RecordView
+
+_new = object.__new__
+_set = object.__setattr__
+
+
+class AirbyteWorkspacesRecordView(RecordView):
+    """Read-only view of `AirbyteWorkspacesRecord`."""
+
+    __slots__ = (
+        "dataResidency",
+        "name",
+        "notifications",
+        "workspaceId",
+    )
+    _aliases = (
+        "dataResidency",
+        "name",
+        "notifications",
+        "workspaceId",
+    )
+
+    dataResidency: str | None
+    name: str | None
+    notifications: AirbyteWorkspacesRecordNotificationsView | None
+    workspaceId: str
+
+    @classmethod
+    def from_validated_dict(cls, data: dict[str, Any]) -> AirbyteWorkspacesRecordView:
+        """Build a view from a record dict that has already passed validation."""
+        view = _new(cls)
+        get = data.get
+        _set(view, "dataResidency", get("dataResidency"))
+        _set(view, "name", get("name"))
+        value = get("notifications")
+        if value is not None:
+            value = AirbyteWorkspacesRecordNotificationsView.from_validated_dict(value)
+        _set(view, "notifications", value)
+        _set(view, "workspaceId", get("workspaceId"))
+        return view
+
+
+class AirbyteWorkspacesRecordNotificationsView(RecordView):
+    """Read-only view of `AirbyteWorkspacesRecordNotifications`."""
+
+    __slots__ = (
+        "connectionUpdate",
+        "connectionUpdateActionRequired",
+        "failure",
+        "success",
+        "syncDisabled",
+        "syncDisabledWarning",
+    )
+    _aliases = (
+        "connectionUpdate",
+        "connectionUpdateActionRequired",
+        "failure",
+        "success",
+        "syncDisabled",
+        "syncDisabledWarning",
+    )
+
+    connectionUpdate: AirbyteWorkspacesRecordNotificationsEmailWebhookView | None
+    connectionUpdateActionRequired: AirbyteWorkspacesRecordNotificationsEmailWebhookView | None
+    failure: AirbyteWorkspacesRecordNotificationsEmailWebhookView | None
+    success: AirbyteWorkspacesRecordNotificationsEmailWebhookView | None
+    syncDisabled: AirbyteWorkspacesRecordNotificationsEmailWebhookView | None
+    syncDisabledWarning: AirbyteWorkspacesRecordNotificationsEmailWebhookView | None
+
+    @classmethod
+    def from_validated_dict(cls, data: dict[str, Any]) -> AirbyteWorkspacesRecordNotificationsView:
+        """Build a view from a record dict that has already passed validation."""
+        view = _new(cls)
+        get = data.get
+        value = get("connectionUpdate")
+        if value is not None:
+            value = AirbyteWorkspacesRecordNotificationsEmailWebhookView.from_validated_dict(value)
+        _set(view, "connectionUpdate", value)
+        value = get("connectionUpdateActionRequired")
+        if value is not None:
+            value = AirbyteWorkspacesRecordNotificationsEmailWebhookView.from_validated_dict(value)
+        _set(view, "connectionUpdateActionRequired", value)
+        value = get("failure")
+        if value is not None:
+            value = AirbyteWorkspacesRecordNotificationsEmailWebhookView.from_validated_dict(value)
+        _set(view, "failure", value)
+        value = get("success")
+        if value is not None:
+            value = AirbyteWorkspacesRecordNotificationsEmailWebhookView.from_validated_dict(value)
+        _set(view, "success", value)
+        value = get("syncDisabled")
+        if value is not None:
+            value = AirbyteWorkspacesRecordNotificationsEmailWebhookView.from_validated_dict(value)
+        _set(view, "syncDisabled", value)
+        value = get("syncDisabledWarning")
+        if value is not None:
+            value = AirbyteWorkspacesRecordNotificationsEmailWebhookView.from_validated_dict(value)
+        _set(view, "syncDisabledWarning", value)
+        return view
+
+
+class AirbyteWorkspacesRecordNotificationsEmailWebhookView(RecordView):
+    """Read-only view of `AirbyteWorkspacesRecordNotificationsEmailWebhook`."""
+
+    __slots__ = (
+        "email",
+        "webhook",
+    )
+    _aliases = (
+        "email",
+        "webhook",
+    )
+
+    email: AirbyteWorkspacesRecordNotificationsEnabledView | None
+    webhook: AirbyteWorkspacesRecordNotificationsEnabledView | None
+
+    @classmethod
+    def from_validated_dict(
+        cls, data: dict[str, Any]
+    ) -> AirbyteWorkspacesRecordNotificationsEmailWebhookView:
+        """Build a view from a record dict that has already passed validation."""
+        view = _new(cls)
+        get = data.get
+        value = get("email")
+        if value is not None:
+            value = AirbyteWorkspacesRecordNotificationsEnabledView.from_validated_dict(value)
+        _set(view, "email", value)
+        value = get("webhook")
+        if value is not None:
+            value = AirbyteWorkspacesRecordNotificationsEnabledView.from_validated_dict(value)
+        _set(view, "webhook", value)
+        return view
+
+
+class AirbyteWorkspacesRecordNotificationsEnabledView(RecordView):
+    """Read-only view of `AirbyteWorkspacesRecordNotificationsEnabled`."""
+
+    __slots__ = ("enabled",)
+    _aliases = ("enabled",)
+
+    enabled: bool | None
+
+    @classmethod
+    def from_validated_dict(
+        cls, data: dict[str, Any]
+    ) -> AirbyteWorkspacesRecordNotificationsEnabledView:
+        """Build a view from a record dict that has already passed validation."""
+        view = _new(cls)
+        get = data.get
+        _set(view, "enabled", get("enabled"))
+        return view
+
+
+AirbyteWorkspacesRecordNotificationsConnectionUpdateView = (
+    AirbyteWorkspacesRecordNotificationsEmailWebhookView
+)
+AirbyteWorkspacesRecordNotificationsConnectionUpdateActionRequiredView = (
+    AirbyteWorkspacesRecordNotificationsEmailWebhookView
+)
+AirbyteWorkspacesRecordNotificationsConnectionUpdateActionRequiredEmailView = (
+    AirbyteWorkspacesRecordNotificationsEnabledView
+)
+AirbyteWorkspacesRecordNotificationsConnectionUpdateActionRequiredWebhookView = (
+    AirbyteWorkspacesRecordNotificationsEnabledView
+)
+AirbyteWorkspacesRecordNotificationsConnectionUpdateEmailView = (
+    AirbyteWorkspacesRecordNotificationsEnabledView
+)
+AirbyteWorkspacesRecordNotificationsConnectionUpdateWebhookView = (
+    AirbyteWorkspacesRecordNotificationsEnabledView
+)
+AirbyteWorkspacesRecordNotificationsFailureView = (
+    AirbyteWorkspacesRecordNotificationsEmailWebhookView
+)
+AirbyteWorkspacesRecordNotificationsFailureEmailView = (
+    AirbyteWorkspacesRecordNotificationsEnabledView
+)
+AirbyteWorkspacesRecordNotificationsFailureWebhookView = (
+    AirbyteWorkspacesRecordNotificationsEnabledView
+)
+AirbyteWorkspacesRecordNotificationsSuccessView = (
+    AirbyteWorkspacesRecordNotificationsEmailWebhookView
+)
+AirbyteWorkspacesRecordNotificationsSuccessEmailView = (
+    AirbyteWorkspacesRecordNotificationsEnabledView
+)
+AirbyteWorkspacesRecordNotificationsSuccessWebhookView = (
+    AirbyteWorkspacesRecordNotificationsEnabledView
+)
+AirbyteWorkspacesRecordNotificationsSyncDisabledView = (
+    AirbyteWorkspacesRecordNotificationsEmailWebhookView
+)
+AirbyteWorkspacesRecordNotificationsSyncDisabledEmailView = (
+    AirbyteWorkspacesRecordNotificationsEnabledView
+)
+AirbyteWorkspacesRecordNotificationsSyncDisabledWarningView = (
+    AirbyteWorkspacesRecordNotificationsEmailWebhookView
+)
+AirbyteWorkspacesRecordNotificationsSyncDisabledWarningEmailView = (
+    AirbyteWorkspacesRecordNotificationsEnabledView
+)
+AirbyteWorkspacesRecordNotificationsSyncDisabledWarningWebhookView = (
+    AirbyteWorkspacesRecordNotificationsEnabledView
+)
+AirbyteWorkspacesRecordNotificationsSyncDisabledWebhookView = (
+    AirbyteWorkspacesRecordNotificationsEnabledView
+)
@@ -0,0 +1,118 @@
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+
+"""Read-only views of the record models in `docker_hub`.
+
+Generated from the record models; do not edit by hand.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from airbyte_connector_models.connectors._internal.record_view import RecordView
+
+_new = object.__new__
+_set = object.__setattr__
+
+
+class DockerhubDockerHubRecordView(RecordView):
+    """Read-only view of `DockerhubDockerHubRecord`."""
+
+    __slots__ = (
+        "user",
+        "name",
+        "namespace",
+        "repository_type",
+        "status",
+        "description",
+        "is_private",
+        "is_automated",
+        "can_edit",
+        "star_count",
+        "pull_count",
+        "date_registered",
+        "status_description",
+        "content_types",
+        "media_types",
+        "last_updated",
+        "is_migrated",
+        "collaborator_count",
+        "affiliation",
+        "hub_user",
+    )
+    _aliases = (
+        "user",
+        "name",
+        "namespace",
+        "repository_type",
+        "status",
+        "description",
+        "is_private",
+        "is_automated",
+        "can_edit",
+        "star_count",
+        "pull_count",
+        "date_registered",
+        "status_description",
+        "content_types",
+        "media_types",
+        "last_updated",
+        "is_migrated",
+        "collaborator_count",
+        "affiliation",
+        "hub_user",
+    )
+
+    user: str | None
+    name: str | None
+    namespace: str | None
+    repository_type: str | None
+    status: int | None
+    description: str | None
+    is_private: bool | None
+    is_automated: bool | None
+    can_edit: bool | None
+    star_count: int | None
+    pull_count: int | None
+    date_registered: str | None
+    status_description: str | None
+    content_types: tuple[str | None, ...] | None
+    media_types: tuple[str | None, ...] | None
+    last_updated: str | None
+    is_migrated: bool | None
+    collaborator_count: int | None
+    affiliation: str | None
+    hub_user: str | None
+
+    @classmethod
+    def from_validated_dict(cls, data: dict[str, Any]) -> DockerhubDockerHubRecordView:
+        """Build a view from a record dict that has already passed validation."""
+        view = _new(cls)
+        get = data.get
+        _set(view, "user", get("user"))
+        _set(view, "name", get("name"))
+        _set(view, "namespace", get("namespace"))
+        _set(view, "repository_type", get("repository_type"))
+        _set(view, "status", get("status"))
+        _set(view, "description", get("description"))
+        _set(view, "is_private", get("is_private"))
+        _set(view, "is_automated", get("is_automated"))
+        _set(view, "can_edit", get("can_edit"))
+        _set(view, "star_count", get("star_count"))
+        _set(view, "pull_count", get("pull_count"))
+        _set(view, "date_registered", get("date_registered"))
+        _set(view, "status_description", get("status_description"))
+        value = get("content_types")
+        if value is not None:
+            value = tuple(value)
+        _set(view, "content_types", value)
+        value = get("media_types")
+        if value is not None:
+            value = tuple(value)
+        _set(view, "media_types", value)
+        _set(view, "last_updated", get("last_updated"))
+        _set(view, "is_migrated", get("is_migrated"))
+        _set(view, "collaborator_count", get("collaborator_count"))
+        _set(view, "affiliation", get("affiliation"))
+        _set(view, "hub_user", get("hub_user"))
+        return view
@@ -0,0 +1,68 @@
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+
+"""Read-only views of the record models in `executions`.
+
+Generated from the record models; do not edit by hand.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from airbyte_connector_models.connectors._internal.record_view import RecordView
+
+_new = object.__new__
+_set = object.__setattr__
+
+
+class N8nExecutionsRecordView(RecordView):
+    """Read-only view of `N8nExecutionsRecord`."""
+
+    __slots__ = (
+        "id",
+        "finished",
+        "mode",
+        "retryOf",
+        "retrySuccessId",
+        "startedAt",
+        "stoppedAt",
+        "workflowId",
+        "waitTill",
+    )
+    _aliases = (
+        "id",
+        "finished",
+        "mode",
+        "retryOf",
+        "retrySuccessId",
+        "startedAt",
+        "stoppedAt",
+        "workflowId",
+        "waitTill",
+    )
+
+    id: int | None
+    finished: bool | None
+    mode: str | None
+    retryOf: str | None
+    retrySuccessId: int | None
+    startedAt: str | None
+    stoppedAt: str | None
+    workflowId: str | None
+    waitTill: str | None
+
+    @classmethod
+    def from_validated_dict(cls, data: dict[str, Any]) -> N8nExecutionsRecordView:
+        """Build a view from a record dict that has already passed validation."""
+        view = _new(cls)
+        get = data.get
+        _set(view, "id", get("id"))
+        _set(view, "finished", get("finished"))
+        _set(view, "mode", get("mode"))
+        _set(view, "retryOf", get("retryOf"))
+        _set(view, "retrySuccessId", get("retrySuccessId"))
+        _set(view, "startedAt", get("startedAt"))
+        _set(view, "stoppedAt", get("stoppedAt"))
+        _set(view, "workflowId", get("workflowId"))
+        _set(view, "waitTill", get("waitTill"))
+        return view
@@ -14,7 +14,7 @@ class PokeapiPokemonRecord(BaseRecordModel):
     )
     abilities: list[PokeapiPokemonRecordAbility | None] | None = None
     base_experience: int | None = None
-    forms: list[PokeapiPokemonRecordForm | None] | None = None
+    forms: list[PokeapiPokemonRecordNameUrl | None] | None = None
     game_indices: list[PokeapiPokemonRecordGameIndice | None] | None = None
     height: int | None = None
     held_items: list[PokeapiPokemonRecordHeldItem | None] | None = None
@@ -25,7 +25,7 @@ class PokeapiPokemonRecord(BaseRecordModel):
     name: str | None = None
     order: int | None = None
     past_types: list[PokeapiPokemonRecordPastType | None] | None = None
-    species: PokeapiPokemonRecordSpecies | None = None
+    species: PokeapiPokemonRecordNameUrl | None = None
     sprites: PokeapiPokemonRecordSprites | None = None
     stats: list[PokeapiPokemonRecordStat | None] | None = None
     types: list[PokeapiPokemonRecordType | None] | None = None
@@ -36,20 +36,12 @@ class PokeapiPokemonRecordAbility(BaseRecordModel):
     model_config = ConfigDict(
         extra="allow",
     )
-    ability: PokeapiPokemonRecordAbilityAbility | None = None
+    ability: PokeapiPokemonRecordNameUrl | None = None
     is_hidden: bool | None = None
     slot: int | None = None
 
 
-class PokeapiPokemonRecordAbilityAbility(BaseRecordModel):
-    model_config = ConfigDict(
-        extra="allow",
-    )
-    name: str | None = None
-    url: str | None = None
-
-
-class PokeapiPokemonRecordForm(BaseRecordModel):
+class PokeapiPokemonRecordNameUrl(BaseRecordModel):
     model_config = ConfigDict(
         extra="allow",
     )
@@ -61,131 +53,59 @@ class PokeapiPokemonRecordGameIndice(BaseRecordModel):
     model_config = ConfigDict(
         extra="allow",
     )
-    version: PokeapiPokemonRecordGameIndiceVersion | None = None
+    version: PokeapiPokemonRecordNameUrl | None = None
     game_index: int | None = None
 
 
-class PokeapiPokemonRecordGameIndiceVersion(BaseRecordModel):
-    model_config = ConfigDict(
-        extra="allow",
-    )
-    name: str | None = None
-    url: str | None = None
-
-
 class PokeapiPokemonRecordHeldItem(BaseRecordModel):
     model_config = ConfigDict(
         extra="allow",
     )
-    item: PokeapiPokemonRecordHeldItemItem | None = None
+    item: PokeapiPokemonRecordNameUrl | None = None
     version_details: list[PokeapiPokemonRecordHeldItemVersionDetail | None] | None = None
 
 
-class PokeapiPokemonRecordHeldItemItem(BaseRecordModel):
-    model_config = ConfigDict(
-        extra="allow",
-    )
-    name: str | None = None
-    url: str | None = None
-
-
 class PokeapiPokemonRecordHeldItemVersionDetail(BaseRecordModel):
     model_config = ConfigDict(
         extra="allow",
     )
-    version: PokeapiPokemonRecordHeldItemVersionDetailVersion | None = None
+    version: PokeapiPokemonRecordNameUrl | None = None
     rarity: int | None = None
 
 
-class PokeapiPokemonRecordHeldItemVersionDetailVersion(BaseRecordModel):
-    model_config = ConfigDict(
-        extra="allow",
-    )
-    name: str | None = None
-    url: str | None = None
-
-
 class PokeapiPokemonRecordMove(BaseRecordModel):
     model_config = ConfigDict(
         extra="allow",
     )
-    move: PokeapiPokemonRecordMoveMove | None = None
+    move: PokeapiPokemonRecordNameUrl | None = None
     version_group_details: list[PokeapiPokemonRecordMoveVersionGroupDetail | None] | None = None
 
 
-class PokeapiPokemonRecordMoveMove(BaseRecordModel):
-    model_config = ConfigDict(
-        extra="allow",
-    )
-    name: str | None = None
-    url: str | None = None
-
-
 class PokeapiPokemonRecordMoveVersionGroupDetail(BaseRecordModel):
     model_config = ConfigDict(
         extra="allow",
     )
     level_learned_at: int | None = None
-    move_learn_method: PokeapiPokemonRecordMoveVersionGroupDetailMoveLearnMethod | None = None
-    version_group: PokeapiPokemonRecordMoveVersionGroupDetailVersionGroup | None = None
-
-
-class PokeapiPokemonRecordMoveVersionGroupDetailMoveLearnMethod(BaseRecordModel):
-    model_config = ConfigDict(
-        extra="allow",
-    )
-    name: str | None = None
-    url: str | None = None
-
-
-class PokeapiPokemonRecordMoveVersionGroupDetailVersionGroup(BaseRecordModel):
-    model_config = ConfigDict(
-        extra="allow",
-    )
-    name: str | None = None
-    url: str | None = None
+    move_learn_method: PokeapiPokemonRecordNameUrl | None = None
+    version_group: PokeapiPokemonRecordNameUrl | None = None
 
 
 class PokeapiPokemonRecordPastType(BaseRecordModel):
     model_config = ConfigDict(
         extra="allow",
     )
-    generation: PokeapiPokemonRecordPastTypeGeneration | None = None
+    generation: PokeapiPokemonRecordNameUrl | None = None
     types: list[PokeapiPokemonRecordPastTypeType | None] | None = None
 
 
-class PokeapiPokemonRecordPastTypeGeneration(BaseRecordModel):
-    model_config = ConfigDict(
-        extra="allow",
-    )
-    name: str | None = None
-    url: str | None = None
-
-
 class PokeapiPokemonRecordPastTypeType(BaseRecordModel):
     model_config = ConfigDict(
         extra="allow",
     )
-    type: PokeapiPokemonRecordPastTypeTypeType | None = None
+    type: PokeapiPokemonRecordNameUrl | None = None
     slot: int | None = None
 
 
-class PokeapiPokemonRecordPastTypeTypeType(BaseRecordModel):
-    model_config = ConfigDict(
-        extra="allow",
-    )
-    name: str | None = None
-    url: str | None = None
-
-
-class PokeapiPokemonRecordSpecies(BaseRecordModel):
-    model_config = ConfigDict(
-        extra="allow",
-    )
-    name: str | None = None
-    url: str | None = None
-
-
 class PokeapiPokemonRecordSprites(BaseRecordModel):
     model_config = ConfigDict(
         extra="allow",
@@ -206,15 +126,7 @@ class PokeapiPokemonRecordStat(BaseRecordModel):
     )
     base_stat: int | None = None
     effort: int | None = None
-    stat: PokeapiPokemonRecordStatStat | None = None
-
-
-class PokeapiPokemonRecordStatStat(BaseRecordModel):
-    model_config = ConfigDict(
-        extra="allow",
-    )
-    name: str | None = None
-    url: str | None = None
+    stat: PokeapiPokemonRecordNameUrl | None = None
 
 
 class PokeapiPokemonRecordType(BaseRecordModel):
@@ -228,3 +140,18 @@ class PokeapiPokemonRecordType(BaseRecordModel):
 class PokeapiPokemonRecordTypeType(BaseRecordModel):
     name: str | None = None
     url: str | None = None
+
+
+# Generated names of the shared classes, kept so existing imports keep working.
+PokeapiPokemonRecordAbilityAbility = PokeapiPokemonRecordNameUrl
+PokeapiPokemonRecordForm = PokeapiPokemonRecordNameUrl
+PokeapiPokemonRecordGameIndiceVersion = PokeapiPokemonRecordNameUrl
+PokeapiPokemonRecordHeldItemItem = PokeapiPokemonRecordNameUrl
+PokeapiPokemonRecordHeldItemVersionDetailVersion = PokeapiPokemonRecordNameUrl
+PokeapiPokemonRecordMoveMove = PokeapiPokemonRecordNameUrl
+PokeapiPokemonRecordMoveVersionGroupDetailMoveLearnMethod = PokeapiPokemonRecordNameUrl
+PokeapiPokemonRecordMoveVersionGroupDetailVersionGroup = PokeapiPokemonRecordNameUrl
+PokeapiPokemonRecordPastTypeGeneration = PokeapiPokemonRecordNameUrl
+PokeapiPokemonRecordPastTypeTypeType = PokeapiPokemonRecordNameUrl
+PokeapiPokemonRecordSpecies = PokeapiPokemonRecordNameUrl
+PokeapiPokemonRecordStatStat = PokeapiPokemonRecordNameUrl
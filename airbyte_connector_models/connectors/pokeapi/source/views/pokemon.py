@@ -0,0 +1,620 @@
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+
+"""Read-only views of the record models in `pokemon`.
+
+Generated from the record models; do not edit by hand.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from airbyte_connector_models.connectors._internal.record_view import RecordView
+
+_new = object.__new__
+_set = object.__setattr__
+
+
+class PokeapiPokemonRecordView(RecordView):
+    """Read-only view of `PokeapiPokemonRecord`."""
+
+    __slots__ = (
+        "abilities",
+        "base_experience",
+        "forms",
+        "game_indices",
+        "height",
+        "held_items",
+        "id",
+        "is_default",
+        "location_area_encounters",
+        "moves",
+        "name",
+        "order",
+        "past_types",
+        "species",
+        "sprites",
+        "stats",
+        "types",
+        "weight",
+    )
+    _aliases = (
+        "abilities",
+        "base_experience",
+        "forms",
+        "game_indices",
+        "height",
+        "held_items",
+        "id",
+        "is_default",
+        "location_area_encounters",
+        "moves",
+        "name",
+        "order",
+        "past_types",
+        "species",
+        "sprites",
+        "stats",
+        "types",
+        "weight",
+    )
+
+    abilities: tuple[PokeapiPokemonRecordAbilityView | None, ...] | None
+    base_experience: int | None
+    forms: tuple[PokeapiPokemonRecordNameUrlView | None, ...] | None
+    game_indices: tuple[PokeapiPokemonRecordGameIndiceView | None, ...] | None
+    height: int | None
+    held_items: tuple[PokeapiPokemonRecordHeldItemView | None, ...] | None
+    id: int | None
+    is_default: bool | None
+    location_area_encounters: str | None
+    moves: tuple[PokeapiPokemonRecordMoveView | None, ...] | None
+    name: str | None
+    order: int | None
+    past_types: tuple[PokeapiPokemonRecordPastTypeView | None, ...] | None
+    species: PokeapiPokemonRecordNameUrlView | None
+    sprites: PokeapiPokemonRecordSpritesView | None
+    stats: tuple[PokeapiPokemonRecordStatView | None, ...] | None
+    types: tuple[PokeapiPokemonRecordTypeView | None, ...] | None
+    weight: int | None
+
+    @classmethod
+    def from_validated_dict(cls, data: dict[str, Any]) -> PokeapiPokemonRecordView:
+        """Build a view from a record dict that has already passed validation."""
+        view = _new(cls)
+        get = data.get
+        value = get("abilities")
+        if value is not None:
+            value = tuple(
+                (
+                    None
+                    if item0 is None
+                    else PokeapiPokemonRecordAbilityView.from_validated_dict(item0)
+                )
+                for item0 in value
+            )
+        _set(view, "abilities", value)
+        _set(view, "base_experience", get("base_experience"))
+        value = get("forms")
+        if value is not None:
+            value = tuple(
+                (
+                    None
+                    if item0 is None
+                    else PokeapiPokemonRecordNameUrlView.from_validated_dict(item0)
+                )
+                for item0 in value
+            )
+        _set(view, "forms", value)
+        value = get("game_indices")
+        if value is not None:
+            value = tuple(
+                (
+                    None
+                    if item0 is None
+                    else PokeapiPokemonRecordGameIndiceView.from_validated_dict(item0)
+                )
+                for item0 in value
+            )
+        _set(view, "game_indices", value)
+        _set(view, "height", get("height"))
+        value = get("held_items")
+        if value is not None:
+            value = tuple(
+                (
+                    None
+                    if item0 is None
+                    else PokeapiPokemonRecordHeldItemView.from_validated_dict(item0)
+                )
+                for item0 in value
+            )
+        _set(view, "held_items", value)
+        _set(view, "id", get("id"))
+        _set(view, "is_default", get("is_default"))
+        _set(view, "location_area_encounters", get("location_area_encounters"))
+        value = get("moves")
+        if value is not None:
+            value = tuple(
+                None if item0 is None else PokeapiPokemonRecordMoveView.from_validated_dict(item0)
+                for item0 in value
+            )
+        _set(view, "moves", value)
+        _set(view, "name", get("name"))
+        _set(view, "order", get("order"))
+        value = get("past_types")
+        if value is not None:
+            value = tuple(
+                (
+                    None
+                    if item0 is None
+                    else PokeapiPokemonRecordPastTypeView.from_validated_dict(item0)
+                )
+                for item0 in value
+            )
+        _set(view, "past_types", value)
+        value = get("species")
+        if value is not None:
+            value = PokeapiPokemonRecordNameUrlView.from_validated_dict(value)
+        _set(view, "species", value)
+        value = get("sprites")
+        if value is not None:
+            value = PokeapiPokemonRecordSpritesView.from_validated_dict(value)
+        _set(view, "sprites", value)
+        value = get("stats")
+        if value is not None:
+            value = tuple(
+                None if item0 is None else PokeapiPokemonRecordStatView.from_validated_dict(item0)
+                for item0 in value
+            )
+        _set(view, "stats", value)
+        value = get("types")
+        if value is not None:
+            value = tuple(
+                None if item0 is None else PokeapiPokemonRecordTypeView.from_validated_dict(item0)
+                for item0 in value
+            )
+        _set(view, "types", value)
+        _set(view, "weight", get("weight"))
+        return view
+
+
+class PokeapiPokemonRecordAbilityView(RecordView):
+    """Read-only view of `PokeapiPokemonRecordAbility`."""
+
+    __slots__ = (
+        "ability",
+        "is_hidden",
+        "slot",
+    )
+    _aliases = (
+        "ability",
+        "is_hidden",
+        "slot",
+    )
+
+    ability: PokeapiPokemonRecordNameUrlView | None
+    is_hidden: bool | None
+    slot: int | None
+
+    @classmethod
+    def from_validated_dict(cls, data: dict[str, Any]) -> PokeapiPokemonRecordAbilityView:
+        """Build a view from a record dict that has already passed validation."""
+        view = _new(cls)
+        get = data.get
+        value = get("ability")
+        if value is not None:
+            value = PokeapiPokemonRecordNameUrlView.from_validated_dict(value)
+        _set(view, "ability", value)
+        _set(view, "is_hidden", get("is_hidden"))
+        _set(view, "slot", get("slot"))
+        return view
+
+
+class PokeapiPokemonRecordNameUrlView(RecordView):
+    """Read-only view of `PokeapiPokemonRecordNameUrl`."""
+
+    __slots__ = (
+        "name",
+        "url",
+    )
+    _aliases = (
+        "name",
+        "url",
+    )
+
+    name: str | None
+    url: str | None
+
+    @classmethod
+    def from_validated_dict(cls, data: dict[str, Any]) -> PokeapiPokemonRecordNameUrlView:
+        """Build a view from a record dict that has already passed validation."""
+        view = _new(cls)
+        get = data.get
+        _set(view, "name", get("name"))
+        _set(view, "url", get("url"))
+        return view
+
+
+class PokeapiPokemonRecordGameIndiceView(RecordView):
+    """Read-only view of `PokeapiPokemonRecordGameIndice`."""
+
+    __slots__ = (
+        "version",
+        "game_index",
+    )
+    _aliases = (
+        "version",
+        "game_index",
+    )
+
+    version: PokeapiPokemonRecordNameUrlView | None
+    game_index: int | None
+
+    @classmethod
+    def from_validated_dict(cls, data: dict[str, Any]) -> PokeapiPokemonRecordGameIndiceView:
+        """Build a view from a record dict that has already passed validation."""
+        view = _new(cls)
+        get = data.get
+        value = get("version")
+        if value is not None:
+            value = PokeapiPokemonRecordNameUrlView.from_validated_dict(value)
+        _set(view, "version", value)
+        _set(view, "game_index", get("game_index"))
+        return view
+
+
+class PokeapiPokemonRecordHeldItemView(RecordView):
+    """Read-only view of `PokeapiPokemonRecordHeldItem`."""
+
+    __slots__ = (
+        "item",
+        "version_details",
+    )
+    _aliases = (
+        "item",
+        "version_details",
+    )
+
+    item: PokeapiPokemonRecordNameUrlView | None
+    version_details: tuple[PokeapiPokemonRecordHeldItemVersionDetailView | None, ...] | None
+
+    @classmethod
+    def from_validated_dict(cls, data: dict[str, Any]) -> PokeapiPokemonRecordHeldItemView:
+        """Build a view from a record dict that has already passed validation."""
+        view = _new(cls)
+        get = data.get
+        value = get("item")
+        if value is not None:
+            value = PokeapiPokemonRecordNameUrlView.from_validated_dict(value)
+        _set(view, "item", value)
+        value = get("version_details")
+        if value is not None:
+            value = tuple(
+                (
+                    None
+                    if item0 is None
+                    else PokeapiPokemonRecordHeldItemVersionDetailView.from_validated_dict(item0)
+                )
+                for item0 in value
+            )
+        _set(view, "version_details", value)
+        return view
+
+
+class PokeapiPokemonRecordHeldItemVersionDetailView(RecordView):
+    """Read-only view of `PokeapiPokemonRecordHeldItemVersionDetail`."""
+
+    __slots__ = (
+        "version",
+        "rarity",
+    )
+    _aliases = (
+        "version",
+        "rarity",
+    )
+
+    version: PokeapiPokemonRecordNameUrlView | None
+    rarity: int | None
+
+    @classmethod
+    def from_validated_dict(
+        cls, data: dict[str, Any]
+    ) -> PokeapiPokemonRecordHeldItemVersionDetailView:
+        """Build a view from a record dict that has already passed validation."""
+        view = _new(cls)
+        get = data.get
+        value = get("version")
+        if value is not None:
+            value = PokeapiPokemonRecordNameUrlView.from_validated_dict(value)
+        _set(view, "version", value)
+        _set(view, "rarity", get("rarity"))
+        return view
+
+
+class PokeapiPokemonRecordMoveView(RecordView):
+    """Read-only view of `PokeapiPokemonRecordMove`."""
+
+    __slots__ = (
+        "move",
+        "version_group_details",
+    )
+    _aliases = (
+        "move",
+        "version_group_details",
+    )
+
+    move: PokeapiPokemonRecordNameUrlView | None
+    version_group_details: tuple[PokeapiPokemonRecordMoveVersionGroupDetailView | None, ...] | None
+
+    @classmethod
+    def from_validated_dict(cls, data: dict[str, Any]) -> PokeapiPokemonRecordMoveView:
+        """Build a view from a record dict that has already passed validation."""
+        view = _new(cls)
+        get = data.get
+        value = get("move")
+        if value is not None:
+            value = PokeapiPokemonRecordNameUrlView.from_validated_dict(value)
+        _set(view, "move", value)
+        value = get("version_group_details")
+        if value is not None:
+            value = tuple(
+                (
+                    None
+                    if item0 is None
+                    else PokeapiPokemonRecordMoveVersionGroupDetailView.from_validated_dict(item0)
+                )
+                for item0 in value
+            )
+        _set(view, "version_group_details", value)
+        return view
+
+
+class PokeapiPokemonRecordMoveVersionGroupDetailView(RecordView):
+    """Read-only view of `PokeapiPokemonRecordMoveVersionGroupDetail`."""
+
+    __slots__ = (
+        "level_learned_at",
+        "move_learn_method",
+        "version_group",
+    )
+    _aliases = (
+        "level_learned_at",
+        "move_learn_method",
+        "version_group",
+    )
+
+    level_learned_at: int | None
+    move_learn_method: PokeapiPokemonRecordNameUrlView | None
+    version_group: PokeapiPokemonRecordNameUrlView | None
+
+    @classmethod
+    def from_validated_dict(
+        cls, data: dict[str, Any]
+    ) -> PokeapiPokemonRecordMoveVersionGroupDetailView:
+        """Build a view from a record dict that has already passed validation."""
+        view = _new(cls)
+        get = data.get
+        _set(view, "level_learned_at", get("level_learned_at"))
+        value = get("move_learn_method")
+        if value is not None:
+            value = PokeapiPokemonRecordNameUrlView.from_validated_dict(value)
+        _set(view, "move_learn_method", value)
+        value = get("version_group")
+        if value is not None:
+            value = PokeapiPokemonRecordNameUrlView.from_validated_dict(value)
+        _set(view, "version_group", value)
+        return view
+
+
+class PokeapiPokemonRecordPastTypeView(RecordView):
+    """Read-only view of `PokeapiPokemonRecordPastType`."""
+
+    __slots__ = (
+        "generation",
+        "types",
+    )
+    _aliases = (
+        "generation",
+        "types",
+    )
+
+    generation: PokeapiPokemonRecordNameUrlView | None
+    types: tuple[PokeapiPokemonRecordPastTypeTypeView | None, ...] | None
+
+    @classmethod
+    def from_validated_dict(cls, data: dict[str, Any]) -> PokeapiPokemonRecordPastTypeView:
+        """Build a view from a record dict that has already passed validation."""
+        view = _new(cls)
+        get = data.get
+        value = get("generation")
+        if value is not None:
+            value = PokeapiPokemonRecordNameUrlView.from_validated_dict(value)
+        _set(view, "generation", value)
+        value = get("types")
+        if value is not None:
+            value = tuple(
+                (
+                    None
+                    if item0 is None
+                    else PokeapiPokemonRecordPastTypeTypeView.from_validated_dict(item0)
+                )
+                for item0 in value
+            )
+        _set(view, "types", value)
+        return view
+
+
+class PokeapiPokemonRecordPastTypeTypeView(RecordView):
+    """Read-only view of `PokeapiPokemonRecordPastTypeType`."""
+
+    __slots__ = (
+        "type",
+        "slot",
+    )
+    _aliases = (
+        "type",
+        "slot",
+    )
+
+    type: PokeapiPokemonRecordNameUrlView | None
+    slot: int | None
+
+    @classmethod
+    def from_validated_dict(cls, data: dict[str, Any]) -> PokeapiPokemonRecordPastTypeTypeView:
+        """Build a view from a record dict that has already passed validation."""
+        view = _new(cls)
+        get = data.get
+        value = get("type")
+        if value is not None:
+            value = PokeapiPokemonRecordNameUrlView.from_validated_dict(value)
+        _set(view, "type", value)
+        _set(view, "slot", get("slot"))
+        return view
+
+
+class PokeapiPokemonRecordSpritesView(RecordView):
+    """Read-only view of `PokeapiPokemonRecordSprites`."""
+
+    __slots__ = (
+        "back_default",
+        "back_female",
+        "back_shiny",
+        "back_shiny_female",
+        "front_default",
+        "front_female",
+        "front_shiny",
+        "front_shiny_female",
+    )
+    _aliases = (
+        "back_default",
+        "back_female",
+        "back_shiny",
+        "back_shiny_female",
+        "front_default",
+        "front_female",
+        "front_shiny",
+        "front_shiny_female",
+    )
+
+    back_default: str | None
+    back_female: str | None
+    back_shiny: str | None
+    back_shiny_female: str | None
+    front_default: str | None
+    front_female: str | None
+    front_shiny: str | None
+    front_shiny_female: str | None
+
+    @classmethod
+    def from_validated_dict(cls, data: dict[str, Any]) -> PokeapiPokemonRecordSpritesView:
+        """Build a view from a record dict that has already passed validation."""
+        view = _new(cls)
+        get = data.get
+        _set(view, "back_default", get("back_default"))
+        _set(view, "back_female", get("back_female"))
+        _set(view, "back_shiny", get("back_shiny"))
+        _set(view, "back_shiny_female", get("back_shiny_female"))
+        _set(view, "front_default", get("front_default"))
+        _set(view, "front_female", get("front_female"))
+        _set(view, "front_shiny", get("front_shiny"))
+        _set(view, "front_shiny_female", get("front_shiny_female"))
+        return view
+
+
+class PokeapiPokemonRecordStatView(RecordView):
+    """Read-only view of `PokeapiPokemonRecordStat`."""
+
+    __slots__ = (
+        "base_stat",
+        "effort",
+        "stat",
+    )
+    _aliases = (
+        "base_stat",
+        "effort",
+        "stat",
+    )
+
+    base_stat: int | None
+    effort: int | None
+    stat: PokeapiPokemonRecordNameUrlView | None
+
+    @classmethod
+    def from_validated_dict(cls, data: dict[str, Any]) -> PokeapiPokemonRecordStatView:
+        """Build a view from a record dict that has already passed validation."""
+        view = _new(cls)
+        get = data.get
+        _set(view, "base_stat", get("base_stat"))
+        _set(view, "effort", get("effort"))
+        value = get("stat")
+        if value is not None:
+            value = PokeapiPokemonRecordNameUrlView.from_validated_dict(value)
+        _set(view, "stat", value)
+        return view
+
+
+class PokeapiPokemonRecordTypeView(RecordView):
+    """Read-only view of `PokeapiPokemonRecordType`."""
+
+    __slots__ = (
+        "type",
+        "slot",
+    )
+    _aliases = (
+        "type",
+        "slot",
+    )
+
+    type: PokeapiPokemonRecordTypeTypeView | None
+    slot: int | None
+
+    @classmethod
+    def from_validated_dict(cls, data: dict[str, Any]) -> PokeapiPokemonRecordTypeView:
+        """Build a view from a record dict that has already passed validation."""
+        view = _new(cls)
+        get = data.get
+        value = get("type")
+        if value is not None:
+            value = PokeapiPokemonRecordTypeTypeView.from_validated_dict(value)
+        _set(view, "type", value)
+        _set(view, "slot", get("slot"))
+        return view
+
+
+class PokeapiPokemonRecordTypeTypeView(RecordView):
+    """Read-only view of `PokeapiPokemonRecordTypeType`."""
+
+    __slots__ = (
+        "name",
+        "url",
+    )
+    _aliases = (
+        "name",
+        "url",
+    )
+
+    name: str | None
+    url: str | None
+
+    @classmethod
+    def from_validated_dict(cls, data: dict[str, Any]) -> PokeapiPokemonRecordTypeTypeView:
+        """Build a view from a record dict that has already passed validation."""
+        view = _new(cls)
+        get = data.get
+        _set(view, "name", get("name"))
+        _set(view, "url", get("url"))
+        return view
+
+
+PokeapiPokemonRecordAbilityAbilityView = PokeapiPokemonRecordNameUrlView
+PokeapiPokemonRecordFormView = PokeapiPokemonRecordNameUrlView
+PokeapiPokemonRecordGameIndiceVersionView = PokeapiPokemonRecordNameUrlView
+PokeapiPokemonRecordHeldItemItemView = PokeapiPokemonRecordNameUrlView
+PokeapiPokemonRecordHeldItemVersionDetailVersionView = PokeapiPokemonRecordNameUrlView
+PokeapiPokemonRecordMoveMoveView = PokeapiPokemonRecordNameUrlView
+PokeapiPokemonRecordMoveVersionGroupDetailMoveLearnMethodView = PokeapiPokemonRecordNameUrlView
+PokeapiPokemonRecordMoveVersionGroupDetailVersionGroupView = PokeapiPokemonRecordNameUrlView
+PokeapiPokemonRecordPastTypeGenerationView = PokeapiPokemonRecordNameUrlView
+PokeapiPokemonRecordPastTypeTypeTypeView = PokeapiPokemonRecordNameUrlView
+PokeapiPokemonRecordSpeciesView = PokeapiPokemonRecordNameUrlView
+PokeapiPokemonRecordStatStatView = PokeapiPokemonRecordNameUrlView
@@ -0,0 +1,76 @@
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+
+"""Read-only views of the record models in `xkcd`.
+
+Generated from the record models; do not edit by hand.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from airbyte_connector_models.connectors._internal.record_view import RecordView
+
+_new = object.__new__
+_set = object.__setattr__
+
+
+class XkcdXkcdRecordView(RecordView):
+    """Read-only view of `XkcdXkcdRecord`."""
+
+    __slots__ = (
+        "alt",
+        "day",
+        "img",
+        "link",
+        "month",
+        "news",
+        "num",
+        "safe_title",
+        "title",
+        "transcript",
+        "year",
+    )
+    _aliases = (
+        "alt",
+        "day",
+        "img",
+        "link",
+        "month",
+        "news",
+        "num",
+        "safe_title",
+        "title",
+        "transcript",
+        "year",
+    )
+
+    alt: str | None
+    day: str | None
+    img: str | None
+    link: str | None
+    month: str | None
+    news: str | None
+    num: int | None
+    safe_title: str | None
+    title: str | None
+    transcript: str | None
+    year: str | None
+
+    @classmethod
+    def from_validated_dict(cls, data: dict[str, Any]) -> XkcdXkcdRecordView:
+        """Build a view from a record dict that has already passed validation."""
+        view = _new(cls)
+        get = data.get
+        _set(view, "alt", get("alt"))
+        _set(view, "day", get("day"))
+        _set(view, "img", get("img"))
+        _set(view, "link", get("link"))
+        _set(view, "month", get("month"))
+        _set(view, "news", get("news"))
+        _set(view, "num", get("num"))
+        _set(view, "safe_title", get("safe_title"))
+        _set(view, "title", get("title"))
+        _set(view, "transcript", get("transcript"))
+        _set(view, "year", get("year"))
+        return view
@@ -0,0 +1 @@
+"""Benchmarks for airbyte-connector-models."""
@@ -0,0 +1,89 @@
+"""Microbenchmark for attribute access on generated record models.
+
+Compares declared-field access against extra-property and missing-attribute access,
+which go through `BaseRecordModel.__getattr__`.
+
+By default each case must stay within `MAX_RATIOS` of declared access, the bounds
+achieved by the current implementation with some headroom for timing noise.
+
+Usage:
+    python -m benchmarks.attribute_access [--number N] [--max-ratio R]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import timeit
+
+from airbyte_connector_models.connectors.airbyte.source.records.workspaces import (
+    AirbyteWorkspacesRecordNotificationsConnectionUpdateEmail,
+)
+
+CASES = {
+    "declared field": "record.enabled",
+    "extra (getattr)": "record.custom_field",
+    "extra (hasattr)": "hasattr(record, 'custom_field')",
+    "missing (hasattr)": "hasattr(record, 'missing_field')",
+    "missing (getattr default)": "getattr(record, 'missing_field', None)",
+}
+
+# Slowest accepted time of each case, as a multiple of declared-field access. Extras go
+# through one Python call; misses also raise (and catch) an AttributeError.
+MAX_RATIOS = {
+    "extra (getattr)": 20.0,
+    "extra (hasattr)": 25.0,
+    "missing (hasattr)": 75.0,
+    "missing (getattr default)": 75.0,
+}
+
+
+def run(number: int) -> dict[str, float]:
+    """Time each access case.
+
+    Args:
+        number: Number of executions per timing repeat
+
+    Returns:
+        Mapping of case name to the best time per operation in nanoseconds
+    """
+    record = AirbyteWorkspacesRecordNotificationsConnectionUpdateEmail(
+        enabled=True,
+        custom_field="value",
+    )
+    namespace = {"record": record}
+    return {
+        name: min(timeit.repeat(stmt, globals=namespace, number=number, repeat=5)) / number * 1e9
+        for name, stmt in CASES.items()
+    }
+
+
+def main() -> None:
+    """Run the benchmark and print a table of results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=200_000, help="Executions per repeat")
+    parser.add_argument(
+        "--max-ratio",
+        type=float,
+        default=None,
+        help="Exit non-zero if any case is slower than this multiple of declared access "
+        "(defaults to the per-case bounds in MAX_RATIOS)",
+    )
+    args = parser.parse_args()
+
+    results = run(args.number)
+    baseline = results["declared field"]
+    failed = False
+    for name, nanoseconds in results.items():
+        ratio = nanoseconds / baseline
+        bound = MAX_RATIOS.get(name) if args.max_ratio is None else args.max_ratio
+        over = bound is not None and ratio > bound
+        print(f"{name:<28} {nanoseconds:8.1f} ns  {ratio:6.1f}x{'  OVER BUDGET' if over else ''}")
+        failed = failed or over
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
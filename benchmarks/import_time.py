@@ -0,0 +1,172 @@
+"""Import-time and memory benchmark for every generated module, with a budget.
+
+Each module is imported in a fresh interpreter with nothing imported beforehand, so
+the measurement is the cold start a user sees: pydantic, the package's shared base
+classes and the module itself, executing its class bodies and building the pydantic
+schemas of every model it defines, including models whose forward references are
+resolved on first use. Memory is the growth of the process's current resident set
+size over the import, read from `/proc/self/statm` (Linux only; reported as null
+elsewhere).
+
+Usage:
+    python -m benchmarks.import_time [--max-seconds S] [--max-mb M] [--budget budget.json]
+        [--filter postgres] [--output report.json] [--jobs N]
+
+A budget file maps module names to per-module limits that override the defaults:
+    {"airbyte_connector_models.metadata.v0.connector_registry_v0": {"seconds": 0.5}}
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import pkgutil
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+PACKAGES = ("airbyte_connector_models.connectors", "airbyte_connector_models.metadata.v0")
+
+# Runs in the child interpreter: prints {"import": s, "build": s, "rss_kb": kb} as JSON.
+# Only stdlib modules that any interpreter has loaded at startup are imported before
+# the timer starts.
+_PROBE = """
+import os, sys, time
+
+def rss_kb():
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except OSError:
+        return None
+
+before = rss_kb()
+start = time.perf_counter()
+module = __import__(sys.argv[1], fromlist=["__name__"])
+imported = time.perf_counter()
+
+import inspect, json, pydantic
+
+for _, obj in inspect.getmembers(module, inspect.isclass):
+    if (
+        issubclass(obj, pydantic.BaseModel)
+        and obj.__module__ == module.__name__
+        and not obj.__pydantic_complete__
+    ):
+        obj.model_rebuild()
+built = time.perf_counter()
+after = rss_kb()
+rss = None if before is None or after is None else after - before
+print(json.dumps({"import": imported - start, "build": built - imported, "rss_kb": rss}))
+"""
+
+
+def discover_modules(name_filter: str | None = None) -> list[str]:
+    """List the generated modules to measure.
+
+    Args:
+        name_filter: Only include modules whose name contains this substring
+
+    Returns:
+        Sorted dotted module names, excluding packages and internal helpers
+    """
+    modules = []
+    for package_name in PACKAGES:
+        package = __import__(package_name, fromlist=["__path__"])
+        for info in pkgutil.walk_packages(package.__path__, prefix=f"{package_name}."):
+            if info.ispkg or "._internal" in info.name:
+                continue
+            if name_filter and name_filter not in info.name:
+                continue
+            modules.append(info.name)
+    return sorted(modules)
+
+
+def measure(module: str) -> dict[str, Any]:
+    """Import a module in a fresh interpreter and measure it.
+
+    Args:
+        module: Dotted module name
+
+    Returns:
+        A dict with `seconds` (import plus schema building), `import_seconds`,
+        `build_seconds` and `mb` (None where the resident set size is unavailable),
+        or with an `error` message if the import failed
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE, module],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        lines = result.stderr.strip().splitlines()
+        return {"error": lines[-1] if lines else f"exit code {result.returncode}"}
+    probe = json.loads(result.stdout)
+    return {
+        "seconds": probe["import"] + probe["build"],
+        "import_seconds": probe["import"],
+        "build_seconds": probe["build"],
+        "mb": None if probe["rss_kb"] is None else probe["rss_kb"] / 1024,
+    }
+
+
+def over_budget(
+    module: str, measurement: dict[str, Any], defaults: dict[str, float], budget: dict[str, Any]
+) -> list[str]:
+    """Return the budget violations of a measurement (empty if within budget)."""
+    if "error" in measurement:
+        return [f"import failed: {measurement['error']}"]
+    limits = {**defaults, **budget.get(module, {})}
+    return [
+        f"{key} {measurement[key]:.3f} > {limit}"
+        for key, limit in limits.items()
+        if limit is not None and measurement[key] is not None and measurement[key] > limit
+    ]
+
+
+def main() -> None:
+    """Measure every generated module and check it against the budget."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-seconds", type=float, default=None, help="Default time budget")
+    parser.add_argument("--max-mb", type=float, default=None, help="Default memory budget")
+    parser.add_argument("--budget", type=Path, default=None, help="Per-module budget JSON")
+    parser.add_argument("--filter", default=None, help="Only measure modules containing this")
+    parser.add_argument("--output", type=Path, default=None, help="Write the JSON report here")
+    parser.add_argument(
+        "--jobs", type=int, default=1, help="Interpreters to run at once (skews timings)"
+    )
+    args = parser.parse_args()
+
+    defaults = {"seconds": args.max_seconds, "mb": args.max_mb}
+    budget = json.loads(args.budget.read_text()) if args.budget else {}
+    modules = discover_modules(args.filter)
+    with ThreadPoolExecutor(max_workers=args.jobs) as executor:
+        results = dict(zip(modules, executor.map(measure, modules), strict=True))
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2) + "\n")
+
+    failed = False
+    for module, measurement in sorted(
+        results.items(), key=lambda item: -item[1].get("seconds", float("inf"))
+    ):
+        violations = over_budget(module, measurement, defaults, budget)
+        failed = failed or bool(violations)
+        if "error" in measurement:
+            line = f"{'-':>8}   {'-':>8}     {module}"
+        else:
+            mb = "-" if measurement["mb"] is None else f"{measurement['mb']:.1f}"
+            line = f"{measurement['seconds'] * 1e3:8.1f} ms {mb:>8} MB  {module}"
+        if violations:
+            line += "  OVER BUDGET: " + "; ".join(violations)
+        print(line)
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
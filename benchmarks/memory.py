@@ -0,0 +1,193 @@
+"""Memory footprint report for instances of every generated record and config model.
+
+Each model is validated from the payload synthesized from its stored schema (see
+`benchmarks.models`), and the deep size of the resulting instance is broken down into:
+
+- `instance`: the model object itself
+- `fields`: the `__dict__` holding the declared fields and the values in it
+- `extras`: the `__pydantic_extra__` dict and the extra values in it
+- `fields_set`: the `__pydantic_fields_set__` bookkeeping set
+- `nested`: everything owned by nested sub-model instances, recursively
+
+Sizes come from `sys.getsizeof`, counting every object once. Field name strings and
+other objects shared by all instances (such as small ints and None) are not counted.
+
+Usage:
+    python -m benchmarks.memory [--filter pokeapi] [--batch 10000] [--output report.json]
+        [--compare baseline.json] [--max-regression 1.1]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+from typing import NamedTuple
+
+from pydantic import BaseModel, ValidationError
+
+from benchmarks.models import Case, discover_cases
+
+_SHARED_TYPES = (type(None), bool, type)
+
+
+class Footprint(NamedTuple):
+    """Deep memory size of a model instance in bytes, by where the memory is held."""
+
+    instance: int
+    fields: int
+    extras: int
+    fields_set: int
+    nested: int
+    nested_models: int
+
+    @property
+    def total(self) -> int:
+        """Total bytes held by the instance."""
+        return self.instance + self.fields + self.extras + self.fields_set + self.nested
+
+
+class _Sizer:
+    """Deep `sys.getsizeof` that counts each object once and splits out nested models."""
+
+    def __init__(self) -> None:
+        self.seen: set[int] = set()
+        self.nested = 0
+        self.nested_models = 0
+
+    def size(self, obj: object) -> int:
+        """Return the bytes of `obj` and the containers and values it holds.
+
+        Nested model instances are accounted to `self.nested` instead.
+        """
+        if isinstance(obj, BaseModel):
+            self.nested_models += 1
+            self.nested += self.footprint(obj).total
+            return 0
+        if id(obj) in self.seen or isinstance(obj, _SHARED_TYPES):
+            return 0
+        if isinstance(obj, int) and -5 <= obj <= 256:  # noqa: PLR2004 - CPython's cached ints
+            return 0
+        self.seen.add(id(obj))
+        size = sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            size += sum(self.size(key) + self.size(value) for key, value in obj.items())
+        elif isinstance(obj, list | tuple | set | frozenset):
+            size += sum(self.size(item) for item in obj)
+        return size
+
+    def footprint(self, instance: BaseModel) -> Footprint:
+        """Break down the memory held by a model instance."""
+        self.seen.add(id(instance))
+        # Field names are shared by every instance of the model.
+        self.seen.update(id(name) for name in type(instance).model_fields)
+        nested_before, models_before = self.nested, self.nested_models
+        fields = self.size(instance.__dict__)
+        extras = self.size(instance.__pydantic_extra__)
+        fields_set = self.size(instance.__pydantic_fields_set__)
+        return Footprint(
+            instance=sys.getsizeof(instance),
+            fields=fields,
+            extras=extras,
+            fields_set=fields_set,
+            nested=self.nested - nested_before,
+            nested_models=self.nested_models - models_before,
+        )
+
+
+def measure(instance: BaseModel) -> Footprint:
+    """Measure the deep memory footprint of a model instance.
+
+    Args:
+        instance: A validated model instance
+
+    Returns:
+        The footprint of the instance, with nested sub-models summed into `nested`
+    """
+    return _Sizer().footprint(instance)
+
+
+def run(cases: list[Case]) -> dict[str, dict[str, int]]:
+    """Measure a typical instance of every case.
+
+    Args:
+        cases: The cases to measure
+
+    Returns:
+        Mapping of case name to footprint fields and `total`, in bytes; cases whose
+        synthesized payload does not validate are reported and skipped
+    """
+    results: dict[str, dict[str, int]] = {}
+    for case in cases:
+        try:
+            instance = case.model.model_validate(case.payload)
+        except (ValidationError, TypeError) as e:
+            summary = str(e).splitlines()[0]
+            print(f"skipping {case.name}: {type(e).__name__}: {summary}", file=sys.stderr)
+            continue
+        footprint = measure(instance)
+        results[case.name] = {**footprint._asdict(), "total": footprint.total}
+    return results
+
+
+def compare(
+    results: dict[str, dict[str, int]], baseline: dict[str, dict[str, int]]
+) -> Iterator[tuple[str, float]]:
+    """Yield (case, ratio) for every case present in both reports.
+
+    A ratio above 1 means instances of the model got bigger than in the baseline.
+    """
+    for name, footprint in results.items():
+        previous = baseline.get(name, {}).get("total")
+        if previous:
+            yield name, footprint["total"] / previous
+
+
+def main() -> None:
+    """Measure every generated model and optionally compare against a baseline."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--filter", default=None, help="Only measure cases containing this text")
+    parser.add_argument(
+        "--batch", type=int, default=10_000, help="Batch size to estimate buffer memory for"
+    )
+    parser.add_argument("--output", type=Path, default=None, help="Write the JSON report here")
+    parser.add_argument("--compare", type=Path, default=None, help="Baseline JSON report")
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=None,
+        help="Exit non-zero if any instance is larger than this multiple of the baseline",
+    )
+    args = parser.parse_args()
+
+    results = run(list(discover_cases(args.filter)))
+    if args.output:
+        args.output.write_text(json.dumps({"results": results}, indent=2) + "\n")
+
+    ratios: dict[str, float] = {}
+    if args.compare:
+        ratios = dict(compare(results, json.loads(args.compare.read_text())["results"]))
+
+    columns = ("instance", "fields", "extras", "fields_set", "nested", "total")
+    print(f"{'':<48}" + "".join(f"{column:>11}" for column in columns) + f"{'per batch':>12}")
+    failed = False
+    for name, footprint in sorted(results.items(), key=lambda item: -item[1]["total"]):
+        batch_mb = footprint["total"] * args.batch / 2**20
+        line = f"{name:<48}" + "".join(f"{footprint[column]:>11}" for column in columns)
+        line += f"{batch_mb:>9.1f} MB"
+        ratio = ratios.get(name)
+        if ratio is not None:
+            line += f"  {ratio:5.2f}x"
+            if args.max_regression is not None and ratio > args.max_regression:
+                line += "  REGRESSION"
+                failed = True
+        print(line)
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+"""Benchmark the public API of every generated record and config model.
+
+Payloads are synthesized from the `records/*.json` and `configuration.json` schemas
+stored next to each generated module, so a regeneration that changes the models is
+measured against the same inputs. Results are written as JSON and can be compared
+against a report from another commit.
+
+Usage:
+    python -m benchmarks.models [--output report.json] [--compare baseline.json]
+        [--max-regression 1.25] [--filter pokeapi] [--number N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import inspect
+import json
+import platform
+import sys
+import timeit
+from collections.abc import Callable, Iterator
+from importlib import metadata
+from pathlib import Path
+from types import ModuleType
+from typing import Any, NamedTuple
+
+import pydantic
+from pydantic import BaseModel, ValidationError
+
+from airbyte_connector_models.connectors._internal.base_config import BaseConfig
+from airbyte_connector_models.connectors._internal.base_record import BaseRecordModel
+from benchmarks.payloads import synthesize
+
+CONNECTORS_DIR = Path(__file__).resolve().parent.parent / "airbyte_connector_models" / "connectors"
+PACKAGE = "airbyte_connector_models.connectors"
+
+
+class Case(NamedTuple):
+    """A generated model together with the payload synthesized for it."""
+
+    name: str
+    model: type[BaseModel]
+    payload: dict[str, Any]
+
+
+def _top_level_model(module: ModuleType, base: type[BaseModel]) -> type[BaseModel] | None:
+    """Return the root model of a generated module.
+
+    Sub-model names extend the root model's name, so the root is the shortest one.
+    """
+    candidates = [
+        obj
+        for _, obj in inspect.getmembers(module, inspect.isclass)
+        if issubclass(obj, base) and obj is not base and obj.__module__ == module.__name__
+    ]
+    return min(candidates, key=lambda cls: len(cls.__name__), default=None)
+
+
+def _schema_for(module_path: Path) -> Path | None:
+    """Find the stored JSON schema of a generated module (stream names keep their case)."""
+    for candidate in module_path.parent.glob("*.json"):
+        if candidate.stem.lower() == module_path.stem.lower():
+            return candidate
+    return None
+
+
+def discover_cases(name_filter: str | None = None) -> Iterator[Case]:
+    """Yield a benchmark case for every generated model with a stored schema.
+
+    Args:
+        name_filter: Only include cases whose name contains this substring
+
+    Yields:
+        Cases named like `pokeapi/source/records/pokemon` or `pokeapi/source/configuration`
+    """
+    modules = sorted(CONNECTORS_DIR.glob("*/*/configuration.py")) + sorted(
+        CONNECTORS_DIR.glob("*/*/records/*.py")
+    )
+    for module_path in modules:
+        if module_path.name == "__init__.py":
+            continue
+        relative = module_path.relative_to(CONNECTORS_DIR).with_suffix("")
+        name = relative.as_posix()
+        if name_filter and name_filter not in name:
+            continue
+        schema_path = _schema_for(module_path)
+        if schema_path is None:
+            continue
+        module = importlib.import_module(f"{PACKAGE}.{'.'.join(relative.parts)}")
+        base = BaseRecordModel if "records" in relative.parts else BaseConfig
+        model = _top_level_model(module, base)
+        if model is None:
+            continue
+        yield Case(name, model, synthesize(json.loads(schema_path.read_text())))
+
+
+def _operations(case: Case) -> dict[str, Callable[[], object]]:
+    """Return the API calls to time for a case."""
+    model: Any = case.model
+    payload = case.payload
+    payload_json = json.dumps(payload)
+    instance = model.from_dict(payload)
+    operations: dict[str, Callable[[], object]] = {
+        "from_dict": lambda: model.from_dict(payload),
+        "from_json": lambda: model.from_json(payload_json),
+        "to_dict": instance.to_dict,
+        "to_json": instance.to_json,
+    }
+    if isinstance(instance, BaseRecordModel):
+        key = next(iter(payload), "missing")
+        operations |= {
+            "__getitem__": lambda: instance[key],
+            "get": lambda: instance.get(key),
+            "from_trusted": lambda: model.from_trusted(payload),
+            "keys": lambda: list(instance.keys()),
+            "items": lambda: list(instance.items()),
+        }
+    return operations
+
+
+def run(cases: list[Case], number: int) -> dict[str, dict[str, float]]:
+    """Time every operation of every case.
+
+    Args:
+        cases: The cases to benchmark
+        number: Number of executions per timing repeat
+
+    Returns:
+        Mapping of case name to operation name to the best time per call in nanoseconds;
+        cases whose synthesized payload does not validate are reported and skipped
+    """
+    results: dict[str, dict[str, float]] = {}
+    for case in cases:
+        try:
+            operations = _operations(case)
+        except (ValidationError, TypeError) as e:
+            summary = str(e).splitlines()[0]
+            print(f"skipping {case.name}: {type(e).__name__}: {summary}", file=sys.stderr)
+            continue
+        results[case.name] = {
+            operation: min(timeit.repeat(call, number=number, repeat=5)) / number * 1e9
+            for operation, call in operations.items()
+        }
+    return results
+
+
+def _environment() -> dict[str, str]:
+    try:
+        version = metadata.version("airbyte-connector-models")
+    except metadata.PackageNotFoundError:
+        version = "unknown"
+    return {
+        "package": version,
+        "python": platform.python_version(),
+        "pydantic": pydantic.VERSION,
+        "machine": platform.machine(),
+    }
+
+
+def compare(
+    results: dict[str, dict[str, float]], baseline: dict[str, dict[str, float]]
+) -> Iterator[tuple[str, str, float]]:
+    """Yield (case, operation, ratio) for every timing present in both reports.
+
+    A ratio above 1 means the operation got slower than in the baseline.
+    """
+    for name, timings in results.items():
+        for operation, nanoseconds in timings.items():
+            previous = baseline.get(name, {}).get(operation)
+            if previous:
+                yield name, operation, nanoseconds / previous
+
+
+def main() -> None:
+    """Run the benchmarks, write the report and optionally compare against a baseline."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=500, help="Executions per repeat")
+    parser.add_argument("--filter", default=None, help="Only run cases containing this text")
+    parser.add_argument("--output", type=Path, default=None, help="Write the JSON report here")
+    parser.add_argument("--compare", type=Path, default=None, help="Baseline JSON report")
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=None,
+        help="Exit non-zero if any operation is slower than this multiple of the baseline",
+    )
+    args = parser.parse_args()
+
+    results = run(list(discover_cases(args.filter)), args.number)
+    report = {"environment": _environment(), "results": results}
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+
+    ratios: dict[tuple[str, str], float] = {}
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())["results"]
+        ratios = {(name, op): ratio for name, op, ratio in compare(results, baseline)}
+
+    failed = False
+    for name, timings in results.items():
+        print(name)
+        for operation, nanoseconds in timings.items():
+            line = f"  {operation:<12} {nanoseconds:12.1f} ns"
+            ratio = ratios.get((name, operation))
+            if ratio is not None:
+                line += f"  {ratio:5.2f}x"
+                if args.max_regression is not None and ratio > args.max_regression:
+                    line += "  REGRESSION"
+                    failed = True
+            print(line)
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Synthesize realistic payloads from the JSON schemas stored next to generated models."""
+
+from __future__ import annotations
+
+from typing import Any
+
+_FORMAT_SAMPLES = {
+    "date": "2024-01-15",
+    "date-time": "2024-01-15T12:30:00Z",
+    "time": "12:30:00",
+    "email": "user@example.com",
+    "uri": "https://example.com/resource",
+    "uuid": "123e4567-e89b-12d3-a456-426614174000",
+}
+
+
+_MISSING = object()
+
+
+def _provided_value(schema: dict[str, Any]) -> Any:
+    """Return the value the schema itself suggests, or `_MISSING`."""
+    if "const" in schema:
+        return schema["const"]
+    for keyword in ("enum", "examples"):
+        if schema.get(keyword):
+            return schema[keyword][0]
+    if schema.get("oneOf") or schema.get("anyOf"):
+        # Defaults of union specs often name a branch rather than being a valid value.
+        return _MISSING
+    return schema.get("default", _MISSING)
+
+
+def _primary_type(schema: dict[str, Any]) -> str | None:
+    """Return the first non-null JSON type of a schema, inferring objects."""
+    types = schema.get("type")
+    if isinstance(types, str):
+        types = [types]
+    for json_type in types or []:
+        if json_type != "null":
+            return json_type
+    return "object" if "properties" in schema else None
+
+
+def _scalar(json_type: str | None, schema: dict[str, Any], index: int) -> Any:
+    """Return a sample scalar for a JSON type, respecting simple numeric bounds."""
+    if json_type == "string":
+        return _FORMAT_SAMPLES.get(schema.get("format", ""), f"value-{index}")
+    if json_type == "integer":
+        return min(max(42 + index, schema.get("minimum", 0)), schema.get("maximum", 1_000))
+    if json_type == "number":
+        return min(max(42.5 + index, schema.get("minimum", 0)), schema.get("maximum", 1_000))
+    if json_type == "boolean":
+        return index % 2 == 0
+    return None
+
+
+def synthesize(schema: dict[str, Any], *, array_length: int = 3, index: int = 0) -> Any:
+    """Build a payload that populates every property of a JSON schema.
+
+    Schema-provided values win over synthesized ones, in the order `const`, `enum`,
+    `examples`, `default`. For `oneOf`/`anyOf` the first branch is used. Arrays get
+    `array_length` items, so nested structures are exercised as deeply as the schema
+    describes them.
+
+    Args:
+        schema: A JSON schema (a record schema or a connector spec)
+        array_length: Number of items to generate for every array
+        index: Position of the value within its parent, used to vary samples
+
+    Returns:
+        A JSON-compatible value matching the schema
+    """
+    value = _provided_value(schema)
+    if value is not _MISSING:
+        return value
+    for combinator in ("oneOf", "anyOf"):
+        if schema.get(combinator):
+            return synthesize(schema[combinator][0], array_length=array_length, index=index)
+
+    json_type = _primary_type(schema)
+    if json_type == "object":
+        return {
+            name: synthesize(subschema, array_length=array_length, index=position)
+            for position, (name, subschema) in enumerate(schema.get("properties", {}).items())
+        }
+    if json_type == "array":
+        items = schema.get("items") or {"type": "string"}
+        return [
+            synthesize(items, array_length=array_length, index=position)
+            for position in range(max(array_length, schema.get("minItems", 0)))
+        ]
+    return _scalar(json_type, schema, index)
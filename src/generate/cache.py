@@ -0,0 +1,172 @@
+"""Content-hash cache that lets the generator skip models whose inputs have not changed."""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager, suppress
+from functools import cache
+from importlib import metadata
+from pathlib import Path
+from typing import Any
+
+from .utils import get_repo_root
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILE = ".generate-cache.json"
+
+# Set to "1" to regenerate every file regardless of the cache (see `--force`).
+NO_CACHE_ENV = "AIRBYTE_GENERATE_NO_CACHE"
+
+
+def _digest(value: Any) -> str:  # noqa: ANN401
+    """Return the SHA-256 of a JSON-serializable value, independent of key order."""
+    encoded = json.dumps(value, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def file_digest(path: Path) -> str | None:
+    """Return the SHA-256 of a file's content, or None if it does not exist."""
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+@cache
+def generator_fingerprint() -> str:
+    """Return a hash of everything besides the schema that shapes the generated code.
+
+    Covers the datamodel-code-generator version, the source of this generator package
+    (its shared options and post-processing passes) and the license header.
+    """
+    repo_root = get_repo_root()
+    return _digest(
+        {
+            "datamodel-code-generator": metadata.version("datamodel-code-generator"),
+            "generator": {
+                path.name: file_digest(path) for path in sorted(Path(__file__).parent.glob("*.py"))
+            },
+            "header": file_digest(repo_root / ".header.txt"),
+        }
+    )
+
+
+class GenerationCache:
+    """Map each generated file to the hash of its inputs and of the content written.
+
+    A file is fresh when it was generated from the same inputs by the same generator
+    and has not been modified or deleted since.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.entries = self._read()
+        self.updates: dict[str, dict[str, str]] = {}
+
+    def _read(self) -> dict[str, dict[str, str]]:
+        try:
+            return json.loads(self.path.read_text())["entries"]
+        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+            return {}
+
+    def _key(self, output_path: Path) -> str:
+        with suppress(ValueError):
+            return output_path.resolve().relative_to(self.path.parent.resolve()).as_posix()
+        return str(output_path.resolve())
+
+    def is_fresh(self, output_path: Path, inputs_digest: str) -> bool:
+        """Check whether a file was generated from the given inputs and is unchanged."""
+        entry = self.entries.get(self._key(output_path))
+        return (
+            entry is not None
+            and entry.get("inputs") == inputs_digest
+            and entry.get("output") == file_digest(output_path)
+        )
+
+    def record(self, output_path: Path, inputs_digest: str) -> None:
+        """Remember the inputs and the current content of a generated file."""
+        output = file_digest(output_path)
+        if output is None:
+            return
+        entry = {"inputs": inputs_digest, "output": output}
+        key = self._key(output_path)
+        self.entries[key] = entry
+        self.updates[key] = entry
+
+    def save(self) -> None:
+        """Merge this process's updates into the cache file.
+
+        The file is re-read under a lock before writing, so concurrent generator
+        processes (see `--jobs`) never drop each other's entries.
+        """
+        if not self.updates:
+            return
+        lock_path = self.path.with_suffix(".lock")
+        with lock_path.open("w") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            entries = {**self._read(), **self.updates}
+            with tempfile.NamedTemporaryFile(
+                "w", dir=self.path.parent, prefix=self.path.name, delete=False
+            ) as temp_file:
+                json.dump({"entries": entries}, temp_file, indent=1, sort_keys=True)
+            Path(temp_file.name).replace(self.path)
+        self.entries = entries
+        self.updates = {}
+
+
+_cache: GenerationCache | None = None
+
+
+def generation_cache() -> GenerationCache:
+    """Return this process's generation cache, loading it on first use."""
+    global _cache  # noqa: PLW0603
+    if _cache is None:
+        _cache = GenerationCache(get_repo_root() / CACHE_FILE)
+    return _cache
+
+
+def save_generation_cache() -> None:
+    """Write the entries recorded by this process to the cache file."""
+    if _cache is not None:
+        _cache.save()
+
+
+@contextmanager
+def regenerate(output_path: Path, *inputs: Any) -> Iterator[bool]:  # noqa: ANN401
+    """Tell whether a generated file is stale, and record it once regenerated.
+
+    Example:
+        with regenerate(output_file, schema, model_name, defer_build) as stale:
+            if stale:
+                run_codegen(schema, output_file, class_name=model_name)
+
+    Setting `AIRBYTE_GENERATE_NO_CACHE=1` (`--force`) regenerates every file, still
+    recording it for the next run.
+
+    Args:
+        output_path: The generated file
+        *inputs: Everything the file is generated from (JSON-serializable); the
+            generator fingerprint is added automatically
+
+    Yields:
+        True if the file has to be regenerated, False if it is up to date
+    """
+    generation = generation_cache()
+    inputs_digest = _digest([generator_fingerprint(), *inputs])
+    stale = os.environ.get(NO_CACHE_ENV) == "1" or not generation.is_fresh(
+        output_path, inputs_digest
+    )
+    if not stale:
+        logger.info(f"Unchanged since the last run, skipping {output_path}")
+    yield stale
+    generation.record(output_path, inputs_digest)
@@ -0,0 +1,105 @@
+"""In-process invocation of datamodel-code-generator with the shared generation settings."""
+
+import json
+import shutil
+import tempfile
+import warnings
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+
+from datamodel_code_generator import DataModelType, InputFileType, PythonVersion, generate
+
+from .utils import get_repo_root
+
+# Settings shared by every generated module. Callers add the class name, base class, etc.
+SHARED_OPTIONS: dict[str, Any] = {
+    "input_file_type": InputFileType.JsonSchema,
+    "output_model_type": DataModelType.PydanticV2BaseModel,
+    "use_standard_collections": True,
+    "use_union_operator": True,
+    "field_constraints": True,
+    "use_annotated": True,
+    "keyword_only": True,
+    "disable_timestamp": True,
+    "use_exact_imports": True,
+    "use_double_quotes": True,
+    "keep_model_order": True,
+    "use_schema_description": True,
+    "parent_scoped_naming": True,
+    "use_title_as_name": True,
+    "target_python_version": PythonVersion.PY_310,
+}
+
+
+def run_codegen(
+    schema: Mapping[str, Any] | Path,
+    output_path: Path,
+    **options: Any,  # noqa: ANN401
+) -> None:
+    """Generate a pydantic module from a JSON schema without spawning `datamodel-codegen`.
+
+    Calls the datamodel-code-generator library directly, so the generator is imported
+    once per process and schemas are passed in memory instead of through temp files.
+    The output is the same as the `datamodel-codegen` CLI with the equivalent flags.
+
+    Args:
+        schema: The JSON schema, or a path to a JSON schema file
+        output_path: Path to write the generated module
+        **options: datamodel-code-generator options added to `SHARED_OPTIONS`
+            (e.g. `class_name`, `base_class`, `snake_case_field`)
+    """
+    source = schema if isinstance(schema, Path) else json.dumps(schema)
+    _generate(source, output_path, options)
+
+
+def run_codegen_batch(
+    schemas: Mapping[str, Mapping[str, Any]],
+    output_dir: Path,
+    **options: Any,  # noqa: ANN401
+) -> list[Path]:
+    """Generate one pydantic module per JSON schema in a single generator pass.
+
+    The schemas are handed to datamodel-code-generator as one directory input, so the
+    generator is configured and the shared base class and header resolved once for
+    all of them. Each root model is named after its schema's `title` (see
+    `use_title_as_name`), which gives the same modules as one `run_codegen` call per
+    schema with `class_name` set to that title.
+
+    Args:
+        schemas: Mapping of module name to its JSON schema; each schema needs a `title`
+        output_dir: Directory to write `<module name>.py` files into
+        **options: datamodel-code-generator options added to `SHARED_OPTIONS`
+            (e.g. `base_class`); `class_name` does not apply to a batch
+
+    Returns:
+        The paths of the generated modules, in the order of `schemas`
+    """
+    with tempfile.TemporaryDirectory(prefix="codegen-batch-") as temp_dir:
+        input_dir = Path(temp_dir) / "schemas"
+        generated_dir = Path(temp_dir) / "models"
+        input_dir.mkdir()
+        for module_name, schema in schemas.items():
+            (input_dir / f"{module_name}.json").write_text(json.dumps(schema))
+
+        _generate(input_dir, generated_dir, options)
+
+        output_dir.mkdir(parents=True, exist_ok=True)
+        output_paths = []
+        for module_name in schemas:
+            output_path = output_dir / f"{module_name}.py"
+            shutil.move(generated_dir / f"{module_name}.py", output_path)
+            output_paths.append(output_path)
+    return output_paths
+
+
+def _generate(source: str | Path, output: Path, options: Mapping[str, Any]) -> None:
+    with warnings.catch_warnings():
+        # Notices about upcoming default changes; the CLI printed them to captured stderr.
+        warnings.simplefilter("ignore", FutureWarning)
+        generate(
+            source,
+            output=output,
+            custom_file_header_path=get_repo_root() / ".header.txt",
+            **{**SHARED_OPTIONS, **options},
+        )
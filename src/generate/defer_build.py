@@ -0,0 +1,106 @@
+"""Post-processing that makes generated models defer building their pydantic schemas."""
+
+import ast
+import logging
+from pathlib import Path
+
+from .utils import base_name
+
+logger = logging.getLogger(__name__)
+
+# Bases of the model classes emitted by datamodel-codegen for our generation settings.
+MODEL_BASES = {"BaseModel", "RootModel", "BaseConfig", "BaseRecordModel"}
+
+
+def _config_call(node: ast.ClassDef) -> ast.Call | None:
+    """Return the `ConfigDict(...)` call assigned to `model_config` in a class body."""
+    for statement in node.body:
+        if (
+            isinstance(statement, ast.Assign)
+            and any(
+                isinstance(target, ast.Name) and target.id == "model_config"
+                for target in statement.targets
+            )
+            and isinstance(statement.value, ast.Call)
+        ):
+            return statement.value
+    return None
+
+
+def _insertion(node: ast.ClassDef, setting: str) -> tuple[int, str]:
+    """Return the 0-based line before which to insert a class attribute, and its text.
+
+    Like datamodel-codegen's `model_config`, the attribute goes below the blank line
+    that black keeps after a class docstring.
+    """
+    first = node.body[0]
+    is_docstring = isinstance(first, ast.Expr) and isinstance(first.value, ast.Constant)
+    if not (is_docstring and isinstance(first.value.value, str)):
+        return first.lineno - 1, setting
+    if len(node.body) > 1:
+        return node.body[1].lineno - 1, setting
+    return first.end_lineno or first.lineno, f"\n{setting}"
+
+
+def _ensure_config_dict_import(lines: list[str]) -> None:
+    """Add `ConfigDict` to the module's `from pydantic import ...` line if missing."""
+    for index, line in enumerate(lines):
+        if line.startswith("from pydantic import ") and "(" not in line:
+            names = [name.strip() for name in line.removeprefix("from pydantic import ").split(",")]
+            if "ConfigDict" not in names:
+                lines[index] = f"from pydantic import {', '.join(sorted([*names, 'ConfigDict']))}"
+            return
+    future = next(
+        (index for index, line in enumerate(lines) if line.startswith("from __future__")), -1
+    )
+    lines[future + 1 : future + 1] = ["", "from pydantic import ConfigDict"]
+
+
+def apply_defer_build(file_path: Path) -> None:
+    """Set `defer_build=True` on every model class in a generated module.
+
+    Deferred models build their core schema and validator on first use (validation,
+    serialization or schema generation) instead of at import time, so importing a
+    module with many models is cheap until one of them is actually used. Subclasses
+    inherit the setting, so only classes deriving directly from a pydantic or package
+    base class are modified; existing `model_config` dicts are extended in place.
+
+    Args:
+        file_path: Path to the generated Python file to modify
+    """
+    source = file_path.read_text()
+    lines = source.split("\n")
+    edits: list[tuple[int, int, str]] = []  # (line, column, text) insertions
+
+    for node in ast.parse(source).body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        if not any(base_name(base) in MODEL_BASES for base in node.bases):
+            continue
+        call = _config_call(node)
+        if call is None:
+            indent = " " * node.body[0].col_offset
+            line, text = _insertion(node, f"{indent}model_config = ConfigDict(defer_build=True)")
+            edits.append((line, -1, text))
+        elif any(keyword.arg == "defer_build" for keyword in call.keywords):
+            continue
+        elif call.keywords and call.keywords[0].lineno > call.lineno:
+            first = call.keywords[0]
+            edits.append((first.lineno - 1, -1, f"{' ' * first.col_offset}defer_build=True,"))
+        else:
+            separator = ", " if call.keywords or call.args else ""
+            position = call.func.end_col_offset + 1  # type: ignore[operator]
+            edits.append((call.lineno - 1, position, f"defer_build=True{separator}"))
+
+    if not edits:
+        return
+
+    for line, column, text in sorted(edits, reverse=True):
+        if column < 0:
+            lines.insert(line, text)
+        else:
+            lines[line] = lines[line][:column] + text + lines[line][column:]
+
+    _ensure_config_dict_import(lines)
+    file_path.write_text("\n".join(lines))
+    logger.info(f"Deferred schema building for {len(edits)} classes in {file_path}")
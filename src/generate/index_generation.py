@@ -0,0 +1,119 @@
+"""Generation of the static index of connector models used by the lazy registry."""
+
+import ast
+import logging
+from pathlib import Path
+
+from .utils import get_repo_root, normalize_stream_name_to_module, write_if_changed
+
+logger = logging.getLogger(__name__)
+
+PACKAGE = "airbyte_connector_models.connectors"
+INDEX_MODULE = "_index.py"
+
+
+def _root_class(module_path: Path, base_name: str) -> str | None:
+    """Return the root model class of a generated module without importing it.
+
+    Nested sub-model names extend the root model's name, so the root is the
+    shortest-named class deriving directly from `base_name`.
+    """
+    tree = ast.parse(module_path.read_text())
+    candidates = [
+        node.name
+        for node in tree.body
+        if isinstance(node, ast.ClassDef)
+        and any(isinstance(base, ast.Name) and base.id == base_name for base in node.bases)
+    ]
+    return min(candidates, key=len, default=None)
+
+
+def _stream_names(records_dir: Path) -> dict[str, str]:
+    """Map record module names to the original stream names from the schema artifacts."""
+    return {
+        normalize_stream_name_to_module(schema.stem): schema.stem
+        for schema in sorted(records_dir.glob("*.json"))
+    }
+
+
+def _entry(key: str, module: str, class_name: str, indent: str) -> list[str]:
+    """Format one `"key": (module, class_name)` dict entry."""
+    return [
+        f'{indent}"{key}": (',
+        f'{indent}    "{module}",',
+        f'{indent}    "{class_name}",',
+        f"{indent}),",
+    ]
+
+
+def generate_model_index() -> Path:
+    """Write `connectors/_index.py`, mapping connectors and streams to model locations.
+
+    The index lets `get_config_model` and `get_record_model` find a model by connector
+    name without importing (or even listing) any other generated module.
+
+    Returns:
+        Path to the written index module
+    """
+    repo_root = get_repo_root()
+    connectors_dir = repo_root / "airbyte_connector_models" / "connectors"
+    header = (repo_root / ".header.txt").read_text().rstrip("\n")
+
+    config_lines: list[str] = []
+    record_lines: list[str] = []
+    for connector_path in sorted(connectors_dir.glob("*/*")):
+        if not connector_path.is_dir() or connector_path.parent.name.startswith("_"):
+            continue
+        connector_id, connector_type = connector_path.parent.name, connector_path.name
+        connector_name = f"{connector_type}-{connector_id}"
+        module_prefix = f"{PACKAGE}.{connector_id}.{connector_type}"
+
+        config_path = connector_path / "configuration.py"
+        config_class = _root_class(config_path, "BaseConfig") if config_path.exists() else None
+        if config_class:
+            config_lines.extend(
+                _entry(connector_name, f"{module_prefix}.configuration", config_class, " " * 4)
+            )
+
+        records_dir = connector_path / "records"
+        stream_names = _stream_names(records_dir)
+        streams: list[str] = []
+        for module_path in sorted(records_dir.glob("*.py")):
+            if module_path.name == "__init__.py":
+                continue
+            record_class = _root_class(module_path, "BaseRecordModel")
+            if record_class is None:
+                continue
+            stream = stream_names.get(module_path.stem, module_path.stem)
+            module = f"{module_prefix}.records.{module_path.stem}"
+            streams.extend(_entry(stream, module, record_class, " " * 8))
+        if streams:
+            record_lines.extend([f'    "{connector_name}": {{', *streams, "    },"])
+
+    index_path = connectors_dir / INDEX_MODULE
+    write_if_changed(
+        index_path,
+        "\n".join(
+            [
+                header,
+                "",
+                '"""Static index of generated connector models.',
+                "",
+                "Generated by `python -m src.generate.main --index`; do not edit by hand.",
+                '"""',
+                "",
+                "# Connector name -> (module, config model class)",
+                "CONFIG_MODELS: dict[str, tuple[str, str]] = {",
+                *config_lines,
+                "}",
+                "",
+                "# Connector name -> stream name -> (module, record model class)",
+                "RECORD_MODELS: dict[str, dict[str, tuple[str, str]]] = {",
+                *record_lines,
+                "}",
+                "",
+            ]
+        ),
+    )
+    logger.info(f"Generated model index at {index_path}")
+    return index_path
@@ -2,8 +2,11 @@
 
 import argparse
 import logging
+import os
 
+from .cache import NO_CACHE_ENV, save_generation_cache
 from .connector_spec import get_config_spec_for_connector, get_declarative_manifest
+from .index_generation import generate_model_index
 from .metadata_generation import (
     generate_consolidated_metadata_model,
     generate_consolidated_registry_model,
@@ -15,8 +18,9 @@ from .model_generation import (
     save_config_schema_artifact,
     save_schema_artifact,
 )
+from .parallel_generation import format_summary, generate_connectors
 from .schema_extraction import extract_inline_schemas
-from .utils import get_repo_root
+from .utils import get_repo_root, write_if_changed
 
 logging.basicConfig(
     level=logging.INFO,
@@ -41,11 +45,22 @@ CONNECTORS = [
 ]
 
 
-def generate_models_for_connector(connector_name: str) -> None:
+def generate_models_for_connector(
+    connector_name: str,
+    *,
+    defer_build: bool = False,
+    record_views: bool = False,
+    batch_streams: bool = False,
+    shared_models: bool = False,
+) -> None:
     """Generate models for a specific connector.
 
     Args:
         connector_name: The connector name (e.g., "source-postgres")
+        defer_build: Defer building the models' pydantic schemas until first use
+        record_views: Also generate read-only `__slots__` views of the record models
+        batch_streams: Generate all of the connector's streams in one codegen pass
+        shared_models: Merge structurally identical nested record models into one class
     """
     logger.info(f"Generating models for {connector_name}")
 
@@ -66,7 +81,7 @@ def generate_models_for_connector(connector_name: str) -> None:
 
     spec = get_config_spec_for_connector(connector_name)
     if spec:
-        generate_config_model(connector_name, spec, config_path)
+        generate_config_model(connector_name, spec, config_path, defer_build=defer_build)
         save_config_schema_artifact(connector_id, connector_type, spec)
     else:
         logger.warning(
@@ -87,7 +102,16 @@ def generate_models_for_connector(connector_name: str) -> None:
                 logger.info(f"Removed old records.py file: {old_records_file}")
 
             records_dir = connector_path / "records"
-            generate_record_models(connector_name, connector_id, schemas, records_dir)
+            generate_record_models(
+                connector_name,
+                connector_id,
+                schemas,
+                records_dir,
+                defer_build=defer_build,
+                record_views=record_views,
+                batch_streams=batch_streams,
+                shared_models=shared_models,
+            )
         else:
             logger.warning(f"No inline schemas found in manifest for {connector_name}")
     else:
@@ -95,10 +119,13 @@ def generate_models_for_connector(connector_name: str) -> None:
 
     records_dir = connector_path / "records"
     if config_path.exists() or records_dir.exists():
-        (base_path / connector_id / "__init__.py").write_text(
-            f'"""Models for {connector_id} connector."""\n'
+        write_if_changed(
+            base_path / connector_id / "__init__.py",
+            f'"""Models for {connector_id} connector."""\n',
         )
-        (connector_path / "__init__.py").write_text(f'"""Models for {connector_name}."""\n')
+        write_if_changed(connector_path / "__init__.py", f'"""Models for {connector_name}."""\n')
+
+    save_generation_cache()
 
 
 def main() -> None:
@@ -131,46 +158,93 @@ def main() -> None:
         help="Generate consolidated registry model from bundled JSON "
         "(requires npm run bundle-schemas first)",
     )
+    parser.add_argument(
+        "--index",
+        action="store_true",
+        help="Regenerate the connector model index only",
+    )
+    parser.add_argument(
+        "--defer-build",
+        action="store_true",
+        help="Emit models that build their pydantic schemas on first use instead of at import",
+    )
+    parser.add_argument(
+        "--record-views",
+        action="store_true",
+        help="Also emit read-only __slots__ views of record models, with from_validated_dict",
+    )
+    parser.add_argument(
+        "--batch-streams",
+        action="store_true",
+        help="Generate all record models of a connector in one codegen pass",
+    )
+    parser.add_argument(
+        "--shared-models",
+        action="store_true",
+        help="Merge structurally identical nested record models into one class with aliases",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate every model, ignoring the .generate-cache.json of unchanged inputs",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of connectors to generate concurrently (logs are grouped per connector)",
+    )
 
     args = parser.parse_args()
 
+    if args.force:
+        # Set in the environment so that --jobs worker processes inherit it.
+        os.environ[NO_CACHE_ENV] = "1"
+
     if args.registry:
         logger.info("Generating consolidated registry model only")
-        generate_consolidated_registry_model()
+        generate_consolidated_registry_model(defer_build=args.defer_build)
         return
 
     if args.consolidated:
         logger.info("Generating consolidated metadata model only")
-        generate_consolidated_metadata_model()
+        generate_consolidated_metadata_model(defer_build=args.defer_build)
+        return
+
+    if args.index:
+        logger.info("Generating connector model index only")
+        generate_model_index()
         return
 
     if args.metadata:
         logger.info("Generating metadata models only")
-        generate_metadata_models()
+        generate_metadata_models(defer_build=args.defer_build)
         return
 
     if args.connector:
-        generate_models_for_connector(args.connector)
-    elif args.all:
-        for connector in CONNECTORS:
-            try:
-                generate_models_for_connector(connector)
-            except Exception:
-                logger.exception(f"Failed to generate models for {connector}")
-        try:
-            generate_metadata_models()
-        except Exception:
-            logger.exception("Failed to generate metadata models")
+        generate_models_for_connector(
+            args.connector,
+            defer_build=args.defer_build,
+            record_views=args.record_views,
+            batch_streams=args.batch_streams,
+            shared_models=args.shared_models,
+        )
     else:
-        for connector in CONNECTORS:
-            try:
-                generate_models_for_connector(connector)
-            except Exception:
-                logger.exception(f"Failed to generate models for {connector}")
+        results = generate_connectors(
+            CONNECTORS,
+            jobs=args.jobs,
+            defer_build=args.defer_build,
+            record_views=args.record_views,
+            batch_streams=args.batch_streams,
+            shared_models=args.shared_models,
+        )
         try:
-            generate_metadata_models()
+            generate_metadata_models(defer_build=args.defer_build)
         except Exception:
             logger.exception("Failed to generate metadata models")
+        logger.info(f"Connector generation summary:\n{format_summary(results)}")
+
+    generate_model_index()
 
 
 if __name__ == "__main__":
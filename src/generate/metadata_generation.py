@@ -1,15 +1,15 @@
 """Functions for generating Pydantic models from metadata schemas."""
 
-import json
 import logging
 import re
-import subprocess
-import tempfile
 from pathlib import Path
 
 import yaml
 
-from .utils import get_repo_root, to_snake_case_module
+from .cache import file_digest, regenerate, save_generation_cache
+from .codegen import run_codegen
+from .defer_build import apply_defer_build
+from .utils import get_repo_root, to_snake_case_module, write_if_changed
 
 logger = logging.getLogger(__name__)
 
@@ -147,11 +147,14 @@ def _fix_forward_references(file_path: Path) -> None:
     logger.info(f"Reordered {len(sorted_classes)} classes in {file_path}")
 
 
-def generate_metadata_models() -> None:
+def generate_metadata_models(*, defer_build: bool = False) -> None:
     """Generate Pydantic models from metadata schemas.
 
     Reads all YAML schemas from src/metadata/v0/ and generates
     corresponding Pydantic models in airbyte_connector_models/metadata/v0/.
+
+    Args:
+        defer_build: Defer building the models' pydantic schemas until first use
     """
     logger.info("Generating metadata models")
 
@@ -160,8 +163,6 @@ def generate_metadata_models() -> None:
     output_dir = repo_root / "airbyte_connector_models" / "metadata" / "v0"
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    header_path = repo_root / ".header.txt"
-
     schema_files = sorted(schema_dir.glob("*.yaml"))
 
     if not schema_files:
@@ -181,51 +182,16 @@ def generate_metadata_models() -> None:
             with schema_file.open() as f:
                 schema_data = yaml.safe_load(f)
 
-            with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as temp_file:
-                json.dump(schema_data, temp_file)
-                temp_schema_path = temp_file.name
-
-            try:
-                subprocess.run(
-                    [
-                        "datamodel-codegen",
-                        "--input",
-                        temp_schema_path,
-                        "--output",
-                        str(output_file),
-                        "--input-file-type",
-                        "jsonschema",
-                        "--output-model-type",
-                        "pydantic_v2.BaseModel",
-                        "--class-name",
-                        model_name,
-                        "--use-standard-collections",
-                        "--use-union-operator",
-                        "--field-constraints",
-                        "--use-annotated",
-                        "--keyword-only",
-                        "--disable-timestamp",
-                        "--use-exact-imports",
-                        "--use-double-quotes",
-                        "--keep-model-order",
-                        "--use-schema-description",
-                        "--parent-scoped-naming",
-                        "--use-title-as-name",
-                        "--target-python-version",
-                        "3.10",
-                        "--custom-file-header-path",
-                        str(header_path),
-                        "--snake-case-field",
-                    ],
-                    check=True,
-                    capture_output=True,
-                    text=True,
-                )
-
-                logger.info(f"Generated {output_file}")
-
-            finally:
-                Path(temp_schema_path).unlink(missing_ok=True)
+            with regenerate(output_file, schema_data, model_name, defer_build) as stale:
+                if stale:
+                    run_codegen(
+                        schema_data, output_file, class_name=model_name, snake_case_field=True
+                    )
+
+                    logger.info(f"Generated {output_file}")
+
+                    if defer_build:
+                        apply_defer_build(output_file)
 
         except Exception:
             logger.exception(f"Failed to generate model for {schema_file.name}")
@@ -235,16 +201,20 @@ def generate_metadata_models() -> None:
         "# Copyright (c) 2025 Airbyte, Inc., all rights reserved.\n\n"
         '"""Metadata models for Airbyte connectors."""\n'
     )
-    init_file.write_text(init_content)
+    write_if_changed(init_file, init_content)
+    save_generation_cache()
 
     logger.info(f"Generated {len(schema_files)} metadata models in {output_dir}")
 
 
-def generate_consolidated_metadata_model() -> None:
+def generate_consolidated_metadata_model(*, defer_build: bool = False) -> None:
     """Generate a single consolidated Pydantic model from bundled JSON schema.
 
     Reads the bundled ConnectorMetadataDefinitionV0.json and generates a single
     Python file containing all metadata model classes.
+
+    Args:
+        defer_build: Defer building the models' pydantic schemas until first use
     """
     logger.info("Generating consolidated metadata model from bundled JSON")
 
@@ -264,14 +234,19 @@ def generate_consolidated_metadata_model() -> None:
         / "connector_metadata_definition_v0.py"
     )
 
-    _generate_consolidated_model(bundled_json, output_file, "ConnectorMetadataDefinitionV0")
+    _generate_consolidated_model(
+        bundled_json, output_file, "ConnectorMetadataDefinitionV0", defer_build=defer_build
+    )
 
 
-def generate_consolidated_registry_model() -> None:
+def generate_consolidated_registry_model(*, defer_build: bool = False) -> None:
     """Generate a single consolidated Pydantic model for registry from bundled JSON schema.
 
     Reads the bundled ConnectorRegistryV0.json and generates a single
     Python file containing all registry model classes.
+
+    Args:
+        defer_build: Defer building the models' pydantic schemas until first use
     """
     logger.info("Generating consolidated registry model from bundled JSON")
 
@@ -283,66 +258,42 @@ def generate_consolidated_registry_model() -> None:
         repo_root / "airbyte_connector_models" / "metadata" / "v0" / "connector_registry_v0.py"
     )
 
-    _generate_consolidated_model(bundled_json, output_file, "ConnectorRegistryV0")
+    _generate_consolidated_model(
+        bundled_json, output_file, "ConnectorRegistryV0", defer_build=defer_build
+    )
 
 
-def _generate_consolidated_model(bundled_json: Path, output_file: Path, schema_name: str) -> None:
+def _generate_consolidated_model(
+    bundled_json: Path, output_file: Path, schema_name: str, *, defer_build: bool = False
+) -> None:
     """Internal helper to generate a consolidated model from bundled JSON.
 
     Args:
         bundled_json: Path to the bundled JSON schema
         output_file: Path to the output Python file
         schema_name: Name of the schema for logging
+        defer_build: Defer building the models' pydantic schemas until first use
     """
     if not bundled_json.exists():
         logger.error(f"Bundled JSON not found: {bundled_json}")
         logger.error("Run 'npm run bundle-schemas' first to create the bundled JSON")
         return
 
-    repo_root = get_repo_root()
-    header_path = repo_root / ".header.txt"
-
     try:
-        subprocess.run(
-            [
-                "datamodel-codegen",
-                "--input",
-                str(bundled_json),
-                "--output",
-                str(output_file),
-                "--input-file-type",
-                "jsonschema",
-                "--output-model-type",
-                "pydantic_v2.BaseModel",
-                "--use-standard-collections",
-                "--use-union-operator",
-                "--field-constraints",
-                "--use-annotated",
-                "--keyword-only",
-                "--disable-timestamp",
-                "--use-exact-imports",
-                "--use-double-quotes",
-                "--keep-model-order",
-                "--use-schema-description",
-                "--parent-scoped-naming",
-                "--use-title-as-name",
-                "--target-python-version",
-                "3.10",
-                "--custom-file-header-path",
-                str(header_path),
-                "--snake-case-field",
-            ],
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-
-        logger.info(f"Generated consolidated model: {output_file}")
-
-        # Fix forward reference issues in the generated code
-        _fix_forward_references(output_file)
-
-    except subprocess.CalledProcessError as e:
+        with regenerate(output_file, file_digest(bundled_json), defer_build) as stale:
+            if not stale:
+                return
+            run_codegen(bundled_json, output_file, snake_case_field=True)
+
+            logger.info(f"Generated consolidated model: {output_file}")
+
+            # Fix forward reference issues in the generated code
+            _fix_forward_references(output_file)
+
+            if defer_build:
+                apply_defer_build(output_file)
+
+    except Exception:
         logger.exception(f"Failed to generate consolidated model for {schema_name}")
-        logger.info(f"stdout: {e.stdout}")
-        logger.info(f"stderr: {e.stderr}")
+    finally:
+        save_generation_cache()
@@ -2,15 +2,21 @@
 
 import json
 import logging
-import subprocess
-import tempfile
+from contextlib import ExitStack
 from pathlib import Path
 from typing import Any
 
-from .utils import get_repo_root, normalize_stream_name_to_module
+from .cache import file_digest, regenerate
+from .codegen import run_codegen, run_codegen_batch
+from .defer_build import apply_defer_build
+from .shared_models import apply_shared_models
+from .utils import get_repo_root, normalize_stream_name_to_module, write_if_changed
+from .view_generation import VIEWS_DIR, generate_record_views
 
 logger = logging.getLogger(__name__)
 
+RECORD_BASE_CLASS = "models.connectors._internal.base_record.BaseRecordModel"
+
 
 def save_schema_artifact(
     connector_id: str,
@@ -34,7 +40,7 @@ def save_schema_artifact(
     schema_dir.mkdir(parents=True, exist_ok=True)
 
     schema_file = schema_dir / f"{stream_name}.json"
-    schema_file.write_text(json.dumps(schema, indent=2))
+    write_if_changed(schema_file, json.dumps(schema, indent=2))
 
     logger.info(f"Saved schema artifact: {schema_file}")
     return schema_file
@@ -61,7 +67,7 @@ def save_config_schema_artifact(
 
     schema_file = schema_dir / "configuration.json"
     config_schema = spec.get("connectionSpecification", {})
-    schema_file.write_text(json.dumps(config_schema, indent=2))
+    write_if_changed(schema_file, json.dumps(config_schema, indent=2))
 
     logger.info(f"Saved config schema artifact: {schema_file}")
     return schema_file
@@ -71,6 +77,8 @@ def generate_config_model(
     connector_name: str,
     spec: dict[str, Any],
     output_path: Path,
+    *,
+    defer_build: bool = False,
 ) -> None:
     """Generate a Pydantic config model from a connector spec.
 
@@ -78,6 +86,7 @@ def generate_config_model(
         connector_name: The connector name (e.g., "source-postgres")
         spec: The connector specification
         output_path: Path to write the generated model
+        defer_build: Defer building the models' pydantic schemas until first use
     """
     logger.info(f"Generating config model for {connector_name}")
 
@@ -94,56 +103,21 @@ def generate_config_model(
     schema_for_codegen = connection_spec.copy()
     schema_for_codegen.pop("title", None)
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as temp_file:
-        json.dump(schema_for_codegen, temp_file)
-        temp_schema_path = temp_file.name
-
-    try:
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        repo_root = get_repo_root()
-        header_path = repo_root / ".header.txt"
-
-        subprocess.run(
-            [
-                "datamodel-codegen",
-                "--input",
-                temp_schema_path,
-                "--output",
-                str(output_path),
-                "--input-file-type",
-                "jsonschema",
-                "--output-model-type",
-                "pydantic_v2.BaseModel",
-                "--class-name",
-                model_name,
-                "--base-class",
-                "models.connectors._internal.base_config.BaseConfig",
-                "--use-standard-collections",
-                "--use-union-operator",
-                "--field-constraints",
-                "--use-annotated",
-                "--keyword-only",
-                "--disable-timestamp",
-                "--use-exact-imports",
-                "--use-double-quotes",
-                "--keep-model-order",
-                "--use-schema-description",
-                "--parent-scoped-naming",
-                "--use-title-as-name",
-                "--target-python-version",
-                "3.10",
-                "--custom-file-header-path",
-                str(header_path),
-            ],
-            check=True,
-            capture_output=True,
-            text=True,
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with regenerate(output_path, schema_for_codegen, model_name, defer_build) as stale:
+        if not stale:
+            return
+        run_codegen(
+            schema_for_codegen,
+            output_path,
+            class_name=model_name,
+            base_class="models.connectors._internal.base_config.BaseConfig",
         )
 
         logger.info(f"Generated config model at {output_path}")
 
-    finally:
-        Path(temp_schema_path).unlink(missing_ok=True)
+        if defer_build:
+            apply_defer_build(output_path)
 
 
 def generate_record_models(
@@ -151,6 +125,11 @@ def generate_record_models(
     connector_id: str,
     schemas: dict[str, dict[str, Any]],
     output_dir: Path,
+    *,
+    defer_build: bool = False,
+    record_views: bool = False,
+    batch_streams: bool = False,
+    shared_models: bool = False,
 ) -> None:
     """Generate Pydantic record models from schemas.
 
@@ -162,6 +141,13 @@ def generate_record_models(
         connector_id: The connector ID (e.g., "xkcd")
         schemas: Dictionary mapping stream names to their schemas
         output_dir: Path to the records/ directory
+        defer_build: Defer building the models' pydantic schemas until first use
+        record_views: Also generate read-only `__slots__` views of the record models
+            into the sibling views/ directory
+        batch_streams: Generate all changed streams in one codegen pass instead of
+            one pass per stream
+        shared_models: Merge structurally identical nested models of each stream into
+            one shared class, keeping the other names as aliases
     """
     logger.info(f"Generating record models for {connector_name}")
 
@@ -170,10 +156,9 @@ def generate_record_models(
         return
 
     output_dir.mkdir(parents=True, exist_ok=True)
-    repo_root = get_repo_root()
-    header_path = repo_root / ".header.txt"
 
     module_names_seen: dict[str, list[str]] = {}
+    models: dict[str, tuple[str, dict[str, Any]]] = {}
 
     for stream_name, schema in schemas.items():
         module_name = normalize_stream_name_to_module(stream_name)
@@ -191,59 +176,55 @@ def generate_record_models(
             )
 
         class_name = "".join(word.capitalize() for word in stream_name.replace("-", "_").split("_"))
-        model_name = f"{connector_id.capitalize()}{class_name}Record"
-
-        # Create temp schema file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as temp_file:
-            json.dump(schema, temp_file)
-            temp_schema_path = temp_file.name
-
-        try:
-            output_file = output_dir / f"{module_name}.py"
-
-            subprocess.run(
-                [
-                    "datamodel-codegen",
-                    "--input",
-                    temp_schema_path,
-                    "--output",
-                    str(output_file),
-                    "--input-file-type",
-                    "jsonschema",
-                    "--output-model-type",
-                    "pydantic_v2.BaseModel",
-                    "--class-name",
-                    model_name,
-                    "--base-class",
-                    "models.connectors._internal.base_record.BaseRecordModel",
-                    "--use-standard-collections",
-                    "--use-union-operator",
-                    "--field-constraints",
-                    "--use-annotated",
-                    "--keyword-only",
-                    "--disable-timestamp",
-                    "--use-exact-imports",
-                    "--use-double-quotes",
-                    "--keep-model-order",
-                    "--use-schema-description",
-                    "--parent-scoped-naming",
-                    "--use-title-as-name",
-                    "--target-python-version",
-                    "3.10",
-                    "--custom-file-header-path",
-                    str(header_path),
-                ],
-                check=True,
-                capture_output=True,
-                text=True,
+        models[module_name] = (f"{connector_id.capitalize()}{class_name}Record", schema)
+
+    with ExitStack() as stack:
+        stale = [
+            module_name
+            for module_name, (model_name, schema) in models.items()
+            if stack.enter_context(
+                regenerate(
+                    output_dir / f"{module_name}.py", schema, model_name, defer_build, shared_models
+                )
             )
-
+        ]
+
+        if batch_streams and stale:
+            output_files = run_codegen_batch(
+                {
+                    module_name: {**models[module_name][1], "title": models[module_name][0]}
+                    for module_name in stale
+                },
+                output_dir,
+                base_class=RECORD_BASE_CLASS,
+            )
+        else:
+            output_files = []
+            for module_name in stale:
+                model_name, schema = models[module_name]
+                output_file = output_dir / f"{module_name}.py"
+                run_codegen(
+                    schema, output_file, class_name=model_name, base_class=RECORD_BASE_CLASS
+                )
+                output_files.append(output_file)
+
+        for output_file in output_files:
             logger.info(f"Generated {output_file}")
 
-        finally:
-            Path(temp_schema_path).unlink(missing_ok=True)
+            if shared_models:
+                apply_shared_models(output_file)
+
+            if defer_build:
+                apply_defer_build(output_file)
+
+    if record_views:
+        for module_name in models:
+            output_file = output_dir / f"{module_name}.py"
+            view_file = output_dir.parent / VIEWS_DIR / f"{module_name}.py"
+            with regenerate(view_file, file_digest(output_file)) as stale_view:
+                if stale_view:
+                    generate_record_views(output_file, view_file)
 
-    init_file = output_dir / "__init__.py"
-    init_file.write_text("")
+    write_if_changed(output_dir / "__init__.py", "")
 
     logger.info(f"Generated {len(schemas)} record model files in {output_dir}")
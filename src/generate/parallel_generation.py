@@ -0,0 +1,183 @@
+"""Concurrent generation of connector models with per-connector logs and a summary."""
+
+import io
+import logging
+import multiprocessing
+import sys
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import NamedTuple
+
+logger = logging.getLogger(__name__)
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+
+class ConnectorResult(NamedTuple):
+    """Outcome of generating the models of one connector."""
+
+    connector: str
+    ok: bool
+    seconds: float
+    issues: int
+    error: str | None
+    log: str
+
+
+class _CapturingHandler(logging.Handler):
+    """Collect the formatted log output of one connector and count its warnings and errors."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.setFormatter(logging.Formatter(LOG_FORMAT))
+        self.output = io.StringIO()
+        self.issues = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if record.levelno >= logging.WARNING:
+            self.issues += 1
+        self.output.write(f"{self.format(record)}\n")
+
+
+def generate_connector(
+    connector: str,
+    *,
+    isolated: bool,
+    generate: Callable[..., None] | None = None,
+    **options: bool,
+) -> ConnectorResult:
+    """Generate the models of one connector, capturing its log output.
+
+    Args:
+        connector: The connector name (e.g., "source-postgres")
+        isolated: Only capture the connector's log output instead of also emitting it
+            through the existing handlers
+        generate: Function generating one connector's models, called with the
+            connector name and `options` (defaults to `generate_models_for_connector`)
+        **options: Generation options passed on to `generate` (`defer_build`,
+            `record_views`, `batch_streams`, `shared_models`)
+
+    Returns:
+        The connector's result; failures are captured rather than raised
+    """
+    if generate is None:
+        from .main import generate_models_for_connector as generate  # noqa: PLC0415
+
+    root = logging.getLogger()
+    handler = _CapturingHandler()
+    previous = root.handlers[:]
+    previous_level = root.level
+    if isolated:
+        root.handlers = [handler]
+        root.setLevel(logging.INFO)
+    else:
+        root.addHandler(handler)
+
+    start = time.perf_counter()
+    error = None
+    try:
+        generate(connector, **options)
+    except Exception as e:
+        logger.exception(f"Failed to generate models for {connector}")
+        error = f"{type(e).__name__}: {e}".splitlines()[0]
+    finally:
+        root.handlers = previous
+        root.setLevel(previous_level)
+
+    return ConnectorResult(
+        connector=connector,
+        ok=error is None,
+        seconds=time.perf_counter() - start,
+        issues=handler.issues,
+        error=error,
+        log=handler.output.getvalue(),
+    )
+
+
+def _print_log(result: ConnectorResult) -> None:
+    sys.stderr.write(f"===== {result.connector} =====\n{result.log}")
+    sys.stderr.flush()
+
+
+def generate_connectors(
+    connectors: Iterable[str],
+    *,
+    jobs: int = 1,
+    generate: Callable[..., None] | None = None,
+    defer_build: bool = False,
+    record_views: bool = False,
+    batch_streams: bool = False,
+    shared_models: bool = False,
+) -> list[ConnectorResult]:
+    """Generate the models of several connectors, optionally in parallel.
+
+    With `jobs > 1` connectors are generated in a pool of worker processes. Either
+    way, a connector's log output is captured while it is generated and printed to
+    stderr as one block when the connector finishes, so output from concurrent
+    connectors never interleaves and serial runs look the same.
+
+    Args:
+        connectors: The connector names to generate
+        jobs: Number of connectors to generate at once
+        generate: Function generating one connector's models (see `generate_connector`);
+            must be importable by name when `jobs > 1`
+        defer_build: Defer building the models' pydantic schemas until first use
+        record_views: Also generate read-only `__slots__` views of the record models
+        batch_streams: Generate all of a connector's streams in one codegen pass
+        shared_models: Merge structurally identical nested record models into one class
+
+    Returns:
+        One result per connector, in the order given
+    """
+    connectors = list(connectors)
+    options = {
+        "generate": generate,
+        "defer_build": defer_build,
+        "record_views": record_views,
+        "batch_streams": batch_streams,
+        "shared_models": shared_models,
+    }
+    if jobs <= 1:
+        results = []
+        for connector in connectors:
+            result = generate_connector(connector, isolated=True, **options)
+            _print_log(result)
+            results.append(result)
+        return results
+
+    by_connector: dict[str, ConnectorResult] = {}
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=context) as executor:
+        futures = [
+            executor.submit(generate_connector, connector, isolated=True, **options)
+            for connector in connectors
+        ]
+        for future in as_completed(futures):
+            result = future.result()
+            by_connector[result.connector] = result
+            _print_log(result)
+    return [by_connector[connector] for connector in connectors]
+
+
+def format_summary(results: list[ConnectorResult]) -> str:
+    """Format connector results as a plain-text table.
+
+    Args:
+        results: The results to summarize
+
+    Returns:
+        The table, one row per connector followed by a totals line
+    """
+    width = max([len("Connector"), *(len(result.connector) for result in results)])
+    lines = [f"{'Connector':<{width}}  {'Status':<6}  {'Time':>8}  {'Issues':>6}  Error"]
+    for result in results:
+        status = "ok" if result.ok else "FAILED"
+        lines.append(
+            f"{result.connector:<{width}}  {status:<6}  {result.seconds:>7.1f}s  "
+            f"{result.issues:>6}  {result.error or ''}".rstrip()
+        )
+    failed = sum(not result.ok for result in results)
+    total = sum(result.seconds for result in results)
+    lines.append(f"{len(results)} connectors, {failed} failed, {total:.1f}s of generation time")
+    return "\n".join(lines)
@@ -0,0 +1,197 @@
+"""Post-processing that merges structurally identical model classes of a generated module."""
+
+import ast
+import copy
+import logging
+import re
+from pathlib import Path
+
+import black
+
+logger = logging.getLogger(__name__)
+
+# Shared classes with more fields than this are named after their shortest member.
+MAX_NAMED_FIELDS = 3
+
+_WORD = re.compile(r"[A-Z][a-z0-9]*|[a-z0-9]+")
+
+
+class _Rename(ast.NodeTransformer):
+    """Replace references to merged classes by their shared class."""
+
+    def __init__(self, shared: dict[str, str]) -> None:
+        self.shared = shared
+
+    def visit_Name(self, node: ast.Name) -> ast.Name:
+        node.id = self.shared.get(node.id, node.id)
+        return node
+
+
+def _structure(node: ast.ClassDef, shared: dict[str, str]) -> str:
+    """Return a key that is equal for classes differing only in name.
+
+    References to classes already merged are normalized to their shared class, so
+    that classes nesting identical sub-models compare equal too.
+    """
+    anonymous = _Rename(shared).visit(copy.deepcopy(node))
+    anonymous.name = ""
+    return ast.dump(anonymous)
+
+
+def _resolve(name: str, shared: dict[str, str]) -> str:
+    """Follow merges until reaching a class that was kept."""
+    while name in shared:
+        name = shared[name]
+    return name
+
+
+def _merge(classes: list[ast.ClassDef]) -> dict[str, str]:
+    """Map every duplicated class to the first class in module order identical to it.
+
+    Merging repeats until no more classes become identical, so parents of merged
+    sub-models are merged as well.
+    """
+    shared: dict[str, str] = {}
+    while True:
+        structures: dict[str, str] = {}
+        merged = False
+        for node in classes:
+            if node.name in shared:
+                continue
+            key = _structure(node, shared)
+            if key in structures:
+                shared[node.name] = structures[key]
+                merged = True
+            else:
+                structures[key] = node.name
+        if not merged:
+            return shared
+        # A shared class may itself have been merged into an earlier one.
+        shared = {name: _resolve(target, shared) for name, target in shared.items()}
+
+
+def _field_word(field: str) -> str:
+    """Return a field name as a capitalized word, e.g. `held_items` -> `HeldItems`."""
+    return "".join(part[:1].upper() + part[1:] for part in field.split("_"))
+
+
+def _shared_name(node: ast.ClassDef, members: list[str], taken: set[str]) -> str:
+    """Name the class shared by `members` after their common prefix and its fields.
+
+    The `{name, url}` resources nested in a PokeAPI record become e.g.
+    `PokeapiPokemonRecordNameUrl`, which does not suggest any one of the places the
+    structure occurs. Structures with many fields, or whose name would clash with
+    another class, keep their shortest member name instead.
+    """
+    prefix = []
+    for words in zip(*(_WORD.findall(member) for member in members), strict=False):
+        if len(set(words)) > 1:
+            break
+        prefix.append(words[0])
+    fields = [
+        statement.target.id
+        for statement in node.body
+        if isinstance(statement, ast.AnnAssign) and isinstance(statement.target, ast.Name)
+    ]
+    name = "".join(prefix) + "".join(_field_word(field) for field in fields)
+    if not fields or len(fields) > MAX_NAMED_FIELDS or name in taken:
+        return min(members, key=len)
+    return name
+
+
+def find_shared_models(tree: ast.Module) -> dict[str, str]:
+    """Map every class of a repeated structure in a module to its shared class name.
+
+    Classes are compared by their bases and full body (fields, annotations, defaults,
+    config and docstrings); parents of identical sub-models are compared after merging
+    those, so they are shared as well. Each structure gets a neutral name (see
+    `_shared_name`) rather than the name of the first place it occurs.
+
+    Args:
+        tree: The parsed module
+
+    Returns:
+        Mapping of class name to shared class name, for every class of a structure that
+        occurs more than once
+    """
+    classes = [node for node in tree.body if isinstance(node, ast.ClassDef)]
+    merged = _merge(classes)
+    groups: dict[str, list[str]] = {}
+    for node in classes:
+        if node.name in merged or node.name in merged.values():
+            groups.setdefault(merged.get(node.name, node.name), []).append(node.name)
+
+    by_name = {node.name: node for node in classes}
+    taken = {node.name for node in classes}
+    shared: dict[str, str] = {}
+    for first, members in groups.items():
+        name = _shared_name(by_name[first], members, taken - set(members))
+        taken.add(name)
+        shared.update(dict.fromkeys(members, name))
+    return shared
+
+
+def apply_shared_models(file_path: Path) -> int:
+    """Replace structurally identical model classes in a generated module by aliases.
+
+    datamodel-codegen names nested models after their position in the schema, so a
+    sub-schema repeated in several places (e.g. PokeAPI's `{name, url}` resources)
+    becomes one class per occurrence. This keeps one class per structure under a
+    neutral name (see `find_shared_models`), points every annotation at it and turns
+    all the generated names into module-level aliases, so existing imports keep
+    working while each structure is only built and validated once.
+
+    Args:
+        file_path: Path to the generated Python file to modify
+
+    Returns:
+        The number of class definitions removed from the module
+    """
+    source = file_path.read_text()
+    tree = ast.parse(source)
+    shared = find_shared_models(tree)
+    if not shared:
+        return 0
+
+    lines = source.split("\n")
+    edits: list[tuple[int, int, int, str]] = []  # (line, start column, end column, text)
+    kept: set[str] = set()
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        if node.name in shared and shared[node.name] in kept:
+            first = node.decorator_list[0].lineno if node.decorator_list else node.lineno
+            for line in range(first - 1, node.end_lineno or node.lineno):
+                edits.append((line, 0, len(lines[line]), ""))
+            continue
+        if node.name in shared:
+            # The first class of a structure is kept under the shared name.
+            kept.add(shared[node.name])
+            start = lines[node.lineno - 1].index(node.name)
+            edits.append((node.lineno - 1, start, start + len(node.name), shared[node.name]))
+        for name in ast.walk(node):
+            if isinstance(name, ast.Name) and name.id in shared:
+                edits.append(
+                    (
+                        name.lineno - 1,
+                        name.col_offset,
+                        name.end_col_offset or name.col_offset,
+                        shared[name.id],
+                    )
+                )
+
+    for line, start, end, text in sorted(edits, reverse=True):
+        lines[line] = lines[line][:start] + text + lines[line][end:]
+
+    aliases = [
+        f"{node.name} = {shared[node.name]}"
+        for node in tree.body
+        if isinstance(node, ast.ClassDef) and shared.get(node.name, node.name) != node.name
+    ]
+    comment = "# Generated names of the shared classes, kept so existing imports keep working."
+    code = "\n".join([*lines, "", "", comment, *aliases])
+    # black ships with datamodel-code-generator and formats the generated models too.
+    file_path.write_text(black.format_str(code, mode=black.Mode(line_length=100)))
+    removed = len(shared) - len(kept)
+    logger.info(f"Merged {removed} structurally identical classes in {file_path}")
+    return removed
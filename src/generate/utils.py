@@ -1,5 +1,6 @@
 """Utility functions for model generation."""
 
+import ast
 import keyword
 import re
 from pathlib import Path
@@ -69,3 +70,33 @@ def to_snake_case_module(name: str) -> str:
 def get_repo_root() -> Path:
     """Get the repository root directory."""
     return Path(__file__).parent.parent.parent
+
+
+def base_name(base: ast.expr) -> str | None:
+    """Return the class name of an expression like `BaseModel` or `RootModel[str]`."""
+    if isinstance(base, ast.Subscript):
+        base = base.value
+    if isinstance(base, ast.Attribute):
+        return base.attr
+    if isinstance(base, ast.Name):
+        return base.id
+    return None
+
+
+def write_if_changed(path: Path, content: str) -> bool:
+    """Write a file only if its content differs, keeping the mtime of unchanged files.
+
+    Args:
+        path: The file to write
+        content: The new content
+
+    Returns:
+        True if the file was written
+    """
+    try:
+        if path.read_text() == content:
+            return False
+    except FileNotFoundError:
+        pass
+    path.write_text(content)
+    return True
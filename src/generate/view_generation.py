@@ -0,0 +1,233 @@
+"""Generation of `__slots__`-backed read-only views of generated record models."""
+
+import ast
+import copy
+import logging
+from pathlib import Path
+
+import black
+
+from .utils import base_name, write_if_changed
+
+logger = logging.getLogger(__name__)
+
+VIEWS_DIR = "views"
+VIEW_SUFFIX = "View"
+
+# Names that can stay in view annotations; anything else from the model module becomes Any.
+_KEPT_NAMES = {"Any", "None", "bool", "bytes", "dict", "float", "int", "list", "str"}
+
+
+def _unwrap(annotation: ast.expr) -> ast.expr:
+    """Strip `Annotated[...]` from a field annotation."""
+    if (
+        isinstance(annotation, ast.Subscript)
+        and base_name(annotation.value) == "Annotated"
+        and isinstance(annotation.slice, ast.Tuple)
+    ):
+        return annotation.slice.elts[0]
+    return annotation
+
+
+def _union_members(annotation: ast.expr) -> list[ast.expr]:
+    """Split `A | B | None` into its non-null members."""
+    if isinstance(annotation, ast.BinOp) and isinstance(annotation.op, ast.BitOr):
+        return _union_members(annotation.left) + _union_members(annotation.right)
+    if isinstance(annotation, ast.Constant) and annotation.value is None:
+        return []
+    return [annotation]
+
+
+def _field_alias(annotation: ast.expr, name: str) -> str:
+    """Return the schema name of a field from its `Field(alias=...)`, if any."""
+    if isinstance(annotation, ast.Subscript) and isinstance(annotation.slice, ast.Tuple):
+        for call in annotation.slice.elts[1:]:
+            if not isinstance(call, ast.Call):
+                continue
+            for keyword_arg in call.keywords:
+                if keyword_arg.arg == "alias" and isinstance(keyword_arg.value, ast.Constant):
+                    return str(keyword_arg.value.value)
+    return name
+
+
+class _ViewAnnotation(ast.NodeTransformer):
+    """Rewrite a model annotation for the view: models become views, lists become tuples."""
+
+    def __init__(self, models: set[str]) -> None:
+        self.models = models
+
+    def visit_Name(self, node: ast.Name) -> ast.expr:
+        if node.id in self.models:
+            return ast.Name(f"{node.id}{VIEW_SUFFIX}")
+        if node.id in _KEPT_NAMES:
+            return node
+        return ast.Name("Any")
+
+    def visit_Attribute(self, _node: ast.Attribute) -> ast.expr:
+        return ast.Name("Any")
+
+    def visit_Subscript(self, node: ast.Subscript) -> ast.expr:
+        if base_name(node.value) == "Annotated" and isinstance(node.slice, ast.Tuple):
+            return self.visit(node.slice.elts[0])
+        if base_name(node.value) == "list":
+            item = self.visit(node.slice)
+            return ast.Subscript(
+                ast.Name("tuple"), ast.Tuple([item, ast.Constant(Ellipsis)]), ast.Load()
+            )
+        return self.generic_visit(node)
+
+
+def _converter(annotation: ast.expr, models: set[str], value: str, depth: int = 0) -> str | None:
+    """Return an expression converting a validated value for the view, or None to keep it.
+
+    Nested models become views and arrays become tuples. Unions of several models
+    cannot be told apart without validation, so their values are kept as-is.
+    """
+    members = _union_members(annotation)
+    if len(members) != 1:
+        return None
+    member = members[0]
+    if isinstance(member, ast.Name) and member.id in models:
+        return f"{member.id}{VIEW_SUFFIX}.from_validated_dict({value})"
+    if isinstance(member, ast.Subscript) and base_name(member.value) == "list":
+        item = f"item{depth}"
+        convert = _converter(member.slice, models, item, depth + 1)
+        if convert is None:
+            return f"tuple({value})"
+        return f"tuple(None if {item} is None else {convert} for {item} in {value})"
+    return None
+
+
+def _view_class(node: ast.ClassDef, models: set[str]) -> list[str]:
+    """Render the view class of one record model."""
+    names: list[str] = []
+    aliases: list[str] = []
+    annotations: list[str] = []
+    assignments: list[str] = []
+    rewrite = _ViewAnnotation(models)
+
+    for statement in node.body:
+        if not isinstance(statement, ast.AnnAssign) or not isinstance(statement.target, ast.Name):
+            continue
+        name = statement.target.id
+        alias = _field_alias(statement.annotation, name)
+        field_type = _unwrap(statement.annotation)
+        names.append(name)
+        aliases.append(alias)
+        annotations.append(f"    {name}: {ast.unparse(rewrite.visit(copy.deepcopy(field_type)))}")
+
+        convert = _converter(field_type, models, "value")
+        if convert is None:
+            assignments.append(f'        _set(view, "{name}", get("{alias}"))')
+        else:
+            assignments.extend(
+                [
+                    f'        value = get("{alias}")',
+                    "        if value is not None:",
+                    f"            value = {convert}",
+                    f'        _set(view, "{name}", value)',
+                ]
+            )
+
+    view_name = f"{node.name}{VIEW_SUFFIX}"
+    return [
+        "",
+        "",
+        f"class {view_name}(RecordView):",
+        f'    """Read-only view of `{node.name}`."""',
+        "",
+        f"    __slots__ = ({''.join(f'{name!r}, ' for name in names).rstrip()})",
+        f"    _aliases = ({''.join(f'{alias!r}, ' for alias in aliases).rstrip()})",
+        "",
+        *annotations,
+        *([""] if annotations else []),
+        "    @classmethod",
+        f"    def from_validated_dict(cls, data: dict[str, Any]) -> {view_name}:",
+        '        """Build a view from a record dict that has already passed validation."""',
+        "        view = _new(cls)",
+        *(["        get = data.get"] if assignments else []),
+        *assignments,
+        "        return view",
+    ]
+
+
+def generate_record_views(model_path: Path, output_path: Path) -> Path | None:
+    """Write the read-only views of the record models in a generated module.
+
+    Every class deriving from `BaseRecordModel` gets a `<Model>View` class with
+    `__slots__` for its declared fields and a `from_validated_dict` constructor that
+    assigns them straight from a validated record, without any pydantic machinery.
+    The model module is only parsed, never imported.
+
+    Args:
+        model_path: Path to a generated record model module
+        output_path: Path of the view module to write
+
+    Returns:
+        Path to the written module, or None if the module defines no record models
+    """
+    source = model_path.read_text()
+    tree = ast.parse(source)
+    record_classes = [
+        node
+        for node in tree.body
+        if isinstance(node, ast.ClassDef)
+        and any(base_name(base) == "BaseRecordModel" for base in node.bases)
+    ]
+    if not record_classes:
+        return None
+
+    base_import = next(
+        node.module
+        for node in tree.body
+        if isinstance(node, ast.ImportFrom)
+        and node.module
+        and any(alias.name == "BaseRecordModel" for alias in node.names)
+    )
+    view_module = base_import.rpartition(".")[0] + ".record_view"
+    models = {node.name for node in record_classes}
+    header = source.split("\n\n", 1)[0] if source.startswith("#") else ""
+
+    lines = [
+        *([header, ""] if header else []),
+        f'"""Read-only views of the record models in `{model_path.stem}`.',
+        "",
+        "Generated from the record models; do not edit by hand.",
+        '"""',
+        "",
+        "from __future__ import annotations",
+        "",
+        "from typing import Any",
+        "",
+        f"from {view_module} import RecordView",
+        "",
+        "_new = object.__new__",
+        "_set = object.__setattr__",
+    ]
+    for node in record_classes:
+        lines.extend(_view_class(node, models))
+
+    # Models merged into a shared class (see `apply_shared_models`) share its view.
+    model_aliases = [
+        (node.targets[0].id, node.value.id)
+        for node in tree.body
+        if isinstance(node, ast.Assign)
+        and isinstance(node.targets[0], ast.Name)
+        and isinstance(node.value, ast.Name)
+        and node.value.id in models
+    ]
+    if model_aliases:
+        lines.extend(["", ""])
+        lines.extend(
+            f"{alias}{VIEW_SUFFIX} = {target}{VIEW_SUFFIX}" for alias, target in model_aliases
+        )
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    # black ships with datamodel-code-generator and formats the generated models too.
+    code = black.format_str("\n".join([*lines, ""]), mode=black.Mode(line_length=100))
+    write_if_changed(output_path, code)
+    init_file = output_path.parent / "__init__.py"
+    if not init_file.exists():
+        init_file.write_text("")
+    logger.info(f"Generated {len(record_classes)} record views at {output_path}")
+    return output_path
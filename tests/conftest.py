@@ -0,0 +1,18 @@
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+"""Shared fixtures for the test suite."""
+
+from pathlib import Path
+
+import pytest
+
+from src.generate import cache
+from src.generate.cache import GenerationCache
+
+
+@pytest.fixture
+def cache_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the generation cache at a temporary file."""
+    path = tmp_path / cache.CACHE_FILE
+    monkeypatch.setattr(cache, "_cache", GenerationCache(path))
+    monkeypatch.delenv(cache.NO_CACHE_ENV, raising=False)
+    return path
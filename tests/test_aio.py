@@ -0,0 +1,91 @@
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+"""Tests for batched async record validation."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+from pydantic import ValidationError
+
+from airbyte_connector_models.connectors._internal import async_validate_stream
+from airbyte_connector_models.connectors._internal.base_record import BaseRecordModel
+from airbyte_connector_models.connectors.xkcd.source.records.xkcd import XkcdXkcdRecord
+
+
+async def _source(records: list[Any], pulled: list[int] | None = None) -> AsyncIterator[Any]:
+    for index, record in enumerate(records):
+        if pulled is not None:
+            pulled.append(index)
+        yield record
+
+
+async def _collect(stream: AsyncIterator[list[BaseRecordModel]]) -> list[list[BaseRecordModel]]:
+    return [batch async for batch in stream]
+
+
+def test_async_validate_stream_yields_ordered_batches() -> None:
+    """Test that dicts and raw JSON are validated into ordered batches."""
+    records = [{"num": i} if i % 2 else f'{{"num": {i}}}' for i in range(7)]
+
+    batches = asyncio.run(
+        _collect(async_validate_stream(_source(records), XkcdXkcdRecord, batch_size=3))
+    )
+
+    assert [[r.num for r in batch] for batch in batches] == [[0, 1, 2], [3, 4, 5], [6]]
+
+
+def test_async_validate_stream_applies_backpressure() -> None:
+    """Test that no more than `max_pending` batches are read ahead of the consumer."""
+    pulled: list[int] = []
+
+    async def first_batch() -> list[BaseRecordModel]:
+        stream = async_validate_stream(
+            _source([{"num": i} for i in range(100)], pulled),
+            XkcdXkcdRecord,
+            batch_size=10,
+            max_pending=2,
+        )
+        batch = await anext(stream)
+        await stream.aclose()
+        return batch
+
+    batch = asyncio.run(first_batch())
+
+    assert [r.num for r in batch] == list(range(10))
+    assert pulled == list(range(20))
+
+
+def test_async_validate_stream_propagates_validation_errors() -> None:
+    """Test that invalid records raise from the stream."""
+    stream = async_validate_stream(_source([{"num": "x"}]), XkcdXkcdRecord)
+
+    with pytest.raises(ValidationError):
+        asyncio.run(_collect(stream))
+
+
+def test_async_validate_stream_validates_dict_batches_in_one_call(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that dict batches use validate_many and errors still name the record."""
+    calls: list[int] = []
+    validate_many = XkcdXkcdRecord.validate_many.__func__  # type: ignore[attr-defined]
+
+    def counting(cls: type[BaseRecordModel], records: list[Any]) -> list[BaseRecordModel]:
+        calls.append(len(records))
+        return validate_many(cls, records)
+
+    monkeypatch.setattr(XkcdXkcdRecord, "validate_many", classmethod(counting))
+    records = [{"num": i} for i in range(5)]
+
+    batches = asyncio.run(
+        _collect(async_validate_stream(_source(records), XkcdXkcdRecord, batch_size=3))
+    )
+
+    assert calls == [3, 2]
+    assert [[r.num for r in batch] for batch in batches] == [[0, 1, 2], [3, 4]]
+
+    stream = async_validate_stream(_source([{"num": 1}, {"num": "x"}]), XkcdXkcdRecord)
+    with pytest.raises(ValidationError) as error:
+        asyncio.run(_collect(stream))
+    assert error.value.errors()[0]["loc"] == ("num",)
@@ -0,0 +1,99 @@
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+"""Tests for Arrow export of record models."""
+
+from pathlib import Path
+
+import pytest
+
+from airbyte_connector_models.connectors._internal.arrow import (
+    RecordBatchBuilder,
+    arrow_schema,
+    validate_arrow,
+    validate_parquet,
+)
+from airbyte_connector_models.connectors.airbyte.source.records.jobs import AirbyteJobsRecord
+from airbyte_connector_models.connectors.pokeapi.source.records.pokemon import (
+    PokeapiPokemonRecord,
+)
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+def test_arrow_schema_follows_model_fields() -> None:
+    """Test that required fields are non-nullable and sub-models become structs."""
+    jobs_schema = arrow_schema(AirbyteJobsRecord)
+    pokemon_schema = arrow_schema(PokeapiPokemonRecord)
+
+    assert not jobs_schema.field("jobId").nullable
+    assert jobs_schema.field("status").nullable
+    assert pa.types.is_struct(pokemon_schema.field("species").type)
+    assert pa.types.is_list(pokemon_schema.field("abilities").type)
+
+
+def test_to_arrow_matches_to_dict() -> None:
+    """Test that a record batch holds the same data as the per-row dictionaries."""
+    records = PokeapiPokemonRecord.validate_many(
+        [
+            {"id": 1, "abilities": [{"ability": {"name": "overgrow"}, "slot": 1}, None]},
+            {"id": 2, "species": {"name": "charmander"}, "custom_field": "extra"},
+            {},
+        ]
+    )
+
+    batch = PokeapiPokemonRecord.to_arrow(records, extras_column="_extra")
+    batch.validate(full=True)
+    rows = batch.to_pylist()
+
+    assert [row.pop("_extra") for row in rows] == [None, '{"custom_field":"extra"}', None]
+    assert rows == [
+        {k: v for k, v in record.to_dict().items() if k in PokeapiPokemonRecord.model_fields}
+        for record in records
+    ]
+
+
+def test_record_batch_builder_flush_resets() -> None:
+    """Test that flushing a builder returns the pending rows and clears them."""
+    builder = RecordBatchBuilder(AirbyteJobsRecord)
+    builder.append(AirbyteJobsRecord(jobId=1, lastUpdatedAt="2024-01-01"))
+
+    batch = builder.flush()
+
+    assert batch.num_rows == 1
+    assert len(builder) == 0
+    assert builder.flush().num_rows == 0
+
+
+def test_validate_arrow_reports_failing_rows_per_column() -> None:
+    """Test null, type and nested checks and that only failing rows are materialized."""
+    table = pa.table(
+        {
+            "jobId": [1.0, None, 3.0],
+            "lastUpdatedAt": ["2024-01-01", "2024-01-02", "2024-01-03"],
+            "status": ["succeeded", "failed", "running"],
+        }
+    )
+
+    result = AirbyteJobsRecord.validate_arrow(table)
+
+    assert result.error_counts() == {("jobId", "null"): 1}
+    assert result.num_invalid == 1
+    assert [index for index, _ in result.failures()] == [1]
+    assert result.valid_rows().num_rows == 2  # noqa: PLR2004
+
+    nested = pa.table({"abilities": [[{"ability": {"name": 1}}], None, []]})
+    assert validate_arrow(nested, PokeapiPokemonRecord).error_counts() == {
+        ("abilities[].ability.name", "type"): 1
+    }
+
+
+def test_validate_parquet_offsets_batches(tmp_path: Path) -> None:
+    """Test that Parquet validation streams batches with source row offsets."""
+    path = tmp_path / "jobs.parquet"
+    pq.write_table(pa.table({"jobId": [1.0, 2.0, 3.0, 4.0, 5.0]}), path)
+
+    results = list(validate_parquet(path, AirbyteJobsRecord, batch_size=2))
+
+    assert [result.offset for result in results] == [0, 2, 4]
+    assert [index for result in results for index, _ in result.failures()] == [0, 1, 2, 3, 4]
+    assert results[0].error_counts() == {("lastUpdatedAt", "missing"): 2}
@@ -1,9 +1,18 @@
 # Copyright (c) 2025 Airbyte, Inc., all rights reserved.
 """Tests for base models."""
 
-from pydantic import BaseModel
+import pickle
+
+import pytest
+from pydantic import BaseModel, ValidationError
 
 from airbyte_connector_models import BaseRecordModel
+from airbyte_connector_models.connectors.airbyte.source.records.jobs import AirbyteJobsRecord
+from airbyte_connector_models.connectors.pokeapi.source.records.pokemon import (
+    PokeapiPokemonRecord,
+    PokeapiPokemonRecordAbility,
+)
+from airbyte_connector_models.connectors.xkcd.source.records.xkcd import XkcdXkcdRecord
 
 
 def test_base_record_model_import() -> None:
@@ -14,3 +23,190 @@ def test_base_record_model_import() -> None:
 def test_base_record_model_is_pydantic_model() -> None:
     """Test that BaseRecordModel is a Pydantic model."""
     assert issubclass(BaseRecordModel, BaseModel)
+
+
+def test_validate_many_returns_instances_in_order() -> None:
+    """Test that validate_many validates a batch of records in one call."""
+    records = PokeapiPokemonRecord.validate_many(
+        [
+            {"id": 1, "name": "bulbasaur", "abilities": [{"ability": {"name": "overgrow"}}]},
+            {"id": 4, "name": "charmander", "custom_field": "extra"},
+        ]
+    )
+
+    assert [r.name for r in records] == ["bulbasaur", "charmander"]
+    assert all(isinstance(r, PokeapiPokemonRecord) for r in records)
+    assert records[0].abilities[0].ability.name == "overgrow"
+    assert records[1].custom_field == "extra"
+
+
+def test_validate_many_json_matches_from_json() -> None:
+    """Test that validate_many_json agrees with per-record from_json."""
+    payload = b'[{"num": 1, "title": "Barrel"}, {"num": 2, "safe_title": "Petit"}]'
+
+    records = XkcdXkcdRecord.validate_many_json(payload)
+
+    assert records == [
+        XkcdXkcdRecord.from_json('{"num": 1, "title": "Barrel"}'),
+        XkcdXkcdRecord.from_json('{"num": 2, "safe_title": "Petit"}'),
+    ]
+
+
+def test_validate_many_reports_record_index() -> None:
+    """Test that batch validation errors point at the failing record."""
+    with pytest.raises(ValidationError) as exc_info:
+        XkcdXkcdRecord.validate_many([{"num": 1}, {"num": "not-a-number"}])
+
+    assert exc_info.value.errors()[0]["loc"] == (1, "num")
+
+
+def test_getattr_resolves_extras_and_rejects_missing() -> None:
+    """Test extra-property attribute access and the missing-attribute error."""
+    record = XkcdXkcdRecord(num=1, custom_field="value")
+
+    assert record.custom_field == "value"
+    assert not hasattr(record, "missing_field")
+    with pytest.raises(AttributeError, match="'XkcdXkcdRecord' has no attribute 'missing_field'"):
+        _ = record.missing_field
+
+
+def test_getattr_does_not_recurse_before_init() -> None:
+    """Test that attribute misses on an uninitialized instance do not recurse."""
+    record = XkcdXkcdRecord.__new__(XkcdXkcdRecord)
+
+    assert not hasattr(record, "custom_field")
+
+
+def test_keys_items_values_are_live_views() -> None:
+    """Test that keys/items/values are lazy views over fields followed by extras."""
+    record = XkcdXkcdRecord(num=1, custom_field="value")
+    keys, items, values = record.keys(), record.items(), record.values()
+    field_count = len(XkcdXkcdRecord.model_fields)
+
+    assert list(keys)[-2:] == ["year", "custom_field"]
+    assert len(keys) == len(items) == len(values) == field_count + 1
+    assert "num" in keys
+    assert "custom_field" in keys
+    assert "missing_field" not in keys
+    assert ("num", 1) in items
+    assert ("num", 2) not in items
+    assert "value" in values
+    assert dict(items) == {
+        **dict.fromkeys(XkcdXkcdRecord.model_fields),
+        "num": 1,
+        "custom_field": "value",
+    }
+
+    record.another_field = "later"
+
+    assert len(keys) == field_count + 2
+    assert list(values)[-1] == "later"
+
+
+def test_from_trusted_builds_nested_models_without_validation() -> None:
+    """Test that from_trusted converts nested dicts and skips validation."""
+    data = {
+        "id": "not-validated",
+        "abilities": [{"ability": {"name": "overgrow"}, "slot": 1}, None],
+        "species": {"name": "bulbasaur"},
+        "custom_field": {"kept": "raw"},
+    }
+
+    record = PokeapiPokemonRecord.from_trusted(data)
+
+    assert record.id == "not-validated"
+    assert isinstance(record.abilities[0], PokeapiPokemonRecordAbility)
+    assert record.abilities[0].ability.name == "overgrow"
+    assert record.abilities[1] is None
+    assert record.species.name == "bulbasaur"
+    assert record.custom_field == {"kept": "raw"}
+    assert record.height is None
+    assert record.model_fields_set == {"id", "abilities", "species"}
+
+
+def test_from_trusted_leaves_out_missing_required_fields() -> None:
+    """Test that trusted construction of a model with required fields matches model_construct."""
+    data = {"jobId": 1.0, "status": "running", "custom_field": "raw"}
+
+    record = AirbyteJobsRecord.from_trusted(data)
+
+    assert record == AirbyteJobsRecord.model_construct(**data)
+    assert record.model_fields_set == {"jobId", "status"}
+    assert "lastUpdatedAt" not in record.__dict__
+    assert record.duration is None
+    assert record.custom_field == "raw"
+
+
+def test_from_trusted_many_matches_validated_records() -> None:
+    """Test that trusted construction of valid data matches validated construction."""
+    data = [
+        {"id": 1, "moves": [{"move": {"name": "tackle"}, "version_group_details": []}]},
+        {"id": 2, "sprites": {"front_default": "url"}, "custom_field": 1},
+    ]
+
+    assert PokeapiPokemonRecord.from_trusted_many(data) == PokeapiPokemonRecord.validate_many(data)
+
+
+def test_from_dict_lazy_defers_nested_validation() -> None:
+    """Test that nested fields are validated on first access and cached."""
+    data = {"name": "bulbasaur", "species": {"name": "seed"}, "moves": [{"move": "not-a-dict"}]}
+
+    record = PokeapiPokemonRecord.from_dict_lazy(data)
+
+    assert isinstance(record, PokeapiPokemonRecord)
+    assert record.name == "bulbasaur"
+    assert record.to_dict()["species"] == {"name": "seed"}
+    assert record.species.name == "seed"
+    assert record.species is record.species
+    assert record.to_dict()["species"] == {"name": "seed", "url": None}
+    with pytest.raises(ValidationError):
+        _ = record.moves
+
+
+def test_from_json_lazy_matches_eager_once_accessed() -> None:
+    """Test that a lazily-validated record dumps like an eager one after access."""
+    payload = '{"id": 1, "abilities": [{"ability": {"name": "overgrow"}}], "extra": 1}'
+
+    lazy = PokeapiPokemonRecord.from_json_lazy(payload)
+
+    assert lazy.abilities[0].ability.name == "overgrow"
+    assert lazy.to_json() == PokeapiPokemonRecord.from_json(payload).to_json()
+
+
+def test_lazy_records_pickle_and_compare_by_class() -> None:
+    """Test that lazy records survive a pickle round trip and differ from eager ones."""
+    data = {"id": 1, "species": {"name": "seed"}, "abilities": [{"ability": {"name": "x"}}]}
+    lazy = PokeapiPokemonRecord.from_dict_lazy(data)
+    assert lazy.species.name == "seed"
+
+    restored = pickle.loads(pickle.dumps(lazy))
+
+    assert type(restored) is type(lazy)
+    assert restored == lazy
+    assert restored.abilities[0].ability.name == "x"
+    assert restored.to_dict() == PokeapiPokemonRecord.from_dict(data).to_dict()
+    assert lazy != PokeapiPokemonRecord.from_dict(data)
+
+
+def test_validate_collect_reports_errors_by_column() -> None:
+    """Test that batch validation collects errors and returns the valid rows."""
+    rows = [{"num": 1}, {"num": "x", "year": []}, {"num": 3}, {"num": []}]
+
+    report = XkcdXkcdRecord.validate_collect(iter(rows))
+
+    assert [r.num for r in report.records] == [1, 3]
+    assert report.valid_indices == [0, 2]
+    assert report.invalid_indices == [1, 3]
+    assert report.row_index == [1, 1, 3]
+    assert report.field_path == ["num", "year", "num"]
+    assert report.counts_by_path() == {"num": 2, "year": 1}
+    assert not report.is_valid
+
+
+def test_validate_collect_clean_batch() -> None:
+    """Test that a clean batch reports no errors."""
+    report = XkcdXkcdRecord.validate_collect([{"num": 1}, {"num": 2}])
+
+    assert report.is_valid
+    assert report.num_errors == 0
+    assert len(report.records) == report.num_rows
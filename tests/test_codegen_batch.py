@@ -0,0 +1,53 @@
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+"""Tests for generating all record models of a connector in one codegen pass."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src.generate.model_generation import generate_record_models
+
+RECORDS_DIR = (
+    Path(__file__).parent.parent
+    / "airbyte_connector_models"
+    / "connectors"
+    / "airbyte"
+    / "source"
+    / "records"
+)
+
+
+pytestmark = pytest.mark.usefixtures("cache_file")
+
+
+def test_batch_generates_the_same_modules_as_one_pass_per_stream(tmp_path: Path) -> None:
+    """Test that --batch-streams output is identical to per-stream generation."""
+    schemas = {path.stem: json.loads(path.read_text()) for path in RECORDS_DIR.glob("*.json")}
+
+    generate_record_models("source-airbyte", "airbyte", schemas, tmp_path / "single")
+    generate_record_models(
+        "source-airbyte", "airbyte", schemas, tmp_path / "batch", batch_streams=True
+    )
+
+    modules = sorted(path.name for path in (tmp_path / "single").glob("*.py"))
+    assert modules == ["__init__.py", "connections.py", "jobs.py", "workspaces.py"]
+    assert sorted(path.name for path in (tmp_path / "batch").glob("*.py")) == modules
+    for module in modules:
+        single = (tmp_path / "single" / module).read_text()
+        assert (tmp_path / "batch" / module).read_text() == single
+
+
+def test_batch_only_regenerates_changed_streams(tmp_path: Path) -> None:
+    """Test that a batch skips streams whose inputs are unchanged."""
+    schemas = {path.stem: json.loads(path.read_text()) for path in RECORDS_DIR.glob("*.json")}
+    output_dir = tmp_path / "records"
+    generate_record_models("source-airbyte", "airbyte", schemas, output_dir, batch_streams=True)
+    jobs = output_dir / "jobs.py"
+    mtimes = {path.name: path.stat().st_mtime_ns for path in output_dir.glob("*.py")}
+
+    schemas["Jobs"] = {**schemas["Jobs"], "description": "Changed"}
+    generate_record_models("source-airbyte", "airbyte", schemas, output_dir, batch_streams=True)
+
+    assert "Changed" in jobs.read_text()
+    assert output_dir.joinpath("connections.py").stat().st_mtime_ns == mtimes["connections.py"]
@@ -0,0 +1,72 @@
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+"""Tests for the generator's defer-build post-processing."""
+
+import ast
+from pathlib import Path
+
+import black
+
+from src.generate.defer_build import apply_defer_build
+
+MODULE = '''from __future__ import annotations
+
+from pydantic import BaseModel
+
+
+class Record(BaseModel):
+    """A record."""
+
+    name: str | None = None
+
+
+class RecordItem(BaseModel):
+    model_config = ConfigDict(
+        extra="allow",
+    )
+    url: str | None = None
+
+
+class RecordOther(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    id: int
+
+
+class RecordDeferred(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+    id: int
+
+
+class RecordEmpty(BaseModel):
+    """Declares no fields."""
+'''
+
+
+def _config(tree: ast.Module, name: str) -> dict[str, object]:
+    node = next(n for n in tree.body if isinstance(n, ast.ClassDef) and n.name == name)
+    assign = next(
+        s
+        for s in node.body
+        if isinstance(s, ast.Assign) and getattr(s.targets[0], "id", None) == "model_config"
+    )
+    return {k.arg: ast.literal_eval(k.value) for k in assign.value.keywords}  # type: ignore[attr-defined]
+
+
+def test_apply_defer_build_sets_defer_build_on_every_model(tmp_path: Path) -> None:
+    """Test that every model config gets defer_build=True and the output stays formatted."""
+    module_path = tmp_path / "record.py"
+    module_path.write_text(MODULE)
+
+    apply_defer_build(module_path)
+
+    source = module_path.read_text()
+    tree = ast.parse(source)
+    assert "from pydantic import BaseModel, ConfigDict" in source
+    assert _config(tree, "Record") == {"defer_build": True}
+    assert _config(tree, "RecordItem") == {"defer_build": True, "extra": "allow"}
+    assert _config(tree, "RecordOther") == {"defer_build": True, "extra": "forbid"}
+    assert _config(tree, "RecordDeferred") == {"defer_build": True}
+    assert _config(tree, "RecordEmpty") == {"defer_build": True}
+    assert black.format_str(source, mode=black.Mode(line_length=100)) == source
+
+    apply_defer_build(module_path)
+    assert module_path.read_text() == source
@@ -0,0 +1,48 @@
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+"""Tests for the generator's incremental regeneration cache."""
+
+from pathlib import Path
+
+import pytest
+
+from src.generate import cache
+from src.generate.cache import GenerationCache, regenerate, save_generation_cache
+
+SCHEMA = {"type": "object", "properties": {"id": {"type": "integer"}}}
+
+
+pytestmark = pytest.mark.usefixtures("cache_file")
+
+
+def _generate(output: Path, schema: dict) -> bool:
+    """Run one cached generation step, returning whether it regenerated the file."""
+    with regenerate(output, schema) as stale:
+        if stale:
+            output.write_text(repr(schema))
+    return stale
+
+
+def test_unchanged_inputs_are_skipped_across_runs(tmp_path: Path, cache_file: Path) -> None:
+    """Test that a file is only regenerated when its inputs or content change."""
+    output = tmp_path / "model.py"
+    assert _generate(output, SCHEMA)
+    save_generation_cache()
+    assert cache_file.exists()
+
+    cache._cache = GenerationCache(cache_file)  # a new generator run
+    assert not _generate(output, SCHEMA)
+    assert _generate(output, {**SCHEMA, "title": "Changed"})
+
+    output.write_text("edited by hand")
+    assert _generate(output, {**SCHEMA, "title": "Changed"})
+
+
+def test_no_cache_environment_forces_regeneration(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that --force (via the environment) regenerates up-to-date files."""
+    output = tmp_path / "model.py"
+    _generate(output, SCHEMA)
+
+    monkeypatch.setenv(cache.NO_CACHE_ENV, "1")
+    assert _generate(output, SCHEMA)
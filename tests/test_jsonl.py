@@ -0,0 +1,38 @@
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+"""Tests for streaming JSONL record readers."""
+
+import io
+
+import pytest
+
+from airbyte_connector_models.connectors._internal import iter_jsonl
+from airbyte_connector_models.connectors.xkcd.source.records.xkcd import XkcdXkcdRecord
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1024])
+def test_iter_jsonl_yields_records_across_chunk_boundaries(chunk_size: int) -> None:
+    """Test that lines split across chunk reads are reassembled before validation."""
+    payload = b'{"num": 1, "title": "Barrel"}\n\n{"num": 2}\r\n{"num": 3, "extra": true}'
+
+    records = list(iter_jsonl(io.BytesIO(payload), model=XkcdXkcdRecord, chunk_size=chunk_size))
+
+    assert [r.num for r in records] == [1, 2, 3]
+    assert records[0].title == "Barrel"
+    assert records[2].extra is True
+
+
+def test_iter_jsonl_rejects_non_positive_chunk_size() -> None:
+    """Test that an invalid chunk size is rejected."""
+    with pytest.raises(ValueError, match="chunk_size"):
+        next(iter_jsonl(io.BytesIO(b"{}\n"), model=XkcdXkcdRecord, chunk_size=0))
+
+
+def test_iter_jsonl_reads_a_long_line_in_linear_time() -> None:
+    """Test that a line spanning many chunks is only joined once, not rescanned per chunk."""
+    title = "x" * 2_000_000
+    payload = b'{"num": 1, "title": "' + title.encode() + b'"}\n{"num": 2}'
+
+    records = list(iter_jsonl(io.BytesIO(payload), model=XkcdXkcdRecord, chunk_size=64))
+
+    assert [r.num for r in records] == [1, 2]
+    assert records[0].title == title
@@ -0,0 +1,42 @@
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+"""Tests for multi-process record validation."""
+
+from pathlib import Path
+
+import pytest
+
+from airbyte_connector_models.connectors._internal import validate_parallel
+from airbyte_connector_models.connectors._internal.parallel import RecordError
+from airbyte_connector_models.connectors.xkcd.source.records.xkcd import XkcdXkcdRecord
+
+
+def test_validate_parallel_preserves_input_order(tmp_path: Path) -> None:
+    """Test that records and errors come back in input order across shards."""
+    lines = [f'{{"num": {i}}}\n' if i % 5 else '{"num": "bad"}\n' for i in range(1, 51)]
+    path = tmp_path / "records.jsonl"
+    path.write_text("".join([*lines[:10], "\n", *lines[10:]]))
+
+    results = list(validate_parallel(path, XkcdXkcdRecord, workers=2, shard_size=3))
+
+    assert len(results) == len(lines)
+    errors = [r for r in results if isinstance(r, RecordError)]
+    assert [e.index for e in errors] == [4, 9, 15, 20, 25, 30, 35, 40, 45, 50]
+    assert errors[0].errors[0]["loc"] == ("num",)
+    assert [r.num for r in results if not isinstance(r, RecordError)][:5] == [1, 2, 3, 4, 6]
+
+
+def test_validate_parallel_errors_only() -> None:
+    """Test that only failures are yielded in errors-only mode."""
+    lines = ['{"num": 1}', '{"num": []}', '{"num": 3}']
+
+    results = list(validate_parallel(lines, XkcdXkcdRecord, workers=1, errors_only=True))
+
+    assert [r.index for r in results] == [1]
+
+
+def test_validate_parallel_rejects_invalid_arguments() -> None:
+    """Test that non-positive worker and shard counts are rejected."""
+    with pytest.raises(ValueError, match="workers"):
+        next(validate_parallel([], XkcdXkcdRecord, workers=0))
+    with pytest.raises(ValueError, match="shard_size"):
+        next(validate_parallel([], XkcdXkcdRecord, shard_size=0))
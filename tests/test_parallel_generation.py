@@ -0,0 +1,53 @@
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+"""Tests for generating several connectors with per-connector logs and a summary."""
+
+import logging
+import time
+
+import pytest
+
+from src.generate.parallel_generation import format_summary, generate_connectors
+
+CONNECTORS = ["source-slow", "source-broken", "source-warn"]
+
+logger = logging.getLogger("stub_generator")
+
+
+def stub_generate(connector: str, *, record_views: bool = False, **_options: bool) -> None:
+    """Pretend to generate a connector, logging and failing depending on its name."""
+    logger.info(f"generating {connector} (record_views={record_views})")
+    if connector == "source-slow":
+        time.sleep(0.2)  # finishes last in a pool, so results arrive out of order
+    if connector == "source-warn":
+        logger.warning(f"no schemas for {connector}")
+    if connector == "source-broken":
+        raise RuntimeError(f"manifest of {connector} is invalid\nTraceback follows")
+
+
+@pytest.mark.parametrize("jobs", [1, 3])
+def test_generate_connectors_reports_each_connector(
+    jobs: int, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test that failures, warnings and logs are kept per connector, in input order."""
+    root = logging.getLogger()
+    level, handlers = root.level, root.handlers[:]
+    results = generate_connectors(CONNECTORS, jobs=jobs, generate=stub_generate, record_views=True)
+    assert (root.level, root.handlers) == (level, handlers)
+
+    assert [result.connector for result in results] == CONNECTORS
+    assert [result.ok for result in results] == [True, False, True]
+    assert results[1].error == "RuntimeError: manifest of source-broken is invalid"
+    assert [result.issues for result in results] == [0, 1, 1]
+    for result in results:
+        assert f"generating {result.connector} (record_views=True)" in result.log
+        others = [connector for connector in CONNECTORS if connector != result.connector]
+        assert not any(f"generating {other} " in result.log for other in others)
+
+    stderr = capsys.readouterr().err
+    for result in results:
+        assert f"===== {result.connector} =====\n{result.log}" in stderr
+
+    summary = format_summary(results).splitlines()
+    assert [line.split()[0] for line in summary[1:-1]] == CONNECTORS
+    assert "FAILED" in summary[2]
+    assert summary[-1].startswith("3 connectors, 1 failed")
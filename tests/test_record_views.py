@@ -0,0 +1,78 @@
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+"""Tests for the generated read-only record views."""
+
+import pickle
+from pathlib import Path
+
+import pytest
+
+from airbyte_connector_models.connectors.pokeapi.source import views
+from airbyte_connector_models.connectors.pokeapi.source.records.pokemon import (
+    PokeapiPokemonRecord,
+)
+from airbyte_connector_models.connectors.pokeapi.source.views.pokemon import (
+    PokeapiPokemonRecordAbilityView,
+    PokeapiPokemonRecordView,
+)
+from src.generate.view_generation import generate_record_views
+
+RECORD = {
+    "id": 1,
+    "name": "bulbasaur",
+    "abilities": [{"ability": {"name": "overgrow", "url": "https://pokeapi.co/1"}}, None],
+    "types": [],
+    "custom_field": "extra",
+}
+
+
+def test_view_holds_the_same_data_as_the_model() -> None:
+    """Test that a view exposes the validated fields, with nested views and tuples."""
+    view = PokeapiPokemonRecordView.from_validated_dict(RECORD)
+
+    assert view.name == "bulbasaur"
+    assert isinstance(view.abilities[0], PokeapiPokemonRecordAbilityView)
+    assert view.abilities[0].ability.name == "overgrow"
+    assert view.abilities[1] is None
+    assert view.types == ()
+    assert not hasattr(view, "custom_field")
+    assert view.to_dict() == PokeapiPokemonRecord.model_validate(RECORD).model_dump(
+        by_alias=True, exclude={"custom_field"}
+    )
+
+
+def test_views_are_read_only_hashable_and_picklable() -> None:
+    """Test that views reject mutation and can be deduplicated and pickled."""
+    view = PokeapiPokemonRecordView.from_validated_dict(RECORD)
+
+    with pytest.raises(AttributeError):
+        view.name = "ivysaur"  # type: ignore[misc]
+    assert not hasattr(view, "__dict__")
+    assert len({view, PokeapiPokemonRecordView.from_validated_dict(RECORD)}) == 1
+    assert pickle.loads(pickle.dumps(view)) == view
+
+
+COMMITTED_VIEWS = sorted(
+    Path(views.__file__).parents[3].glob("*/*/views/[!_]*.py"),
+    key=lambda path: path.as_posix(),
+)
+
+
+def test_views_are_committed_for_every_record_module() -> None:
+    """Test that each generated record module has a committed view module."""
+    connectors = Path(views.__file__).parents[3]
+    record_modules = connectors.glob("*/*/records/[!_]*.py")
+
+    assert {path.parents[1] / path.name for path in COMMITTED_VIEWS} == {
+        path.parents[1] / path.name for path in record_modules
+    }
+
+
+@pytest.mark.parametrize("view_path", COMMITTED_VIEWS, ids=lambda path: path.parents[2].name)
+def test_committed_views_match_the_generator(tmp_path: Path, view_path: Path) -> None:
+    """Test that the views in the package are what the generator emits today."""
+    model_path = view_path.parents[1] / "records" / view_path.name
+
+    generated = generate_record_views(model_path, tmp_path / view_path.name)
+
+    assert generated is not None
+    assert generated.read_text() == view_path.read_text()
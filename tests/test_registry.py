@@ -0,0 +1,51 @@
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+"""Tests for the lazy connector model registry."""
+
+import subprocess
+import sys
+
+import pytest
+
+import airbyte_connector_models
+from airbyte_connector_models.connectors.pokeapi.source.records.pokemon import (
+    PokeapiPokemonRecord,
+)
+
+
+def test_get_models_by_connector_name() -> None:
+    """Test that config and record models are found by connector and stream name."""
+    config_model = airbyte_connector_models.get_config_model("source-pokeapi")
+
+    assert config_model.__name__ == "SourcePokeapiConfigSpec"
+    assert airbyte_connector_models.get_record_model("source-pokeapi", "pokemon") is (
+        PokeapiPokemonRecord
+    )
+    assert airbyte_connector_models.get_record_model("source-airbyte", "jobs").__name__ == (
+        "AirbyteJobsRecord"
+    )
+    assert "source-postgres" in airbyte_connector_models.list_connectors()
+    assert airbyte_connector_models.list_streams("source-pokeapi") == ["pokemon"]
+
+
+def test_unknown_models_raise() -> None:
+    """Test that unknown connectors and streams are rejected."""
+    with pytest.raises(ValueError, match="No config model"):
+        airbyte_connector_models.get_config_model("source-does-not-exist")
+    with pytest.raises(ValueError, match="No record model"):
+        airbyte_connector_models.get_record_model("source-pokeapi", "berries")
+
+
+def test_lookup_imports_only_the_requested_module() -> None:
+    """Test that a lookup does not import other generated modules."""
+    script = (
+        "import sys, airbyte_connector_models as m\n"
+        "m.get_record_model('source-xkcd', 'xkcd')\n"
+        "print(sorted(n for n in sys.modules if '.records.' in n or n.endswith('configuration')))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+
+    assert (
+        result.stdout.strip() == "['airbyte_connector_models.connectors.xkcd.source.records.xkcd']"
+    )
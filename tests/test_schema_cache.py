@@ -0,0 +1,99 @@
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+"""Tests for the on-disk core schema cache."""
+
+import importlib
+import sys
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+import pytest
+from pydantic import BaseModel
+
+from airbyte_connector_models.connectors._internal import load_schemas, save_schemas
+from airbyte_connector_models.connectors._internal.schema_cache import _module_source
+
+BASE_SOURCE = """
+from pydantic import BaseModel, ConfigDict
+
+
+class Base(BaseModel):
+    model_config = ConfigDict(defer_build=True, extra="allow")
+"""
+
+MODULE_SOURCE = """
+from cached_base import Base
+
+
+class Record(Base):
+    id: int
+    name: str | None = None
+
+
+Alias = Record
+"""
+
+
+@pytest.fixture
+def make_model(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[Callable[[], type[BaseModel]]]:
+    """Return a factory that imports a fresh, not yet built copy of a deferred model."""
+    (tmp_path / "cached_base.py").write_text(BASE_SOURCE)
+    (tmp_path / "cached_records.py").write_text(MODULE_SOURCE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    def make() -> type[BaseModel]:
+        for name in ("cached_records", "cached_base"):
+            sys.modules.pop(name, None)
+        _module_source.cache_clear()
+        return importlib.import_module("cached_records").Record
+
+    yield make
+    for name in ("cached_records", "cached_base"):
+        sys.modules.pop(name, None)
+
+
+def test_load_schemas_restores_validation_without_building(
+    tmp_path: Path, make_model: Callable[[], type[BaseModel]]
+) -> None:
+    """Test that a cached schema validates and serializes in place of a build."""
+    assert save_schemas(make_model(), cache_dir=tmp_path / "cache") == 1
+
+    model = make_model()
+    assert load_schemas(model, cache_dir=tmp_path / "cache") == 1
+    assert not model.__pydantic_complete__
+
+    record = model.model_validate({"id": "1", "extra": True})
+    assert isinstance(record, model)
+    assert record.model_dump() == {"id": 1, "name": None, "extra": True}
+    assert "id" in model.model_json_schema()["properties"]
+
+
+def test_load_schemas_ignores_missing_and_corrupt_entries(
+    tmp_path: Path, make_model: Callable[[], type[BaseModel]]
+) -> None:
+    """Test that models without a usable entry are left to build as usual."""
+    assert load_schemas(make_model(), cache_dir=tmp_path / "cache") == 0
+
+    save_schemas(make_model(), cache_dir=tmp_path / "cache")
+    for entry in (tmp_path / "cache").rglob("*.pickle"):
+        entry.write_bytes(b"not a pickle")
+    model = make_model()
+    assert load_schemas(model, cache_dir=tmp_path / "cache") == 0
+    assert not any((tmp_path / "cache").rglob("*.pickle"))
+    assert model.model_validate({"id": 2}).id == 2  # noqa: PLR2004
+
+
+def test_schemas_are_saved_once_per_class_and_keyed_on_base_classes(
+    tmp_path: Path, make_model: Callable[[], type[BaseModel]]
+) -> None:
+    """Test that aliases are not cached twice and a changed base class misses the cache."""
+    module = sys.modules[make_model().__module__]
+    assert save_schemas(module, cache_dir=tmp_path / "cache") == 1
+    assert len(list((tmp_path / "cache").rglob("*.pickle"))) == 1
+
+    base_path = tmp_path / "cached_base.py"
+    base_path.write_text(BASE_SOURCE.replace('extra="allow"', 'extra="ignore"'))
+    model = make_model()
+    assert load_schemas(model, cache_dir=tmp_path / "cache") == 0
+    assert model.model_validate({"id": 1, "extra": True}).model_extra is None
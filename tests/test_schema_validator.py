@@ -0,0 +1,64 @@
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+"""Tests for compiled stream schema validators."""
+
+import pytest
+
+from airbyte_connector_models.connectors._index import RECORD_MODELS
+from airbyte_connector_models.connectors._internal.schema_validator import (
+    compile_schema,
+    compile_validator,
+    load_record_schema,
+)
+
+
+def test_compile_schema_checks_types_required_and_nesting() -> None:
+    """Test that compiled validators enforce types, nullability and required keys."""
+    is_valid = compile_schema(
+        {
+            "type": "object",
+            "required": ["id"],
+            "properties": {
+                "id": {"type": "integer"},
+                "name": {"type": ["null", "string"]},
+                "tags": {"type": "array", "items": {"type": "string"}},
+                "score": {"type": "number"},
+            },
+        }
+    )
+
+    assert is_valid({"id": 1, "name": None, "tags": ["a"], "score": 1.5, "extra": object()})
+    assert is_valid({"id": 1, "score": 2})
+    assert not is_valid({"name": "missing id"})
+    assert not is_valid({"id": True})
+    assert not is_valid({"id": 1, "tags": ["a", 2]})
+    assert not is_valid({"id": 1, "score": "1.5"})
+    assert not is_valid([{"id": 1}])
+
+
+def test_compile_validator_uses_stored_stream_schema() -> None:
+    """Test that validators are built from the packaged schema and cached."""
+    is_valid = compile_validator("source-pokeapi", "pokemon")
+
+    assert is_valid is compile_validator("source-pokeapi", "pokemon")
+    assert is_valid({"id": 25, "name": "pikachu", "abilities": [{"ability": {"name": "static"}}]})
+    assert not is_valid({"id": "25"})
+    assert not is_valid({"abilities": [{"ability": {"name": 7}}]})
+
+
+def test_compile_validator_unknown_stream() -> None:
+    """Test that unknown connectors and streams are rejected."""
+    with pytest.raises(ValueError, match="No record schema"):
+        compile_validator("source-pokeapi", "does_not_exist")
+    with pytest.raises(ValueError, match="No record schema"):
+        compile_validator("pokeapi", "pokemon")
+
+
+def test_record_schema_is_resolved_through_the_connector_index(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that hyphenated connector names resolve like the registry, not by rewriting."""
+    module, class_name = RECORD_MODELS["source-pokeapi"]["pokemon"]
+    monkeypatch.setitem(RECORD_MODELS, "source-poke-api", {"pokemon": (module, class_name)})
+    assert load_record_schema("source-poke-api", "POKEMON") == load_record_schema(
+        "source-pokeapi", "pokemon"
+    )
@@ -0,0 +1,107 @@
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+"""Tests for merging structurally identical generated models."""
+
+import ast
+import importlib
+from pathlib import Path
+
+import pytest
+
+from airbyte_connector_models.connectors.pokeapi.source.records import pokemon
+from airbyte_connector_models.connectors.pokeapi.source.views import pokemon as pokemon_views
+from src.generate.shared_models import apply_shared_models, find_shared_models
+
+DOCSTRING = '    """Differs from the other {name, url} models by its docstring."""\n'
+MODULE = '''from __future__ import annotations
+
+from pydantic import BaseModel
+
+
+class Record(BaseModel):
+    species: RecordSpecies | None = None
+    stats: list[RecordStat] | None = None
+    moves: list[RecordMove] | None = None
+
+
+class RecordSpecies(BaseModel):
+    name: str | None = None
+    url: str | None = None
+
+
+class RecordStat(BaseModel):
+    stat: RecordStatStat | None = None
+
+
+class RecordStatStat(BaseModel):
+    name: str | None = None
+    url: str | None = None
+
+
+class RecordMove(BaseModel):
+    stat: RecordMoveStat | None = None
+
+
+class RecordMoveStat(BaseModel):
+    name: str | None = None
+    url: str | None = None
+    """Differs from the other {name, url} models by its docstring."""
+'''
+
+# With the docstring removed, RecordMove nests the same model as RecordStat.
+NESTED_SHARED = {
+    "RecordSpecies": "RecordNameUrl",
+    "RecordStat": "RecordStat",
+    "RecordStatStat": "RecordNameUrl",
+    "RecordMove": "RecordStat",
+    "RecordMoveStat": "RecordNameUrl",
+}
+
+
+def test_identical_models_and_their_parents_are_merged() -> None:
+    """Test that identical classes, including their parents, get one neutral name."""
+    assert find_shared_models(ast.parse(MODULE)) == {
+        "RecordSpecies": "RecordNameUrl",
+        "RecordStatStat": "RecordNameUrl",
+    }
+
+    nested = MODULE.replace(DOCSTRING, "")
+    assert find_shared_models(ast.parse(nested)) == NESTED_SHARED
+
+
+def test_shared_name_falls_back_to_the_shortest_member() -> None:
+    """Test that a shared name clashing with another class is not used."""
+    clashing = MODULE.replace("class RecordMoveStat(", "class RecordNameUrl(")
+    clashing = clashing.replace("RecordMoveStat |", "RecordNameUrl |")
+    assert find_shared_models(ast.parse(clashing)) == {
+        "RecordSpecies": "RecordSpecies",
+        "RecordStatStat": "RecordSpecies",
+    }
+
+
+def test_merged_module_keeps_every_name(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that merged classes stay importable as aliases of the shared class."""
+    module_path = tmp_path / "shared_record.py"
+    module_path.write_text(MODULE.replace(DOCSTRING, ""))
+
+    assert apply_shared_models(module_path) == len(NESTED_SHARED) - len({*NESTED_SHARED.values()})
+    assert apply_shared_models(module_path) == 0
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+    module = importlib.import_module("shared_record")
+    for name, shared in NESTED_SHARED.items():
+        assert getattr(module, name) is getattr(module, shared)
+        assert getattr(module, name).__name__ == shared
+    record = module.Record.model_validate({"moves": [{"stat": {"name": "hp"}}]})
+    assert isinstance(record.moves[0].stat, module.RecordStatStat)
+
+
+def test_generated_pokemon_models_share_the_resource_model() -> None:
+    """Test that PokeAPI's repeated {name, url} resources use one model and one view."""
+    shared = pokemon.PokeapiPokemonRecordNameUrl
+    assert pokemon.PokeapiPokemonRecordAbilityAbility is shared
+    assert pokemon.PokeapiPokemonRecordSpecies is shared
+    assert pokemon.PokeapiPokemonRecord.model_fields["species"].annotation == shared | None
+    assert (
+        pokemon_views.PokeapiPokemonRecordSpeciesView
+        is pokemon_views.PokeapiPokemonRecordNameUrlView
+    )
@@ -0,0 +1,70 @@
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+"""Tests for opt-in per-model validation statistics."""
+
+import io
+
+import pytest
+from pydantic import ValidationError
+
+from airbyte_connector_models.connectors._internal import (
+    collect_stats,
+    iter_jsonl,
+    stats_snapshot,
+)
+from airbyte_connector_models.connectors._internal.base_record import BaseRecordModel
+from airbyte_connector_models.connectors._internal.stats import stats_enabled
+from airbyte_connector_models.connectors.xkcd.source.records.xkcd import XkcdXkcdRecord
+
+
+def test_collect_stats_counts_validations_failures_and_extras() -> None:
+    """Test that validations, failures, bytes and extras lookups are counted per class."""
+    payload = '{"num": 1, "custom": "x"}'
+
+    with collect_stats() as stats:
+        record = XkcdXkcdRecord.from_json(payload)
+        XkcdXkcdRecord.from_dict({"num": 2})
+        with pytest.raises(ValidationError):
+            XkcdXkcdRecord.from_dict({"num": "bad"})
+        assert record.custom == "x"
+        assert getattr(record, "missing", None) is None
+
+    model_stats = stats[XkcdXkcdRecord]
+    assert model_stats.validations == 3  # noqa: PLR2004
+    assert model_stats.failures == 1
+    assert model_stats.bytes_parsed == len(payload)
+    assert model_stats.extras_hit_rate == 0.5  # noqa: PLR2004
+    assert model_stats.p99_latency >= model_stats.p50_latency > 0
+
+
+def test_collect_stats_counts_batch_rows_and_other_entry_points() -> None:
+    """Test that batch, streaming, trusted and direct construction paths are counted."""
+    rows = [{"num": 1}, {"num": 2}, {"num": "bad"}]
+
+    with collect_stats() as stats:
+        XkcdXkcdRecord.validate_many(rows[:2])
+        with pytest.raises(ValidationError):
+            XkcdXkcdRecord.validate_many(rows)
+        XkcdXkcdRecord.validate_many_json(b'[{"num": 1}, {"num": 2}]')
+        XkcdXkcdRecord.validate_collect(rows)
+        list(iter_jsonl(io.BytesIO(b'{"num": 1}\n{"num": 2}\n'), model=XkcdXkcdRecord))
+        XkcdXkcdRecord(num=1)
+        XkcdXkcdRecord.from_trusted_many(rows[:2])
+
+    model_stats = stats[XkcdXkcdRecord]
+    assert model_stats.validations == 2 + 3 + 2 + 3 + 2 + 1
+    assert model_stats.failures == 2  # noqa: PLR2004
+    assert model_stats.trusted_constructions == 2  # noqa: PLR2004
+
+
+def test_stats_are_disabled_outside_the_context_manager() -> None:
+    """Test that instrumentation is removed again after the block."""
+    with collect_stats():
+        pass
+
+    XkcdXkcdRecord.from_dict({"num": 1})
+
+    assert not stats_enabled()
+    assert "model_validate" not in BaseRecordModel.__dict__
+    assert "__init__" not in BaseRecordModel.__dict__
+    assert BaseRecordModel.validate_many.__func__.__module__ == BaseRecordModel.__module__
+    assert stats_snapshot(XkcdXkcdRecord) == {}
@@ -0,0 +1,41 @@
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+"""Tests for ahead-of-time schema building."""
+
+import importlib
+import inspect
+import shutil
+from pathlib import Path
+
+import pytest
+from pydantic import BaseModel
+from pydantic_core import SchemaValidator
+
+from airbyte_connector_models.connectors._internal import warm_up
+from airbyte_connector_models.connectors.pokeapi.source.records import pokemon
+from src.generate.defer_build import apply_defer_build
+
+
+def test_warm_up_builds_every_deferred_model_in_a_module(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that warming up a deferred module by name builds all of its models once."""
+    module_path = tmp_path / "deferred_pokemon.py"
+    shutil.copy(pokemon.__file__, module_path)
+    apply_defer_build(module_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    module = importlib.import_module("deferred_pokemon")
+
+    models = {
+        obj
+        for _, obj in inspect.getmembers(module, inspect.isclass)
+        if issubclass(obj, BaseModel) and obj.__module__ == module.__name__
+    }
+    assert models
+    assert not any(model.__pydantic_complete__ for model in models)
+    assert not any(isinstance(model.__pydantic_validator__, SchemaValidator) for model in models)
+
+    assert warm_up(module.__name__) == len(models)
+
+    assert all(model.__pydantic_complete__ for model in models)
+    assert all(isinstance(model.__pydantic_validator__, SchemaValidator) for model in models)
+    assert warm_up(module, *models) == 0